@@ -0,0 +1,31 @@
+"""add stage_timings to run_cycles
+
+Revision ID: 5f3b9d2e7a41
+Revises: c4e8a1f27b90
+Create Date: 2026-10-17 13:40:22.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5f3b9d2e7a41'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a1f27b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "run_cycles",
+        sa.Column("stage_timings", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("run_cycles", "stage_timings")
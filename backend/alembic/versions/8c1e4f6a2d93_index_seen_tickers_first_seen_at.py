@@ -0,0 +1,26 @@
+"""index seen_tickers.first_seen_at
+
+Revision ID: 8c1e4f6a2d93
+Revises: 5f3b9d2e7a41
+Create Date: 2026-10-17 15:12:48.331904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1e4f6a2d93'
+down_revision: Union[str, Sequence[str], None] = '5f3b9d2e7a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_seen_tickers_first_seen_at", "seen_tickers", ["first_seen_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_seen_tickers_first_seen_at", table_name="seen_tickers")
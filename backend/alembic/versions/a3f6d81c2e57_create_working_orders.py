@@ -0,0 +1,51 @@
+"""create working_orders
+
+Revision ID: a3f6d81c2e57
+Revises: d7a2c5e91f04
+Create Date: 2026-10-17 18:42:31.214069
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f6d81c2e57'
+down_revision: Union[str, Sequence[str], None] = 'd7a2c5e91f04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('working_orders',
+    sa.Column('id', sa.Text(), nullable=False),
+    sa.Column('opportunity_id', sa.Text(), nullable=False),
+    sa.Column('market_ticker', sa.Text(), nullable=False),
+    sa.Column('side', sa.Text(), nullable=False),
+    sa.Column('contracts', sa.Integer(), nullable=False),
+    sa.Column('client_order_id', sa.Text(), nullable=False),
+    sa.Column('order_id', sa.Text(), nullable=True),
+    sa.Column('price_cents', sa.Integer(), nullable=False),
+    sa.Column('reprices_left', sa.Integer(), nullable=False),
+    sa.Column('reprice_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('reserved_cash', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('status', sa.Text(), nullable=False),
+    sa.Column('contracts_filled', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('fill_price', sa.Numeric(precision=5, scale=4), nullable=True),
+    sa.Column('total_cost', sa.Numeric(precision=12, scale=2), server_default=sa.text('0'), nullable=False),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('client_order_id')
+    )
+    op.create_index('ix_working_orders_status', 'working_orders', ['status'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_working_orders_status', table_name='working_orders')
+    op.drop_table('working_orders')
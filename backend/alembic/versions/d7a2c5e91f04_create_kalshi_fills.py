@@ -0,0 +1,40 @@
+"""create kalshi_fills
+
+Revision ID: d7a2c5e91f04
+Revises: 8c1e4f6a2d93
+Create Date: 2026-10-17 16:05:12.907431
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a2c5e91f04'
+down_revision: Union[str, Sequence[str], None] = '8c1e4f6a2d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('kalshi_fills',
+    sa.Column('fill_id', sa.Text(), nullable=False),
+    sa.Column('order_id', sa.Text(), nullable=True),
+    sa.Column('market_ticker', sa.Text(), nullable=False),
+    sa.Column('side', sa.Text(), nullable=False),
+    sa.Column('action', sa.Text(), nullable=True),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('price', sa.Numeric(precision=5, scale=4), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('fill_id')
+    )
+    op.create_index('ix_kalshi_fills_created_at', 'kalshi_fills', ['created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_kalshi_fills_created_at', table_name='kalshi_fills')
+    op.drop_table('kalshi_fills')
@@ -0,0 +1,28 @@
+"""add order_id to decisions
+
+Revision ID: f2c6a9d41b7e
+Revises: e91b4c07d2a8
+Create Date: 2026-10-18 10:12:47.402915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c6a9d41b7e'
+down_revision: Union[str, Sequence[str], None] = 'e91b4c07d2a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('decisions', sa.Column('order_id', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('decisions', 'order_id')
@@ -20,10 +20,9 @@ from coliseum.agents.guardian import run_guardian
 from coliseum.agents.scout import run_scout
 from coliseum.agents.trader import run_trader
 from coliseum.config import get_settings
-from coliseum.daemon import GUARDIAN_COOLDOWN_SECONDS
 from coliseum.observability import initialize_logfire
 from coliseum.pipeline import run_pipeline
-from coliseum.services.supabase.repositories.portfolio import load_state_from_db
+from coliseum.services.supabase.repositories.portfolio import load_portfolio_summary
 
 # Configure logging
 logging.basicConfig(
@@ -93,10 +92,14 @@ guardian:
 
 execution:
   max_slippage_pct: 0.05
-  order_check_interval_seconds: 120
+  reprice_interval_seconds: 120
+  status_poll_min_seconds: 1
+  status_poll_max_seconds: 10
   max_reprice_attempts: 3
   reprice_aggression: 0.02
   min_fill_pct_to_keep: 0.25
+  orderbook_depth: 20
+  max_child_contracts: 0
   max_order_age_minutes: 60
 
 daemon:
@@ -128,6 +131,16 @@ def cmd_config(args: argparse.Namespace) -> int:
 
         print("\n=== Coliseum Configuration ===\n")
 
+        print("LLM:")
+        print(f"  Provider: {settings.llm.provider}")
+        if settings.llm.response_cache_enabled:
+            ttls = ", ".join(
+                f"{agent}={ttl}s" for agent, ttl in settings.llm.response_cache_ttl_seconds.items()
+            )
+            print(f"  Response Cache: {ttls or 'no agents'}\n")
+        else:
+            print("  Response Cache: off\n")
+
         print("Trading:")
         print(f"  Paper Mode: {settings.trading.paper_mode}\n")
 
@@ -148,13 +161,21 @@ def cmd_config(args: argparse.Namespace) -> int:
 
         print("Execution:")
         print(f"  Max Slippage: {settings.execution.max_slippage_pct:.0%}")
-        print(f"  Order Check Interval: {settings.execution.order_check_interval_seconds}s")
+        print(f"  Reprice Interval: {settings.execution.reprice_interval_seconds:g}s")
+        print(
+            f"  Status Poll: {settings.execution.status_poll_min_seconds:g}"
+            f"-{settings.execution.status_poll_max_seconds:g}s"
+        )
         print(f"  Max Reprice Attempts: {settings.execution.max_reprice_attempts}")
         print(f"  Max Order Age: {settings.execution.max_order_age_minutes} min\n")
 
         print("Daemon:")
         print(f"  Heartbeat Interval: {settings.daemon.heartbeat_interval_minutes}m")
-        print(f"  Guardian: continuous (cooldown={GUARDIAN_COOLDOWN_SECONDS}s)")
+        guardian = settings.guardian
+        print(
+            f"  Guardian: adaptive (fast={guardian.poll_fast_seconds:g}s, "
+            f"normal={guardian.poll_normal_seconds:g}s, max={guardian.poll_max_seconds:g}s)"
+        )
         print(f"  Max Consecutive Failures: {settings.daemon.max_consecutive_failures}\n")
 
         print("API Keys:")
@@ -189,7 +210,7 @@ def cmd_config(args: argparse.Namespace) -> int:
 @_cli_command("Status")
 def cmd_status(args: argparse.Namespace) -> int:
     """Display current portfolio status."""
-    state = asyncio.run(load_state_from_db())
+    state = asyncio.run(load_portfolio_summary())
 
     print("\n=== Coliseum Portfolio Status ===\n")
 
@@ -380,7 +401,10 @@ def cmd_daemon(args: argparse.Namespace) -> int:
         daemon_mode = "LIVE TRADING"
     print(f"Mode: {daemon_mode}")
     print(f"Heartbeat Interval: {settings.daemon.heartbeat_interval_minutes}m")
-    print(f"Guardian: continuous (cooldown={GUARDIAN_COOLDOWN_SECONDS}s)")
+    print(
+        f"Guardian: adaptive ({settings.guardian.poll_fast_seconds:g}-"
+        f"{settings.guardian.poll_max_seconds:g}s)"
+    )
     print(f"Max Consecutive Failures: {settings.daemon.max_consecutive_failures}")
     print(f"Dashboard: http://{args.host}:{args.port}")
     print("\nStarting daemon + dashboard... (Ctrl+C to stop)\n")
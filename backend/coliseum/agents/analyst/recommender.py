@@ -14,6 +14,7 @@ from coliseum.agents.analyst.shared import (
     format_opportunity_header,
     load_opportunity,
 )
+from coliseum.agents.response_cache import run_cached
 from coliseum.config import Settings
 from coliseum.llm_providers import GrokModel
 from coliseum.memory.context import build_analyst_context
@@ -64,9 +65,7 @@ async def run_recommender(
     )
     prompt = await _build_decision_prompt(opportunity, markdown_body)
 
-    agent = get_agent()
-    result = await agent.run(prompt, deps=deps)
-    output = result.output
+    output = await run_cached(get_agent(), prompt, name="recommender", deps=deps, settings=settings)
 
     duration = time.time() - start_time
     completed_at = datetime.now(timezone.utc)
@@ -9,6 +9,7 @@ from pydantic_ai import Agent, RunContext
 
 from coliseum.agents.agent_factory import AgentFactory, create_agent
 from coliseum.agents.markets_context import get_market_type_context
+from coliseum.agents.response_cache import run_cached
 from coliseum.agents.analyst.models import AnalystDependencies, ResearcherOutput
 from coliseum.agents.analyst.prompts import RESEARCHER_PROMPT
 from coliseum.agents.analyst.shared import (
@@ -66,9 +67,7 @@ async def run_researcher(
     )
     prompt = await _build_research_prompt(opportunity, settings)
 
-    agent = get_agent()
-    result = await agent.run(prompt, deps=deps)
-    output = result.output
+    output = await run_cached(get_agent(), prompt, name="researcher", deps=deps, settings=settings)
     output = ResearcherOutput(synthesis=strip_cite_tokens(output.synthesis))
 
     duration = time.time() - start_time
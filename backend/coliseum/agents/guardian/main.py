@@ -7,24 +7,34 @@ from datetime import datetime, timezone
 
 import logfire
 
+from coliseum.agents.trader.portfolio_lock import get_portfolio_lock
 from coliseum.config import Settings, get_settings
 from coliseum.services.kalshi import KalshiClient
 from coliseum.services.telegram import TelegramClient
 from coliseum.services.kalshi.config import KalshiConfig
+from coliseum.services.kalshi.stream import get_market_stream
 from coliseum.domain.trade import TradeClose, generate_close_id
-from coliseum.services.supabase.repositories.opportunities import get_entry_rationale_from_db
-from coliseum.services.supabase.repositories.portfolio import load_state_from_db, save_closed_position_to_db, sync_portfolio_to_db
+from coliseum.services.supabase.db import unit_of_work
+from coliseum.services.supabase.repositories.opportunities import (
+    get_entry_rationale_from_db,
+    opportunity_cycle_cache,
+)
+from coliseum.services.supabase.repositories.portfolio import (
+    get_closed_position_index,
+    load_portfolio_summary,
+    save_closed_position_to_db,
+    sync_portfolio_to_db,
+)
 from coliseum.services.supabase.repositories.portfolio_snapshots import (
     get_realized_pnl_from_db,
     save_portfolio_snapshot_to_db,
 )
 from coliseum.services.supabase.repositories.trades import save_trade_close_to_db
 from coliseum.domain.portfolio import ClosedPosition, PortfolioState, Position
+from coliseum.services.kalshi.fills import FillsLedger, get_fills_ledger
+from coliseum.services.kalshi.snapshot import MarketSnapshot
 from coliseum.services.kalshi.sync import (
-    extract_fill_count,
-    extract_fill_price,
     fetch_market_side_price,
-    normalize_kalshi_side,
     resolve_market_price,
     sync_portfolio_from_kalshi,
 )
@@ -35,56 +45,14 @@ from .scribe import run_scribe
 logger = logging.getLogger(__name__)
 
 
-def _get_sell_fill_prices(
-    fills: list[dict[str, object]],
-    market_ticker: str,
-    side: str,
-) -> list[tuple[float, int]]:
-    """Extract sell fill prices for a specific market and side."""
-    prices: list[tuple[float, int]] = []
-    for fill in fills:
-        ticker = fill.get("ticker") or fill.get("market_ticker")
-        if ticker != market_ticker:
-            continue
-        if fill.get("side"):
-            raw_side = str(fill.get("side"))
-        else:
-            raw_side = None
-        fill_side = normalize_kalshi_side(raw_side)
-        if fill_side != side:
-            continue
-        action = fill.get("action")
-        if action and str(action).lower() not in {"sell", "s"}:
-            continue
-        count = extract_fill_count(fill)
-        if not count:
-            continue
-        price = extract_fill_price(fill, side)
-        if price is None:
-            continue
-        prices.append((price, count))
-    return prices
-
-
-def _weighted_average(prices: list[tuple[float, int]]) -> float | None:
-    """Compute weighted average price from (price, count) pairs."""
-    if not prices:
-        return None
-    total_cost = sum(price * count for price, count in prices)
-    total_count = sum(count for _, count in prices)
-    if total_count <= 0:
-        return None
-    return total_cost / total_count
-
-
 async def _fetch_market_price(
-    client: KalshiClient,
+    markets: MarketSnapshot,
     market_ticker: str,
     side: str,
 ) -> float | None:
     """Fetch current market price as a fallback for exit price."""
     try:
-        return await fetch_market_side_price(client, market_ticker, side)
+        return await fetch_market_side_price(markets.client, market_ticker, side, snapshot=markets)
     except Exception as exc:
         logger.warning("Guardian failed to fetch market for %s: %s", market_ticker, exc)
         return None
@@ -92,19 +60,18 @@ async def _fetch_market_price(
 
 async def _compute_exit_outcome(
     pos: Position,
-    fills: list[dict[str, object]],
-    client: KalshiClient,
+    ledger: FillsLedger,
+    markets: MarketSnapshot,
 ) -> tuple[float, float]:
     """Return (exit_price, pnl) for a position that closed."""
     side = pos.side
     contracts = pos.contracts
     entry_price = pos.average_entry
 
-    exit_prices = _get_sell_fill_prices(fills, pos.market_ticker, side)
-    exit_price = _weighted_average(exit_prices)
+    exit_price = ledger.average_exit(pos.market_ticker, side)
 
     if exit_price is None:
-        exit_price = await _fetch_market_price(client, pos.market_ticker, side)
+        exit_price = await _fetch_market_price(markets, pos.market_ticker, side)
         if exit_price is None:
             exit_price = entry_price
             logger.warning("Guardian using entry price as estimate for %s", pos.market_ticker)
@@ -170,6 +137,24 @@ def _evaluate_stop_triggers(
     return None, None
 
 
+async def apply_streamed_prices(state: PortfolioState) -> PortfolioState:
+    """Overlay live stream bids onto synced positions so stop-loss checks see the freshest book."""
+    stream = get_market_stream()
+    if stream is None or not stream.connected or not state.open_positions:
+        return state
+
+    await stream.subscribe(pos.market_ticker for pos in state.open_positions)
+    refreshed: list[Position] = []
+    for pos in state.open_positions:
+        quote = await stream.latest(pos.market_ticker)
+        if quote is not None:
+            bid_cents = quote.yes_bid if pos.side == "YES" else quote.no_bid
+            if bid_cents > 0:
+                pos = pos.model_copy(update={"current_price": bid_cents / 100})
+        refreshed.append(pos)
+    return state.model_copy(update={"open_positions": refreshed})
+
+
 async def execute_stop_loss_exits(
     state: PortfolioState,
     client: KalshiClient,
@@ -293,15 +278,32 @@ async def execute_stop_loss_exits(
 async def reconcile_closed_positions(
     old_open: list[Position],
     new_state: PortfolioState,
-    fills: list[dict[str, object]],
-    client: KalshiClient,
+    ledger: FillsLedger,
+    markets: MarketSnapshot,
 ) -> tuple[PortfolioState, ReconciliationStats, list[ClosedPosition]]:
-    """Detect positions that closed since last sync and move them to closed_positions."""
+    """Detect positions that closed since last sync and record their closures.
+
+    The returned state's ``closed_positions`` holds only this run's closures;
+    the full closed set lives in the DB (see ``get_closed_position_index``).
+    """
     new_open_keys = {(pos.market_ticker, pos.side) for pos in new_state.open_positions}
-    already_closed_keys = {(pos.market_ticker, pos.side) for pos in new_state.closed_positions}
+    already_closed_keys = set(await get_closed_position_index().keys())
     stats = ReconciliationStats()
     newly_closed: list[ClosedPosition] = []
 
+    # Fetch every market we may need to inspect in one batch up front.
+    candidate_tickers = [
+        pos.market_ticker
+        for pos in old_open
+        if (pos.market_ticker, pos.side) not in new_open_keys
+        and (pos.market_ticker, pos.side) not in already_closed_keys
+    ]
+    if candidate_tickers:
+        try:
+            await markets.get_many(candidate_tickers)
+        except Exception as exc:
+            logger.warning("Guardian could not batch-fetch %d markets: %s", len(candidate_tickers), exc)
+
     pending_keeps: list[Position] = []
 
     for pos in old_open:
@@ -319,7 +321,7 @@ async def reconcile_closed_positions(
             continue
 
         try:
-            market = await client.get_market(pos.market_ticker)
+            market = await markets.get(pos.market_ticker)
             if market.status == "closed":
                 fresh_price = resolve_market_price(market, pos.side) or pos.current_price
                 pending_keeps.append(Position(
@@ -348,7 +350,7 @@ async def reconcile_closed_positions(
             continue
 
         closed_at = datetime.now(timezone.utc)
-        exit_price, pnl = await _compute_exit_outcome(pos, fills, client)
+        exit_price, pnl = await _compute_exit_outcome(pos, ledger, markets)
         entry_rationale = await _extract_entry_rationale(pos.opportunity_id)
 
         closed_pos = ClosedPosition(
@@ -392,9 +394,10 @@ async def reconcile_closed_positions(
         )
 
     updated_state = PortfolioState(
+        last_updated=new_state.last_updated,
         portfolio=new_state.portfolio,
         open_positions=new_state.open_positions + pending_keeps,
-        closed_positions=new_state.closed_positions + newly_closed,
+        closed_positions=newly_closed,
         seen_tickers=new_state.seen_tickers,
     )
     sync_open_positions = len(updated_state.open_positions)
@@ -419,6 +422,10 @@ async def reconcile_closed_positions(
         )
         return updated_state, stats, newly_closed
 
+    # The stored cash now excludes collateral of orders resting before the sync.
+    if updated_state.last_updated is not None:
+        get_portfolio_lock().balance_synced(updated_state.last_updated)
+
     realized_pnl = await get_realized_pnl_from_db()
     snapshot_cycle_at = datetime.now(timezone.utc).isoformat()
     try:
@@ -464,18 +471,20 @@ async def run_guardian(settings: Settings | None = None) -> GuardianResult:
     kalshi_config = KalshiConfig()
     private_key_pem = settings.get_rsa_private_key()
 
-    with logfire.span("guardian reconciliation"):
+    with logfire.span("guardian reconciliation"), opportunity_cycle_cache():
         async with KalshiClient(
             config=kalshi_config,
             api_key=settings.kalshi_api_key,
             private_key_pem=private_key_pem,
         ) as client:
             # Step 1: snapshot pre-sync positions
-            pre_sync_state = await load_state_from_db()
+            pre_sync_state = await load_portfolio_summary()
+            # Market data for this loop, shared by sync and reconciliation.
+            markets = MarketSnapshot(client)
 
             # Step 2: sync portfolio from Kalshi
             with logfire.span("sync portfolio from Kalshi"):
-                state = await sync_portfolio_from_kalshi(client)
+                state = await sync_portfolio_from_kalshi(client, snapshot=markets)
                 logfire.info(
                     "Portfolio synced",
                     cash=round(state.portfolio.cash_balance, 2),
@@ -486,38 +495,44 @@ async def run_guardian(settings: Settings | None = None) -> GuardianResult:
 
             # Step 3: execute stop-loss exits on positions below threshold
             with logfire.span("stop loss check"):
+                state = await apply_streamed_prices(state)
                 stop_loss_tickers = await execute_stop_loss_exits(state, client, settings)
                 if stop_loss_tickers:
                     logfire.info("Stop-loss exits placed", tickers=stop_loss_tickers)
 
-            # Step 4: fetch recent fills for exit price calculation
-            with logfire.span("fetch fills"):
-                fills = await client.get_fills(limit=500)
-                logfire.info("Fills fetched", count=len(fills))
+            # Step 4: pull fills placed since the sync (e.g. stop-loss sells) into the ledger
+            with logfire.span("sync fills ledger"):
+                ledger = get_fills_ledger()
+                new_fills = await ledger.sync(client)
+                logfire.info("Fills ledger synced", new_fills=new_fills)
 
             # Re-sync after stop-loss sells so reconciliation sees the position as gone
             if stop_loss_tickers:
                 with logfire.span("re-sync after stop loss"):
-                    state = await sync_portfolio_from_kalshi(client)
+                    markets.invalidate(stop_loss_tickers)
+                    state = await sync_portfolio_from_kalshi(client, snapshot=markets)
                     logfire.info(
                         "Re-synced after stop-loss",
                         open_positions=len(state.open_positions),
                     )
 
             # Step 5: reconcile closed positions
+            # One connection for the closure writes, sync and snapshot.
             with logfire.span("reconcile closed positions", inspected=len(pre_sync_state.open_positions)):
-                updated_state, stats, newly_closed = await reconcile_closed_positions(
-                    old_open=pre_sync_state.open_positions,
-                    new_state=state,
-                    fills=fills,
-                    client=client,
-                )
+                async with unit_of_work():
+                    updated_state, stats, newly_closed = await reconcile_closed_positions(
+                        old_open=pre_sync_state.open_positions,
+                        new_state=state,
+                        ledger=ledger,
+                        markets=markets,
+                    )
                 logfire.info(
                     "Reconciliation complete",
                     inspected=stats.entries_inspected,
                     kept_open=stats.kept_open,
                     newly_closed=stats.newly_closed,
                     duplicate_close_skipped=stats.duplicate_close_skipped,
+                    market_batches=markets.batch_requests,
                 )
 
             # Step 6: find positions not opened by our pipeline
@@ -543,6 +558,7 @@ async def run_guardian(settings: Settings | None = None) -> GuardianResult:
 
     return GuardianResult(
         positions_synced=len(updated_state.open_positions),
+        open_positions=updated_state.open_positions,
         reconciliation=ReconciliationStats(
             entries_inspected=stats.entries_inspected,
             kept_open=stats.kept_open,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
+from coliseum.domain.portfolio import Position
 from coliseum.memory.enums import LearningAddition, LearningCategory
 
 
@@ -22,6 +23,7 @@ class GuardianResult(BaseModel):
     """Result of a Guardian run."""
 
     positions_synced: int = 0
+    open_positions: list[Position] = Field(default_factory=list)
     reconciliation: ReconciliationStats = Field(default_factory=ReconciliationStats)
     stop_loss_tickers: list[str] = Field(default_factory=list)
     warnings: list[str] = Field(default_factory=list)
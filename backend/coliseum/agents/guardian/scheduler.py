@@ -0,0 +1,130 @@
+"""Adaptive scheduling for the daemon's Guardian loop.
+
+A Guardian run costs several Kalshi and Postgres round trips, so the loop
+shouldn't run at a fixed rate. After each run the scheduler picks the next
+delay from the open book:
+
+- fast (``poll_fast_seconds``) while any position is within
+  ``fast_poll_price_margin`` of the floor, or within ``window_minutes +
+  fast_poll_lead_minutes`` of close (the window threshold only applies
+  inside the window, so nearness in time covers it);
+- otherwise ``poll_normal_seconds``, doubling for every consecutive run in
+  which the book didn't change, up to ``poll_max_seconds``;
+- ``poll_max_seconds`` when there are no open positions.
+
+The Trader calls ``wake()`` after a fill so the new position is picked up
+immediately instead of at the next tick.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+from coliseum.config import GuardianConfig, get_settings
+from coliseum.domain.portfolio import Position
+
+logger = logging.getLogger(__name__)
+
+
+class GuardianScheduler:
+    """Chooses the Guardian loop's next delay and lets other tasks cut it short."""
+
+    def __init__(self, config: GuardianConfig):
+        self.config = config
+        self._wake: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake_reason: str | None = None
+        self._last_fingerprint: tuple | None = None
+        self._flat_runs = 0
+
+    def _bind_loop(self) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        if self._wake is None or self._loop is not loop:
+            self._loop = loop
+            self._wake = asyncio.Event()
+        return self._wake
+
+    def is_hot(self, pos: Position, now: datetime) -> bool:
+        """True when a position is close to a stop trigger."""
+        cfg = self.config
+        if 0.0 < pos.current_price <= cfg.floor_price + cfg.fast_poll_price_margin:
+            return True
+        if pos.close_time is None or pos.close_time <= now:
+            return False
+        minutes_to_close = (pos.close_time - now).total_seconds() / 60.0
+        if minutes_to_close <= cfg.window_minutes + cfg.fast_poll_lead_minutes:
+            return True
+        return False
+
+    def next_delay(self, open_positions: Sequence[Position], now: datetime | None = None) -> float:
+        """Seconds until the next Guardian run, given the book it just saw."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        cfg = self.config
+
+        fingerprint = tuple(sorted(
+            (pos.market_ticker, pos.side, pos.contracts, round(pos.current_price, 2))
+            for pos in open_positions
+        ))
+        if fingerprint == self._last_fingerprint:
+            self._flat_runs += 1
+        else:
+            self._flat_runs = 0
+        self._last_fingerprint = fingerprint
+
+        if not open_positions:
+            return cfg.poll_max_seconds
+        if any(self.is_hot(pos, now) for pos in open_positions):
+            return cfg.poll_fast_seconds
+        return min(cfg.poll_max_seconds, cfg.poll_normal_seconds * (2 ** self._flat_runs))
+
+    def wake(self, reason: str) -> None:
+        """Run the Guardian as soon as possible (no-op outside the running loop)."""
+        self._wake_reason = reason
+        # The book is about to change; don't stay backed off after this run.
+        self._flat_runs = 0
+        self._last_fingerprint = None
+        if self._wake is not None:
+            self._wake.set()
+
+    async def wait(self, seconds: float, shutdown_event: asyncio.Event) -> str:
+        """Sleep until the delay passes, wake() is called or shutdown; returns which."""
+        wake = self._bind_loop()
+        if wake.is_set():
+            wake.clear()
+            return self._consume_reason()
+
+        waiters = [
+            asyncio.ensure_future(wake.wait()),
+            asyncio.ensure_future(shutdown_event.wait()),
+        ]
+        try:
+            done, _ = await asyncio.wait(waiters, timeout=seconds, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        if shutdown_event.is_set():
+            return "shutdown"
+        if wake.is_set():
+            wake.clear()
+            return self._consume_reason()
+        return "timer"
+
+    def _consume_reason(self) -> str:
+        reason = self._wake_reason or "wake"
+        self._wake_reason = None
+        return reason
+
+
+_scheduler: GuardianScheduler | None = None
+
+
+def get_guardian_scheduler() -> GuardianScheduler:
+    """Return the process-wide Guardian scheduler, configured from GuardianConfig."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = GuardianScheduler(get_settings().guardian)
+    return _scheduler
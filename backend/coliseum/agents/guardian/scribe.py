@@ -12,6 +12,7 @@ from coliseum.llm_providers import GrokModel
 from coliseum.agents.agent_factory import AgentFactory, create_agent
 from coliseum.agents.guardian.models import LearningReflectionOutput
 from coliseum.agents.guardian.prompts import SCRIBE_PROMPT
+from coliseum.agents.response_cache import run_cached
 from coliseum.services.supabase.repositories.learnings import (
     apply_scribe_operations,
     load_learnings_from_db,
@@ -121,9 +122,7 @@ async def run_scribe(newly_closed: list[ClosedPosition]) -> str:
     prompt = _build_prompt(newly_closed, opportunity_bodies, current_learnings)
 
     with logfire.span("scribe reflection", trades=len(newly_closed)):
-        agent = get_agent()
-        result = await agent.run(prompt)
-        output = result.output
+        output = await run_cached(get_agent(), prompt, name="scribe")
 
     try:
         await apply_scribe_operations(output.deletions, output.additions)
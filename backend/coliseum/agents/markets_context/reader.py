@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-from coliseum.agents.markets_context.seed_data import ALIASES, MARKET_TYPES
+from coliseum.agents import ticker_rules
 from coliseum.domain.opportunity import OpportunitySignal
 from coliseum.services.supabase.models import MarketCategoryContext
 from coliseum.services.supabase.repositories.market_context import load_category_context
@@ -22,22 +22,7 @@ _UNKNOWN_CONTEXT = (
 
 def _match_category_key(event_ticker: str) -> str | None:
     """Map an uppercased event ticker to its category key. Returns None if no match."""
-    event = event_ticker.upper()
-    for key in MARKET_TYPES:
-        if key in event:
-            return key
-    for alias, canonical in ALIASES.items():
-        if alias in event:
-            return canonical
-    if "MENTION" in event and "BERNIE" in event:
-        return "BERNIEMENTION"
-    if "OUT" in event and any(x in event for x in ("LEADER", "PRES")):
-        return "KHAMENEI"
-    if "MLB" in event and "GAME" in event:
-        return "MLBSTGAME"
-    if "HOCKEY" in event and "OLYMPIC" in event:
-        return "WOHOCKEY"
-    return None
+    return ticker_rules.get_ticker_rules().category_key(event_ticker)
 
 
 def _slug_from_ticker(market_ticker: str) -> str:
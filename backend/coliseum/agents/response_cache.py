@@ -0,0 +1,125 @@
+"""Content-addressed cache for agent outputs.
+
+``run_cached`` fingerprints everything that determines an agent's answer:
+model, resolved system prompt, tool and output schemas, and the user
+prompt. When the same fingerprint was answered within the agent's TTL
+(``llm.response_cache_ttl_seconds``), the stored output is returned without
+calling the model, so ``_retry_transient`` retries and manual CLI reruns of
+an opportunity are instant and free.
+
+Only the final structured output is cached. The tool-call transcript is
+produced by the run rather than sent into it, so it can't key a lookup, and
+callers only read ``result.output``. Cache reads and writes never fail a
+run: on a DB error the agent simply runs uncached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, TypeVar
+
+import logfire
+from pydantic import TypeAdapter, ValidationError
+from pydantic_ai import Agent
+
+from coliseum.config import Settings, get_settings
+from coliseum.services.supabase.repositories.llm_responses import (
+    load_llm_response_from_db,
+    save_llm_response_to_db,
+)
+
+logger = logging.getLogger(__name__)
+
+DepsT = TypeVar("DepsT")
+OutputT = TypeVar("OutputT")
+
+
+def _model_name(agent: Agent[Any, Any]) -> str:
+    model = agent.model
+    if model is None or isinstance(model, str):
+        return str(model)
+    return f"{model.system}:{model.model_name}"
+
+
+async def response_fingerprint(agent: Agent[DepsT, Any], prompt: str, deps: DepsT = None) -> str:
+    """SHA-256 over the model, system prompt, tool/output schemas and ``prompt``."""
+    system_parts = await agent.system_prompt_parts(deps=deps, prompt=prompt)
+    tools = []
+    for toolset in agent.toolsets:
+        for tool in getattr(toolset, "tools", {}).values():
+            tools.append({
+                "name": tool.tool_def.name,
+                "description": tool.tool_def.description,
+                "parameters": tool.tool_def.parameters_json_schema,
+            })
+    payload = {
+        "model": _model_name(agent),
+        "system": [part.content for part in system_parts],
+        "tools": sorted(tools, key=lambda t: t["name"]),
+        "output": agent.output_json_schema(),
+        "prompt": prompt,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+async def run_cached(
+    agent: Agent[DepsT, OutputT],
+    prompt: str,
+    *,
+    name: str,
+    deps: DepsT = None,
+    settings: Settings | None = None,
+) -> OutputT:
+    """Run ``agent`` on ``prompt``, reusing a cached output for identical inputs.
+
+    ``name`` selects the TTL; agents without one always call the model.
+    """
+    if settings is None:
+        settings = get_settings()
+    ttl_seconds = settings.llm.response_cache_ttl_seconds.get(name, 0)
+    if not settings.llm.response_cache_enabled or ttl_seconds <= 0:
+        result = await agent.run(prompt, deps=deps)
+        return result.output
+
+    key = await response_fingerprint(agent, prompt, deps)
+    adapter: TypeAdapter[OutputT] = TypeAdapter(agent.output_type)
+
+    with logfire.span("llm response cache", agent=name, key=key[:16]) as span:
+        now = datetime.now(timezone.utc)
+        cached = None
+        try:
+            cached = await load_llm_response_from_db(key, now)
+        except Exception as e:
+            logger.warning("LLM cache read failed for %s: %s", name, e)
+
+        if cached is not None:
+            try:
+                output = adapter.validate_python(cached)
+            except ValidationError as e:
+                logger.warning("Discarding stale %s cache entry %s: %s", name, key[:16], e)
+            else:
+                span.set_attribute("cache_hit", True)
+                logfire.info("LLM cache hit", agent=name)
+                return output
+
+        span.set_attribute("cache_hit", False)
+        result = await agent.run(prompt, deps=deps)
+        output = result.output
+
+        saved_at = datetime.now(timezone.utc)
+        try:
+            await save_llm_response_to_db(
+                key=key,
+                agent=name,
+                model=_model_name(agent),
+                output=adapter.dump_python(output, mode="json"),
+                created_at=saved_at,
+                expires_at=saved_at + timedelta(seconds=ttl_seconds),
+            )
+        except Exception as e:
+            logger.warning("LLM cache write failed for %s: %s", name, e)
+        return output
@@ -1,4 +1,13 @@
-"""Historical safety rules for Scout market prefiltering."""
+"""Historical safety rules for Scout market prefiltering.
+
+These constants are the default rule set; ``coliseum.agents.ticker_rules``
+compiles them (plus any ``scout_filters`` overrides in config.yaml) into the
+engine that actually classifies tickers.
+"""
+
+from collections.abc import Sequence
+
+from coliseum.agents import ticker_rules
 
 SAFE_CATEGORIES: set[str] = set()
 
@@ -30,19 +39,23 @@ PRICE_GATED_EVENT_PREFIXES: dict[str, int] = {
 }
 
 
-def _event_prefix(event_ticker: str) -> str:
-    """Return the event prefix before the first dash, if present."""
-    return event_ticker.partition("-")[0]
-
-
 def passes_filter(category: str, event_ticker: str, entry_price_cents: int) -> bool:
     """Return True only for historically safe market buckets."""
-    if category in SAFE_CATEGORIES:
-        return True
-
-    prefix = _event_prefix(event_ticker)
-    if prefix in SAFE_EVENT_PREFIXES:
+    rules = ticker_rules.get_ticker_rules()
+    if category in rules.safe_categories:
         return True
-
-    min_price = PRICE_GATED_EVENT_PREFIXES.get(prefix)
-    return min_price is not None and entry_price_cents >= min_price
+    return rules.classify(event_ticker).passes(entry_price_cents)
+
+
+def passes_filter_many(
+    categories: Sequence[str],
+    event_tickers: Sequence[str],
+    entry_prices_cents: Sequence[int],
+) -> list[bool]:
+    """Batch form of passes_filter over parallel sequences."""
+    rules = ticker_rules.get_ticker_rules()
+    classes = rules.classify_many(event_tickers)
+    return [
+        category in rules.safe_categories or ticker_class.passes(price)
+        for category, ticker_class, price in zip(categories, classes, entry_prices_cents)
+    ]
@@ -1,10 +1,12 @@
 """Scout Agent: Market discovery and opportunity filtering."""
 
-import asyncio
 import json
 import logging
+import time
+from collections.abc import AsyncIterator, Container
 
 import logfire
+import numpy as np
 from pydantic_ai import Agent, RunContext
 
 from coliseum.agents.agent_factory import create_agent
@@ -15,21 +17,25 @@ from coliseum.llm_providers import GrokModel
 from coliseum.memory.context import build_scout_context
 from coliseum.services.kalshi.client import KalshiClient
 from coliseum.services.kalshi.config import KalshiConfig
-from coliseum.services.kalshi.models import Market
+from coliseum.services.kalshi.event_metadata import get_event_metadata_cache
+from coliseum.services.kalshi.frame import SIDE_NONE, SIDE_YES, MarketFrame
+from coliseum.services.kalshi.models import MarketRow
 from coliseum.services.supabase.repositories.opportunities import save_opportunity_to_db
 from coliseum.services.supabase.repositories.seen_tickers import (
     add_seen_ticker_to_db,
-    get_seen_tickers_from_db,
+    get_seen_ticker_index,
 )
 from coliseum.domain.opportunity import generate_opportunity_id
 
-from .filters import passes_filter
+from .filters import passes_filter_many
 from .models import ScoutDependencies, ScoutOutput
 from .prompts import build_scout_prompt
 from .researcher import get_web_researcher
 
 logger = logging.getLogger(__name__)
 
+_EVENT_MARKET_BATCH_SIZE = 1000
+
 
 def _create_scout_agent(prompt: str) -> Agent[ScoutDependencies, ScoutOutput]:
     """Create the Scout agent with the provided system prompt."""
@@ -81,85 +87,23 @@ def _register_tools(agent: Agent[ScoutDependencies, ScoutOutput]) -> None:
     _register_x_sentiment_tool(agent)
 
 
-def _side_is_tradeable(
-    bid_cents: int,
-    ask_cents: int,
-    min_price_cents: int,
-    max_price_cents: int,
-    max_spread_cents: int,
-) -> bool:
-    """Return True when a side has a real bid, valid price, and acceptable spread."""
-    if ask_cents == 0 or bid_cents <= 0:
-        return False
-    if not min_price_cents <= ask_cents <= max_price_cents:
-        return False
-    return (ask_cents - bid_cents) <= max_spread_cents
-
-
-def _entry_view(
-    market: Market,
-    min_price_cents: int,
-    max_price_cents: int,
-    max_spread_cents: int,
-) -> dict | None:
-    """Return the actionable side for Scout, or None if neither side qualifies."""
-    if _side_is_tradeable(
-        market.yes_bid,
-        market.yes_ask,
-        min_price_cents,
-        max_price_cents,
-        max_spread_cents,
-    ):
-        return {
-            "entry_side": "yes",
-            "entry_bid_cents": market.yes_bid,
-            "entry_ask_cents": market.yes_ask,
-            "entry_price_cents": market.yes_ask,
-            "entry_spread_cents": market.yes_ask - market.yes_bid,
-        }
-
-    if _side_is_tradeable(
-        market.no_bid,
-        market.no_ask,
-        min_price_cents,
-        max_price_cents,
-        max_spread_cents,
-    ):
-        return {
-            "entry_side": "no",
-            "entry_bid_cents": market.no_bid,
-            "entry_ask_cents": market.no_ask,
-            "entry_price_cents": market.no_ask,
-            "entry_spread_cents": market.no_ask - market.no_bid,
-        }
-
-    return None
-
-
-async def _fetch_event_metadata(
-    client: KalshiClient,
-    event_tickers: list[str],
-) -> dict[str, tuple[str, str]]:
-    """Fetch title and category for each event ticker in parallel."""
-    results = await asyncio.gather(
-        *[client.get_event(et) for et in event_tickers],
-        return_exceptions=True,
-    )
-    failed = [et for et, res in zip(event_tickers, results) if isinstance(res, Exception)]
-    if failed:
-        logger.warning("Failed to fetch event metadata for %d tickers: %s", len(failed), failed[:5])
+def _entry_view(market: MarketRow, side: str) -> dict:
+    """Return Scout's entry fields for the side chosen by the frame filter."""
+    if side == "yes":
+        bid_cents, ask_cents = market.yes_bid, market.yes_ask
+    else:
+        bid_cents, ask_cents = market.no_bid, market.no_ask
     return {
-        et: (
-            (res.get("title") or "", res.get("category") or "")
-            if isinstance(res, dict)
-            else ("", "")
-        )
-        for et, res in zip(event_tickers, results)
+        "entry_side": side,
+        "entry_bid_cents": bid_cents,
+        "entry_ask_cents": ask_cents,
+        "entry_price_cents": ask_cents,
+        "entry_spread_cents": ask_cents - bid_cents,
     }
 
 
 def _build_prefetched_market(
-    market: Market,
+    market: MarketRow,
     event_meta: dict[str, tuple[str, str]],
     entry_view: dict,
 ) -> dict:
@@ -187,49 +131,122 @@ def _build_prefetched_market(
     }
 
 
-async def _prefetch_markets_for_scan(
+async def _iter_event_market_pages(
     client: KalshiClient,
     settings: Settings,
-    seen_tickers: set[str] | None = None,
-) -> list[dict]:
-    """Fetch and pre-filter market dataset before Scout agent run."""
-    cfg = settings.scout
+    event_meta: dict[str, tuple[str, str]],
+) -> AsyncIterator[list[dict]]:
+    """Yield batches of raw nested markets from events-with-nested-markets pages.
 
-    markets = await client.get_markets_closing_in_range(
-        min_hours=cfg.min_close_hours,
-        max_hours=cfg.max_close_hours,
+    Fills ``event_meta`` with each event's title and category as a side effect,
+    so no per-event lookup is needed afterwards. Close-window filtering is left
+    to the caller's frame mask.
+    """
+    cfg = settings.scout
+    events = client.iter_events(
         limit=cfg.market_fetch_limit,
         status="open",
+        with_nested_markets=True,
+        min_close_ts=int(time.time()) + cfg.min_close_hours * 3600,
     )
-    logger.info("Prefetch: %d markets in %d-%dh window", len(markets), cfg.min_close_hours, cfg.max_close_hours)
+    batch: list[dict] = []
+    try:
+        async for event in events:
+            event_ticker = event.get("event_ticker") or ""
+            event_meta[event_ticker] = (event.get("title") or "", event.get("category") or "")
+            for raw in event.get("markets") or []:
+                if not raw.get("event_ticker"):
+                    raw = {**raw, "event_ticker": event_ticker}
+                batch.append(raw)
+            if len(batch) >= _EVENT_MARKET_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        await events.aclose()
 
-    if seen_tickers:
-        markets = [m for m in markets if m.ticker not in seen_tickers]
 
-    markets = [m for m in markets if m.volume >= cfg.min_volume]
+async def _prefetch_markets_for_scan(
+    client: KalshiClient,
+    settings: Settings,
+    seen_tickers: Container[str] | None = None,
+) -> list[dict]:
+    """Fetch and pre-filter market dataset before Scout agent run."""
+    cfg = settings.scout
+    now = int(time.time())
+    window_start = now + cfg.min_close_hours * 3600
+    window_end = now + cfg.max_close_hours * 3600
 
-    candidate_markets: list[tuple[Market, dict]] = []
-    for market in markets:
-        entry_view = _entry_view(
-            market,
-            min_price_cents=cfg.min_price,
-            max_price_cents=cfg.max_price,
-            max_spread_cents=cfg.max_spread_cents,
+    event_meta: dict[str, tuple[str, str]] = {}
+    if cfg.prefetch_mode == "events":
+        pages = _iter_event_market_pages(client, settings, event_meta)
+    else:
+        pages = client.iter_market_pages_closing_in_range(
+            min_hours=cfg.min_close_hours,
+            max_hours=cfg.max_close_hours,
+            limit=cfg.market_fetch_limit,
+            status="open",
         )
-        if entry_view is not None:
-            candidate_markets.append((market, entry_view))
 
+    # Filter each page as a columnar frame while the next one is in flight;
+    # only surviving rows are materialized as MarketRow objects.
+    scanned = 0
+    candidate_markets: list[tuple[MarketRow, dict]] = []
+    try:
+        async for page in pages:
+            frame = MarketFrame.from_raw(page)
+            if cfg.prefetch_mode == "events":
+                in_scope = frame.close_window_mask(window_start, window_end)
+                in_scope_rows = np.flatnonzero(in_scope)
+                budget = cfg.market_fetch_limit - scanned
+                in_scope[in_scope_rows[budget:]] = False
+                scanned += min(len(in_scope_rows), budget)
+            else:
+                in_scope = np.ones(len(frame), dtype=bool)
+                scanned += len(frame)
+
+            sides = frame.entry_sides(
+                min_price_cents=cfg.min_price,
+                max_price_cents=cfg.max_price,
+                max_spread_cents=cfg.max_spread_cents,
+            )
+            keep = (
+                in_scope
+                & frame.unseen_mask(seen_tickers or ())
+                & (frame.volume >= cfg.min_volume)
+                & (sides != SIDE_NONE)
+            )
+            for index in np.flatnonzero(keep):
+                market = frame.row(index)
+                if sides[index] == SIDE_YES:
+                    side = "yes"
+                else:
+                    side = "no"
+                candidate_markets.append((market, _entry_view(market, side)))
+
+            if scanned >= cfg.market_fetch_limit:
+                break
+    finally:
+        await pages.aclose()
+
+    logger.info("Prefetch: %d markets in %d-%dh window", scanned, cfg.min_close_hours, cfg.max_close_hours)
     logger.info("Prefetch: %d markets after baseline filters", len(candidate_markets))
 
-    unique_event_tickers = list({market.event_ticker for market, _ in candidate_markets if market.event_ticker})
-    event_meta = await _fetch_event_metadata(client, unique_event_tickers)
+    if cfg.prefetch_mode != "events":
+        unique_event_tickers = list({market.event_ticker for market, _ in candidate_markets if market.event_ticker})
+        event_meta = await get_event_metadata_cache().get_many(client, unique_event_tickers)
 
-    prefetched_markets = []
-    for market, entry_view in candidate_markets:
-        _, category = event_meta.get(market.event_ticker, ("", ""))
-        if not passes_filter(category, market.event_ticker, entry_view["entry_price_cents"]):
-            continue
-        prefetched_markets.append(_build_prefetched_market(market, event_meta, entry_view))
+    passed = passes_filter_many(
+        [event_meta.get(market.event_ticker, ("", ""))[1] for market, _ in candidate_markets],
+        [market.event_ticker for market, _ in candidate_markets],
+        [entry_view["entry_price_cents"] for _, entry_view in candidate_markets],
+    )
+    prefetched_markets = [
+        _build_prefetched_market(market, event_meta, entry_view)
+        for (market, entry_view), ok in zip(candidate_markets, passed)
+        if ok
+    ]
 
     logger.info(
         "Prefetch: %d -> %d markets after historical safety filter",
@@ -274,20 +291,29 @@ async def run_scout(
         settings = get_settings()
 
     # Paper mode is stateless: skip seen_tickers so every run rediscovers from scratch
+    seen_tickers: Container[str]
     if settings.trading.paper_mode:
-        seen_tickers = []
+        seen_tickers = ()
     else:
-        seen_tickers = await get_seen_tickers_from_db()
+        seen_tickers = get_seen_ticker_index()
+        await seen_tickers.refresh()
 
     with logfire.span("scout scan"):
         kalshi_config = KalshiConfig()
         async with KalshiClient(config=kalshi_config) as client:
-            with logfire.span("prefetch markets"):
+            with logfire.span("prefetch markets", mode=settings.scout.prefetch_mode) as prefetch_span:
                 prefetched_markets = await _prefetch_markets_for_scan(
                     client,
                     settings,
-                    seen_tickers=set(seen_tickers),
+                    seen_tickers=seen_tickers,
                 )
+                if settings.scout.prefetch_mode != "events":
+                    meta_stats = get_event_metadata_cache().last_stats
+                    prefetch_span.set_attributes({
+                        "event_meta_memory_hits": meta_stats.memory_hits,
+                        "event_meta_db_hits": meta_stats.db_hits,
+                        "event_meta_misses": meta_stats.misses,
+                    })
                 logfire.info("Markets prefetched", count=len(prefetched_markets))
 
             deps = ScoutDependencies(settings=settings, prefetched_markets=prefetched_markets)
@@ -0,0 +1,279 @@
+"""Compiled ticker rule engine shared by Scout filtering and market-context lookup.
+
+Classifies an event ticker into its Scout safety bucket (unconditionally safe,
+price-gated, or neither) and its market-context category key in one pass.
+Category keys, aliases and compound keywords are compiled into a single
+Aho-Corasick automaton, so matching costs one scan of the ticker instead of a
+substring test per key. Match priority is unchanged from the linear scan:
+the earliest ``MARKET_TYPES`` key wins, then the earliest alias, then the
+compound rules in order.
+
+Safety rules default to the constants in ``agents/scout/filters.py`` and can be
+overridden from an optional ``scout_filters`` section of ``config.yaml``::
+
+    scout_filters:
+      safe_categories: []
+      safe_event_prefixes: [KXETH15M, KXTSAW]
+      price_gated_event_prefixes: {KXWTIW: 94}
+
+The section is re-read whenever the file's mtime changes, without a restart.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from coliseum.agents.markets_context.seed_data import ALIASES, MARKET_TYPES
+from coliseum.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_RELOAD_CHECK_SECONDS = 1.0
+_MEMO_MAX_ENTRIES = 50_000
+
+# (category key, groups): matches when every group has at least one keyword present.
+_COMPOUND_RULES: list[tuple[str, list[tuple[str, ...]]]] = [
+    ("BERNIEMENTION", [("MENTION",), ("BERNIE",)]),
+    ("KHAMENEI", [("OUT",), ("LEADER", "PRES")]),
+    ("MLBSTGAME", [("MLB",), ("GAME",)]),
+    ("WOHOCKEY", [("HOCKEY",), ("OLYMPIC",)]),
+]
+
+
+@dataclass(frozen=True, slots=True)
+class TickerClass:
+    """Classification of one event ticker."""
+
+    safe: bool
+    gate_price: int | None
+    category_key: str | None
+
+    def passes(self, entry_price_cents: int) -> bool:
+        """True when the ticker's safety bucket admits this entry price."""
+        if self.safe:
+            return True
+        return self.gate_price is not None and entry_price_cents >= self.gate_price
+
+
+class _Automaton:
+    """Aho-Corasick automaton over a fixed set of uppercase patterns."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        for pattern in dict.fromkeys(patterns):
+            self._add(pattern)
+        self._link()
+
+    def _add(self, pattern: str) -> None:
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        self._out[node] = self._out[node] + (pattern,)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                if target == child:
+                    target = 0
+                self._fail[child] = target
+                self._out[child] = self._out[child] + self._out[target]
+
+    def find_all(self, text: str) -> set[str]:
+        """Return every pattern occurring anywhere in ``text``."""
+        found: set[str] = set()
+        node = 0
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+class TickerRuleEngine:
+    """Immutable compiled rule set; build a new one to change rules."""
+
+    def __init__(
+        self,
+        safe_event_prefixes: Iterable[str],
+        price_gated_event_prefixes: Mapping[str, int],
+        safe_categories: Iterable[str] = (),
+        market_type_keys: Iterable[str] = MARKET_TYPES,
+        aliases: Mapping[str, str] = ALIASES,
+    ):
+        self.safe_categories = frozenset(safe_categories)
+        self._prefix_rules: dict[str, tuple[bool, int | None]] = {
+            prefix.upper(): (False, int(gate))
+            for prefix, gate in price_gated_event_prefixes.items()
+        }
+        for prefix in safe_event_prefixes:
+            self._prefix_rules[prefix.upper()] = (True, None)
+
+        self._type_keys = list(market_type_keys)
+        self._type_rank = {key: rank for rank, key in enumerate(self._type_keys)}
+        self._alias_keys = list(aliases)
+        self._alias_rank = {alias: rank for rank, alias in enumerate(self._alias_keys)}
+        self._aliases = dict(aliases)
+        keywords = [word for _, groups in _COMPOUND_RULES for group in groups for word in group]
+        self._automaton = _Automaton([*self._type_rank, *self._alias_rank, *keywords])
+        self._memo: dict[str, TickerClass] = {}
+
+    def category_key(self, event_ticker: str) -> str | None:
+        """Map an event ticker to its market-context category key, if any."""
+        return self.classify(event_ticker).category_key
+
+    def classify(self, event_ticker: str) -> TickerClass:
+        """Classify one event ticker into (safe, gate price, category key)."""
+        cached = self._memo.get(event_ticker)
+        if cached is not None:
+            return cached
+
+        event = event_ticker.upper()
+        safe, gate_price = self._prefix_rules.get(event.partition("-")[0], (False, None))
+        result = TickerClass(
+            safe=safe,
+            gate_price=gate_price,
+            category_key=self._resolve_category(self._automaton.find_all(event)),
+        )
+        if len(self._memo) >= _MEMO_MAX_ENTRIES:
+            self._memo.clear()
+        self._memo[event_ticker] = result
+        return result
+
+    def classify_many(self, event_tickers: Iterable[str]) -> list[TickerClass]:
+        """Classify a batch, scanning each distinct event ticker once."""
+        tickers = list(event_tickers)
+        by_ticker = {ticker: self.classify(ticker) for ticker in dict.fromkeys(tickers)}
+        return [by_ticker[ticker] for ticker in tickers]
+
+    def _resolve_category(self, matched: set[str]) -> str | None:
+        if not matched:
+            return None
+        type_hits = [self._type_rank[p] for p in matched if p in self._type_rank]
+        if type_hits:
+            return self._type_keys[min(type_hits)]
+        alias_hits = [self._alias_rank[p] for p in matched if p in self._alias_rank]
+        if alias_hits:
+            return self._aliases[self._alias_keys[min(alias_hits)]]
+        for category_key, groups in _COMPOUND_RULES:
+            if all(any(word in matched for word in group) for group in groups):
+                return category_key
+        return None
+
+
+def _default_rules() -> dict[str, Any]:
+    # Imported lazily: the scout package imports this module via filters.py.
+    from coliseum.agents.scout import filters
+
+    return {
+        "safe_categories": filters.SAFE_CATEGORIES,
+        "safe_event_prefixes": filters.SAFE_EVENT_PREFIXES,
+        "price_gated_event_prefixes": filters.PRICE_GATED_EVENT_PREFIXES,
+    }
+
+
+class TickerRuleSource:
+    """Builds the engine from a config file and rebuilds it when the file changes."""
+
+    def __init__(self, config_path: Path, check_interval_seconds: float = _RELOAD_CHECK_SECONDS):
+        self.config_path = config_path
+        self.check_interval_seconds = check_interval_seconds
+        self._engine: TickerRuleEngine | None = None
+        self._mtime: float | None = None
+        self._checked_at = 0.0
+
+    def get(self) -> TickerRuleEngine:
+        now = time.monotonic()
+        if self._engine is not None and now - self._checked_at < self.check_interval_seconds:
+            return self._engine
+        self._checked_at = now
+
+        try:
+            mtime = self.config_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        if self._engine is None or mtime != self._mtime:
+            self._mtime = mtime
+            self._engine = self._build(self._engine)
+        return self._engine
+
+    def _build(self, previous: TickerRuleEngine | None) -> TickerRuleEngine:
+        rules = _default_rules()
+        try:
+            overrides = self._read_overrides()
+        except Exception as e:
+            if previous is not None:
+                logger.warning("Invalid scout_filters in %s, keeping current rules: %s", self.config_path, e)
+                return previous
+            logger.warning("Invalid scout_filters in %s, using defaults: %s", self.config_path, e)
+            overrides = {}
+        rules.update(overrides)
+
+        engine = TickerRuleEngine(
+            safe_event_prefixes=rules["safe_event_prefixes"],
+            price_gated_event_prefixes=rules["price_gated_event_prefixes"],
+            safe_categories=rules["safe_categories"],
+        )
+        logger.info(
+            "Loaded ticker rules: %d safe prefixes, %d gated prefixes%s",
+            len(rules["safe_event_prefixes"]),
+            len(rules["price_gated_event_prefixes"]),
+            " (config overrides)" if overrides else "",
+        )
+        return engine
+
+    def _read_overrides(self) -> dict[str, Any]:
+        if not self.config_path.exists():
+            return {}
+        with open(self.config_path, "r", encoding="utf-8") as f:
+            section = (yaml.safe_load(f) or {}).get("scout_filters") or {}
+        overrides: dict[str, Any] = {}
+        if "safe_categories" in section:
+            overrides["safe_categories"] = set(section["safe_categories"] or [])
+        if "safe_event_prefixes" in section:
+            overrides["safe_event_prefixes"] = set(section["safe_event_prefixes"] or [])
+        if "price_gated_event_prefixes" in section:
+            overrides["price_gated_event_prefixes"] = {
+                str(prefix): int(gate)
+                for prefix, gate in (section["price_gated_event_prefixes"] or {}).items()
+            }
+        return overrides
+
+
+_source: TickerRuleSource | None = None
+
+
+def get_ticker_rules() -> TickerRuleEngine:
+    """Return the current engine, reloading rules if config.yaml changed."""
+    global _source
+    if _source is None:
+        _source = TickerRuleSource(get_settings().config_file_path)
+    return _source.get()
@@ -0,0 +1,398 @@
+"""Working-order execution: place a limit order and work it until it is terminal.
+
+Detection and repricing run on separate clocks:
+
+- order status is re-polled as soon as a fill event for the order arrives on
+  the market stream, and otherwise on an adaptive timer that starts at
+  ``status_poll_min_seconds`` after placement, each reprice and each fill,
+  doubling up to ``status_poll_max_seconds`` while the order is quiet;
+- the limit is raised by ``reprice_aggression`` every
+  ``reprice_interval_seconds``. At each reprice deadline a partial fill of
+  at least ``min_fill_pct_to_keep`` is kept and the rest cancelled; after
+  ``max_reprice_attempts`` the order is cancelled.
+
+The executor returns as soon as the order is filled or cancelled, so a fill
+that lands seconds after placement no longer waits out the reprice interval.
+Its progress lives on a ``WorkingOrder`` so the ``OrderManager`` can persist
+it and resume the order after a restart.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Literal
+from uuid import uuid4
+
+from coliseum.agents.trader.models import OrderResult
+from coliseum.config import Settings
+from coliseum.domain.working_order import WorkingOrder, generate_working_order_id
+from coliseum.services.kalshi.client import KalshiClient
+from coliseum.services.kalshi.models import Order
+from coliseum.services.kalshi.stream import get_market_stream
+
+logger = logging.getLogger(__name__)
+
+_CANCELLED_STATUSES = frozenset({"canceled", "cancelled"})
+
+Checkpoint = Callable[[WorkingOrder], Awaitable[None]]
+
+
+def _calc_fill_price(taker_cost: float, maker_cost: float, fill_count: int, fallback_cents: int) -> float:
+    """Calculate average fill price in decimal (0-1)."""
+    if fill_count > 0:
+        return (taker_cost + maker_cost) / (fill_count * 100)
+    return fallback_cents / 100
+
+
+async def _wait_for_activity(
+    fill_event: asyncio.Event | None,
+    shutdown_event: asyncio.Event | None,
+    timeout: float,
+) -> Literal["fill", "timer", "shutdown"]:
+    """Sleep until a fill event, shutdown, or ``timeout`` — whichever comes first."""
+    if shutdown_event is not None and shutdown_event.is_set():
+        return "shutdown"
+    if fill_event is not None and fill_event.is_set():
+        return "fill"
+
+    waiters: dict[asyncio.Task, str] = {}
+    if fill_event is not None:
+        waiters[asyncio.ensure_future(fill_event.wait())] = "fill"
+    if shutdown_event is not None:
+        waiters[asyncio.ensure_future(shutdown_event.wait())] = "shutdown"
+    if not waiters:
+        await asyncio.sleep(timeout)
+        return "timer"
+
+    done, pending = await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    if shutdown_event is not None and shutdown_event.is_set():
+        return "shutdown"
+    if done:
+        return "fill"
+    return "timer"
+
+
+async def _filled_result(
+    client: KalshiClient,
+    order: Order,
+    order_id: str,
+    contracts: int,
+    current_price: int,
+) -> OrderResult:
+    """Build the result for a fully executed order."""
+    # Cost is always derived from actual fill cost fields, never from price × count
+    total_cost = (order.taker_fill_cost + order.maker_fill_cost) / 100
+    if order.fill_count > 0:
+        actual_fill_count = order.fill_count
+        fill_price_decimal = _calc_fill_price(
+            order.taker_fill_cost, order.maker_fill_cost, order.fill_count, current_price
+        )
+    else:
+        # fill_count_fp absent from API response — consult fills ledger for ground truth
+        try:
+            fills = await client.get_fills(order_id=order_id)
+        except Exception as exc:
+            logger.error(
+                "get_fills failed for order %s: %s — falling back to requested count",
+                order_id, exc,
+            )
+            fills = []
+        # Fills endpoint uses "count" (integer); "count_fp" is the order-object convention
+        actual_fill_count = sum(int(float(f.get("count", f.get("count_fp", 0)))) for f in fills)
+        if actual_fill_count > 0:
+            fill_price_decimal = total_cost / actual_fill_count if total_cost > 0 else current_price / 100
+        else:
+            logger.warning(
+                "Order %s executed with fill_count=0 and empty fills ledger; falling back to requested %d",
+                order_id, contracts,
+            )
+            actual_fill_count = contracts
+            fill_price_decimal = current_price / 100
+
+    # Guard: fill cost fields can lag settlement — fall back to price × count estimate
+    if total_cost == 0.0 and actual_fill_count > 0:
+        logger.error(
+            "Order %s reports %d fills but zero fill cost — using price × count estimate",
+            order_id, actual_fill_count,
+        )
+        total_cost = round(fill_price_decimal * actual_fill_count, 4)
+
+    return OrderResult(
+        order_id=order_id,
+        fill_price=fill_price_decimal,
+        contracts_filled=actual_fill_count,
+        total_cost_usd=total_cost,
+        status="filled",
+    )
+
+
+def _closed_result(
+    order: Order,
+    order_id: str,
+    contracts: int,
+    current_price: int,
+) -> OrderResult:
+    """Build the result for a cancelled order from whatever filled before it closed."""
+    if order.fill_count <= 0:
+        return OrderResult(order_id=order_id, status="cancelled")
+
+    # All contracts may have filled during the cancel window — reflect the true outcome
+    if order.fill_count >= contracts:
+        status: Literal["filled", "partial"] = "filled"
+    else:
+        status = "partial"
+    return OrderResult(
+        order_id=order_id,
+        fill_price=_calc_fill_price(
+            order.taker_fill_cost, order.maker_fill_cost, order.fill_count, current_price
+        ),
+        contracts_filled=order.fill_count,
+        total_cost_usd=(order.taker_fill_cost + order.maker_fill_cost) / 100,
+        status=status,
+    )
+
+
+async def _cancel_and_refresh(client: KalshiClient, order: Order, order_id: str) -> Order:
+    """Cancel the order, then re-poll to capture fills that landed during the cancel."""
+    await client.cancel_order(order_id)
+    try:
+        return await client.get_order_status(order_id)
+    except Exception as exc:
+        logger.warning("Post-cancel status poll failed for %s: %s", order_id, exc)
+        return order
+
+
+def combine_order_results(results: Sequence[OrderResult]) -> OrderResult:
+    """Fold the results of child orders into one result for the parent entry."""
+    if len(results) == 1:
+        return results[0]
+    filled = sum(r.contracts_filled for r in results)
+    total_cost = sum(r.total_cost_usd for r in results)
+    if filled > 0:
+        fill_price = total_cost / filled
+    else:
+        fill_price = None
+
+    statuses = {r.status for r in results}
+    if statuses == {"filled"}:
+        status = "filled"
+    elif filled > 0:
+        status = "partial"
+    elif "error" in statuses:
+        status = "error"
+    else:
+        status = "cancelled"
+    errors = [r.error_message for r in results if r.error_message]
+    return OrderResult(
+        order_id=next((r.order_id for r in results if r.order_id), None),
+        fill_price=fill_price,
+        contracts_filled=filled,
+        total_cost_usd=total_cost,
+        status=status,
+        error_message="; ".join(errors) or None,
+    )
+
+
+def new_working_order(
+    opportunity_id: str,
+    ticker: str,
+    side: Literal["yes", "no"],
+    contracts: int,
+    initial_price_cents: int,
+    config: Settings,
+    reserved_cash: float = 0.0,
+) -> WorkingOrder:
+    """Build the not-yet-placed order a Trader decision turns into."""
+    now = datetime.now(timezone.utc)
+    return WorkingOrder(
+        id=generate_working_order_id(),
+        opportunity_id=opportunity_id,
+        market_ticker=ticker,
+        side=side,
+        contracts=contracts,
+        client_order_id=f"trader_{uuid4().hex[:8]}",
+        price_cents=initial_price_cents,
+        reprices_left=config.execution.max_reprice_attempts,
+        reserved_cash=reserved_cash,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+async def _place(client: KalshiClient, working: WorkingOrder, resume: bool) -> Order:
+    """Place ``working``, or adopt the order a previous process already placed."""
+    if working.order_id is not None:
+        return await client.get_order_status(working.order_id)
+
+    # A crash between placement and the checkpoint leaves no order_id; Kalshi
+    # has the order under our client_order_id if it was accepted.
+    if resume:
+        for existing in await client.get_orders(ticker=working.market_ticker):
+            if existing.client_order_id == working.client_order_id:
+                logger.info("Adopted order %s for %s", existing.order_id, working.id)
+                return existing
+
+    if working.side == "yes":
+        order = await client.place_order(
+            ticker=working.market_ticker,
+            side="yes",
+            action="buy",
+            count=working.contracts,
+            yes_price=working.price_cents,
+            client_order_id=working.client_order_id,
+        )
+    else:
+        order = await client.place_order(
+            ticker=working.market_ticker,
+            side="no",
+            action="buy",
+            count=working.contracts,
+            no_price=working.price_cents,
+            client_order_id=working.client_order_id,
+        )
+    logger.info(
+        "Placed order %s: %d %s @ %d¢",
+        order.order_id, working.contracts, working.side, working.price_cents,
+    )
+    return order
+
+
+def _seconds_until(deadline: datetime) -> float:
+    return (deadline - datetime.now(timezone.utc)).total_seconds()
+
+
+async def work_order(
+    client: KalshiClient,
+    working: WorkingOrder,
+    config: Settings,
+    shutdown_event: asyncio.Event | None = None,
+    checkpoint: Checkpoint | None = None,
+    resume: bool = False,
+) -> OrderResult | None:
+    """Work ``working`` until it is terminal; returns None if shutdown interrupted it.
+
+    ``working`` is updated in place (order id, price, reprice schedule) and
+    passed to ``checkpoint`` after placement and after each reprice, so the
+    caller can persist it and resume with another call (``resume=True``) after
+    a restart. An interrupted order is left resting on the exchange.
+    """
+    cfg = config.execution
+    reprice_aggression_cents = int(cfg.reprice_aggression * 100)
+    loop = asyncio.get_running_loop()
+    stream = get_market_stream()
+    fill_event: asyncio.Event | None = None
+
+    try:
+        order = await _place(client, working, resume)
+        if working.order_id is None:
+            working.order_id = order.order_id
+            working.reprice_at = datetime.now(timezone.utc) + timedelta(seconds=cfg.reprice_interval_seconds)
+            if checkpoint is not None:
+                await checkpoint(working)
+        order_id = working.order_id
+        started_at = loop.time()
+
+        if stream is not None and stream.streams_fills:
+            fill_event = stream.watch_order(order_id)
+
+        poll_delay = cfg.status_poll_min_seconds
+        polls = 0
+
+        while True:
+            timeout = max(0.0, min(poll_delay, _seconds_until(working.reprice_at)))
+            woke = await _wait_for_activity(fill_event, shutdown_event, timeout)
+            if woke == "shutdown":
+                logger.info("Shutdown requested during order wait; leaving %s working", order_id)
+                return None
+            if fill_event is not None:
+                fill_event.clear()
+
+            order = await client.get_order_status(order_id)
+            polls += 1
+
+            if order.is_filled:
+                logger.info(
+                    "Order %s filled after %.1fs (%d status polls)",
+                    order_id, loop.time() - started_at, polls,
+                )
+                return await _filled_result(client, order, order_id, working.contracts, working.price_cents)
+
+            if order.status in _CANCELLED_STATUSES:
+                logger.info("Order %s was cancelled outside the executor", order_id)
+                return _closed_result(order, order_id, working.contracts, working.price_cents)
+
+            if woke == "fill":
+                poll_delay = cfg.status_poll_min_seconds
+            else:
+                poll_delay = min(poll_delay * 2, cfg.status_poll_max_seconds)
+
+            if _seconds_until(working.reprice_at) > 0:
+                continue
+
+            # Reprice deadline: keep a worthwhile partial fill, else reprice or give up.
+            if working.contracts > 0:
+                fill_pct = order.fill_count / working.contracts
+            else:
+                fill_pct = 0.0
+            if fill_pct >= cfg.min_fill_pct_to_keep:
+                order = await _cancel_and_refresh(client, order, order_id)
+                logger.info("Keeping partial fill: %d/%d", order.fill_count, working.contracts)
+                return _closed_result(order, order_id, working.contracts, working.price_cents)
+
+            if working.reprices_left > 0:
+                new_price = min(99, working.price_cents + reprice_aggression_cents)
+                await client.amend_order(order_id, price=new_price)
+                working.price_cents = new_price
+                working.reprices_left -= 1
+                working.reprice_at = datetime.now(timezone.utc) + timedelta(seconds=cfg.reprice_interval_seconds)
+                logger.info(
+                    "Repriced order %s to %d¢ (attempt %d)",
+                    order_id, new_price, cfg.max_reprice_attempts - working.reprices_left,
+                )
+                if checkpoint is not None:
+                    await checkpoint(working)
+                poll_delay = cfg.status_poll_min_seconds
+                continue
+
+            # Out of attempts, cancel and return whatever filled
+            order = await _cancel_and_refresh(client, order, order_id)
+            logger.info("Cancelled order %s after %d attempts", order_id, cfg.max_reprice_attempts + 1)
+            return _closed_result(order, order_id, working.contracts, working.price_cents)
+
+    except Exception as e:
+        logger.error("Error in working order execution: %s", e)
+        if working.order_id:
+            try:
+                await client.cancel_order(working.order_id)
+            except Exception:
+                pass
+        return OrderResult(
+            order_id=working.order_id,
+            status="error",
+            error_message=str(e),
+        )
+    finally:
+        if fill_event is not None and stream is not None:
+            stream.unwatch_order(working.order_id)
+
+
+async def execute_working_order(
+    client: KalshiClient,
+    ticker: str,
+    side: Literal["yes", "no"],
+    contracts: int,
+    initial_price_cents: int,
+    config: Settings,
+    shutdown_event: asyncio.Event | None = None,
+) -> OrderResult:
+    """Execute limit order with place → watch → reprice → cancel strategy to avoid market orders."""
+    working = new_working_order("", ticker, side, contracts, initial_price_cents, config)
+    result = await work_order(client, working, config, shutdown_event=shutdown_event)
+    if result is None:
+        return OrderResult(order_id=working.order_id, status="cancelled")
+    return result
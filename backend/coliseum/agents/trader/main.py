@@ -3,20 +3,21 @@
 import asyncio
 import logging
 from contextlib import AsyncExitStack
-from datetime import datetime, timezone
-from typing import Literal
-from uuid import uuid4
 
 import logfire
+import numpy as np
 
 from pydantic_ai import Agent, RunContext
 
 from coliseum.agents.agent_factory import AgentFactory, create_agent
+from coliseum.agents.response_cache import run_cached
+from coliseum.agents.trader.execution import combine_order_results, new_working_order
 from coliseum.agents.trader.models import (
-    OrderResult,
     TraderDependencies,
     TraderOutput,
 )
+from coliseum.agents.trader.order_manager import get_order_manager
+from coliseum.agents.trader.portfolio_lock import get_portfolio_lock
 from coliseum.agents.trader.prompts import (
     build_trader_system_prompt,
     build_trader_prompt,
@@ -24,22 +25,19 @@ from coliseum.agents.trader.prompts import (
 from coliseum.config import Settings, get_settings
 from coliseum.services.kalshi.client import KalshiClient
 from coliseum.services.kalshi.config import KalshiConfig
+from coliseum.services.kalshi.entry_planner import plan_entry, split_child_orders
+from coliseum.services.kalshi.stream import get_streamed_book, get_streamed_quote
 from coliseum.services.telegram import TelegramClient, create_telegram_client
 from coliseum.domain.opportunity import OpportunitySignal
-from coliseum.domain.trade import TradeExecution, generate_trade_id
+from coliseum.domain.working_order import WorkingOrder
 from coliseum.memory.decisions import DecisionEntry
+from coliseum.services.supabase.db import unit_of_work
 from coliseum.services.supabase.repositories.opportunities import (
-    load_opportunity_from_db,
-    get_opportunity_body_from_db,
+    load_opportunity_record_from_db,
     update_opportunity_trader_decision,
 )
-from coliseum.services.supabase.repositories.trades import save_trade_to_db
 from coliseum.services.supabase.repositories.decisions import save_decision_to_db
-from coliseum.services.supabase.repositories.portfolio import (
-    load_state_from_db,
-    update_portfolio_after_trade_in_db,
-)
-from coliseum.domain.portfolio import Position
+from coliseum.services.supabase.repositories.portfolio import load_portfolio_summary
 
 logger = logging.getLogger(__name__)
 
@@ -64,226 +62,36 @@ def _register_tools(agent: Agent[TraderDependencies, TraderOutput]) -> None:
         ticker: str,
     ) -> dict:
         """Fetch live Kalshi orderbook prices to confirm YES or NO is still 92-96%."""
-        client = ctx.deps.kalshi_client
-        market = await client.get_market(ticker)
-        if market.yes_ask:
-            yes_price_decimal = market.yes_ask / 100
+        yes_ask, no_ask = await _get_current_asks(ctx.deps.kalshi_client, ticker)
+        if yes_ask:
+            yes_price_decimal = yes_ask / 100
         else:
             yes_price_decimal = None
 
-        if market.no_ask:
-            no_price_decimal = market.no_ask / 100
+        if no_ask:
+            no_price_decimal = no_ask / 100
         else:
             no_price_decimal = None
 
         return {
             "ticker": ticker,
-            "yes_ask": market.yes_ask,
+            "yes_ask": yes_ask,
             "yes_price_decimal": yes_price_decimal,
-            "no_ask": market.no_ask,
+            "no_ask": no_ask,
             "no_price_decimal": no_price_decimal,
         }
 
 
-def _calc_fill_price(taker_cost: float, maker_cost: float, fill_count: int, fallback_cents: int) -> float:
-    """Calculate average fill price in decimal (0-1)."""
-    if fill_count > 0:
-        return (taker_cost + maker_cost) / (fill_count * 100)
-    return fallback_cents / 100
-
-
-async def execute_working_order(
-    client: KalshiClient,
-    ticker: str,
-    side: Literal["yes", "no"],
-    contracts: int,
-    initial_price_cents: int,
-    config: Settings,
-    shutdown_event: asyncio.Event | None = None,
-) -> OrderResult:
-    """Execute limit order with place → wait → reprice → cancel strategy to avoid market orders."""
-    client_order_id = f"trader_{uuid4().hex[:8]}"
-    current_price = initial_price_cents
-    max_attempts = config.execution.max_reprice_attempts + 1  # +1 for initial placement
-    check_interval = config.execution.order_check_interval_seconds
-    reprice_aggression_cents = int(config.execution.reprice_aggression * 100)
-
-    order_id: str | None = None
-
-    for attempt in range(max_attempts):
-        try:
-            # Place or reprice order
-            if attempt == 0:
-                # Initial placement
-                if side == "yes":
-                    order = await client.place_order(
-                        ticker=ticker,
-                        side="yes",
-                        action="buy",
-                        count=contracts,
-                        yes_price=current_price,
-                        client_order_id=client_order_id,
-                    )
-                else:
-                    order = await client.place_order(
-                        ticker=ticker,
-                        side="no",
-                        action="buy",
-                        count=contracts,
-                        no_price=current_price,
-                        client_order_id=client_order_id,
-                    )
-                order_id = order.order_id
-                logger.info("Placed order %s: %d %s @ %d¢", order_id, contracts, side, current_price)
-            else:
-                # Reprice existing order
-                order = await client.amend_order(order_id, price=current_price)
-                logger.info("Repriced order %s to %d¢ (attempt %d)", order_id, current_price, attempt)
-
-            # Wait for fill — interruptible if daemon is shutting down
-            if shutdown_event is not None:
-                try:
-                    await asyncio.wait_for(shutdown_event.wait(), timeout=check_interval)
-                    logger.info("Shutdown requested during order wait; exiting reprice loop for %s", order_id)
-                    return OrderResult(order_id=order_id, status="cancelled")
-                except asyncio.TimeoutError:
-                    pass
-            else:
-                await asyncio.sleep(check_interval)
-
-            # Check status
-            order = await client.get_order_status(order_id)
-
-            if order.is_filled:
-                # Cost is always derived from actual fill cost fields, never from price × count
-                total_cost = (order.taker_fill_cost + order.maker_fill_cost) / 100
-                if order.fill_count > 0:
-                    actual_fill_count = order.fill_count
-                    fill_price_decimal = _calc_fill_price(
-                        order.taker_fill_cost, order.maker_fill_cost, order.fill_count, current_price
-                    )
-                else:
-                    # fill_count_fp absent from API response — consult fills ledger for ground truth
-                    try:
-                        fills = await client.get_fills(order_id=order_id)
-                    except Exception as exc:
-                        logger.error(
-                            "get_fills failed for order %s: %s — falling back to requested count",
-                            order_id, exc,
-                        )
-                        fills = []
-                    # Fills endpoint uses "count" (integer); "count_fp" is the order-object convention
-                    actual_fill_count = sum(int(float(f.get("count", f.get("count_fp", 0)))) for f in fills)
-                    if actual_fill_count > 0:
-                        fill_price_decimal = total_cost / actual_fill_count if total_cost > 0 else current_price / 100
-                    else:
-                        logger.warning(
-                            "Order %s executed with fill_count=0 and empty fills ledger; falling back to requested %d",
-                            order_id, contracts,
-                        )
-                        actual_fill_count = contracts
-                        fill_price_decimal = current_price / 100
-
-                # Guard: fill cost fields can lag settlement — fall back to price × count estimate
-                if total_cost == 0.0 and actual_fill_count > 0:
-                    logger.error(
-                        "Order %s reports %d fills but zero fill cost — using price × count estimate",
-                        order_id, actual_fill_count,
-                    )
-                    total_cost = round(fill_price_decimal * actual_fill_count, 4)
-
-                return OrderResult(
-                    order_id=order_id,
-                    fill_price=fill_price_decimal,
-                    contracts_filled=actual_fill_count,
-                    total_cost_usd=total_cost,
-                    status="filled",
-                )
-
-            # Check if partial fill is worth keeping
-            if contracts > 0:
-                fill_pct = order.fill_count / contracts
-            else:
-                fill_pct = 0.0
-            if fill_pct >= config.execution.min_fill_pct_to_keep:
-                await client.cancel_order(order_id)
-                # Re-poll after cancel to capture any fills that landed during cancel processing
-                try:
-                    refreshed = await client.get_order_status(order_id)
-                    order = refreshed
-                except Exception as exc:
-                    logger.warning("Post-cancel status poll failed for %s: %s", order_id, exc)
+_STREAM_QUOTE_TIMEOUT_SECONDS = 2.0
 
-                logger.info("Keeping partial fill: %d/%d", order.fill_count, contracts)
-                fill_price_decimal = _calc_fill_price(
-                    order.taker_fill_cost, order.maker_fill_cost, order.fill_count, current_price
-                )
-                total_cost = (order.taker_fill_cost + order.maker_fill_cost) / 100
-                # All contracts may have filled during the cancel window — reflect the true outcome
-                final_status: Literal["filled", "partial"] = "filled" if order.fill_count >= contracts else "partial"
-
-                return OrderResult(
-                    order_id=order_id,
-                    fill_price=fill_price_decimal,
-                    contracts_filled=order.fill_count,
-                    total_cost_usd=total_cost,
-                    status=final_status,
-                )
 
-            # Not filled yet, reprice if we have attempts left
-            if attempt < max_attempts - 1:
-                # Increase price by aggression amount
-                current_price = min(99, current_price + reprice_aggression_cents)
-                logger.info("Repricing to %d¢ for next attempt", current_price)
-            else:
-                # Out of attempts, cancel
-                await client.cancel_order(order_id)
-                logger.info("Cancelled order %s after %d attempts", order_id, max_attempts)
-
-                # Final poll — catch any fills that landed during the cancel window
-                refreshed = None
-                try:
-                    refreshed = await client.get_order_status(order_id)
-                except Exception as exc:
-                    logger.warning("Final status poll failed for %s: %s", order_id, exc)
-
-                if refreshed is not None:
-                    order = refreshed
-
-                # Return partial fill if any
-                if order.fill_count > 0:
-                    fill_price_decimal = _calc_fill_price(
-                        order.taker_fill_cost, order.maker_fill_cost, order.fill_count, current_price
-                    )
-                    total_cost = (order.taker_fill_cost + order.maker_fill_cost) / 100
-                    return OrderResult(
-                        order_id=order_id,
-                        fill_price=fill_price_decimal,
-                        contracts_filled=order.fill_count,
-                        total_cost_usd=total_cost,
-                        status="partial",
-                    )
-
-                return OrderResult(
-                    order_id=order_id,
-                    status="cancelled",
-                )
-
-        except Exception as e:
-            logger.error("Error in working order execution: %s", e)
-            if order_id:
-                try:
-                    await client.cancel_order(order_id)
-                except Exception:
-                    pass
-            return OrderResult(
-                order_id=order_id,
-                status="error",
-                error_message=str(e),
-            )
-
-    # Should not reach here
-    return OrderResult(status="error", error_message="Unexpected end of loop")
+async def _get_current_asks(client: KalshiClient, ticker: str) -> tuple[int, int]:
+    """Return (yes_ask, no_ask) in cents, preferring the live stream over a REST poll."""
+    quote = await get_streamed_quote(ticker, timeout=_STREAM_QUOTE_TIMEOUT_SECONDS)
+    if quote is not None and (quote.yes_ask or quote.no_ask):
+        return quote.yes_ask, quote.no_ask
+    market = await client.get_market(ticker)
+    return market.yes_ask, market.no_ask
 
 
 _agent_factory: AgentFactory[TraderDependencies, TraderOutput] | None = None
@@ -309,7 +117,10 @@ async def run_trader(
     if settings is None:
         settings = get_settings()
 
-    opportunity = await load_opportunity_from_db(opportunity_id)
+    record = await load_opportunity_record_from_db(opportunity_id)
+    if record is None:
+        raise ValueError(f"Opportunity {opportunity_id} not found in DB")
+    opportunity = record.signal
 
     if not opportunity.recommendation_completed_at:
         raise ValueError(f"Recommendation not completed for {opportunity_id}")
@@ -344,13 +155,13 @@ async def run_trader(
                 config=settings,
             )
 
-            markdown_body = await get_opportunity_body_from_db(opportunity_id)
-            prompt = await build_trader_prompt(opportunity, markdown_body, settings)
+            async with unit_of_work():
+                prompt = await build_trader_prompt(opportunity, record.body, settings)
 
             with logfire.span("agent decision", ticker=opportunity.market_ticker):
-                agent = get_agent(settings)
-                result = await agent.run(prompt, deps=deps)
-                output: TraderOutput = result.output
+                output: TraderOutput = await run_cached(
+                    get_agent(settings), prompt, name="trader", deps=deps, settings=settings
+                )
                 logfire.info("Decision made", action=output.decision.action)
 
             if output.decision.action == "REJECT":
@@ -391,6 +202,26 @@ async def run_trader(
         return output
 
 
+async def _get_entry_asks(
+    client: KalshiClient,
+    ticker: str,
+    side: str,
+    depth: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Ask ladder for buying ``side``, preferring the streamed book over a REST read.
+
+    Returns empty arrays when neither can be read.
+    """
+    book = await get_streamed_book(ticker, timeout=_STREAM_QUOTE_TIMEOUT_SECONDS)
+    if book is None:
+        try:
+            book = await client.get_orderbook(ticker, depth=depth)
+        except Exception as e:
+            logger.warning("Orderbook read failed for %s, planning from top of book: %s", ticker, e)
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return book.asks(side)
+
+
 async def _execute_trade(
     client: KalshiClient,
     opportunity: OpportunitySignal,
@@ -402,13 +233,20 @@ async def _execute_trade(
 ) -> TraderOutput:
     """Run slippage check, then execute or skip the trade. Returns updated output."""
     max_contracts = settings.trading.contracts
+    max_slippage = settings.execution.max_slippage_pct
 
     with logfire.span("slippage check", ticker=opportunity.market_ticker):
-        market = await client.get_market(opportunity.market_ticker)
-        if side == "yes":
-            current_price_decimal = market.yes_ask / 100
+        ask_prices, ask_sizes = await _get_entry_asks(
+            client, opportunity.market_ticker, side, settings.execution.orderbook_depth
+        )
+        if ask_prices.size:
+            current_price_decimal = int(ask_prices[0]) / 100
         else:
-            current_price_decimal = market.no_ask / 100
+            yes_ask, no_ask = await _get_current_asks(client, opportunity.market_ticker)
+            if side == "yes":
+                current_price_decimal = yes_ask / 100
+            else:
+                current_price_decimal = no_ask / 100
         if target_price > 0:
             slippage_pct = abs(current_price_decimal - target_price) / target_price
         else:
@@ -419,7 +257,6 @@ async def _execute_trade(
             current_price=round(current_price_decimal, 4),
         )
 
-    max_slippage = settings.execution.max_slippage_pct
     if slippage_pct > max_slippage:
         logfire.warn("Slippage too high", slippage_pct=round(slippage_pct, 4), max_slippage=max_slippage)
         return output.model_copy(update={"execution_status": "rejected"})
@@ -433,51 +270,130 @@ async def _execute_trade(
         )
         return output.model_copy(update={"execution_status": "paper"})
 
-    # Scale contract quantity down to what the account can actually afford.
-    # max_contracts is the desired ceiling (from config); affordable may be lower
-    # if cash is running low. We never go below 1 — if even 1 contract is out of
-    # reach the trade is rejected cleanly rather than sending a $0 order.
-    try:
-        portfolio_state = await load_state_from_db()
-        cash_balance = portfolio_state.portfolio.cash_balance
-    except Exception as e:
-        # Cannot verify available funds — reject rather than risk an unfunded order.
-        logfire.error("Could not load portfolio state for contract sizing; rejecting trade", error=str(e))
-        return output.model_copy(update={"execution_status": "rejected"})
-
-    if current_price_decimal > 0:
-        affordable = int(cash_balance / current_price_decimal)
-        if affordable < 1:
-            logfire.warn(
-                "Insufficient cash to buy even one contract; rejecting trade",
-                cash_balance=round(cash_balance, 2),
-                price_per_contract=round(current_price_decimal, 4),
-            )
+    # Size against book depth first: the largest order whose volume-weighted
+    # price stays within max_slippage_pct of the target, limited at the
+    # deepest level it needs. Without depth, fall back to the best ask.
+    desired = max_contracts
+    limit_price_cents = int(current_price_decimal * 100)
+    if ask_prices.size and target_price > 0:
+        plan = plan_entry(ask_prices, ask_sizes, max_contracts, target_price * 100, max_slippage)
+        if plan is None:
+            logfire.warn("No book depth within slippage; rejecting trade", max_slippage=max_slippage)
             return output.model_copy(update={"execution_status": "rejected"})
-        contracts = min(max_contracts, affordable)
-        if contracts < max_contracts:
+        desired = plan.contracts
+        limit_price_cents = plan.limit_price_cents
+        logfire.info(
+            "Entry plan",
+            contracts=plan.contracts,
+            limit_price_cents=plan.limit_price_cents,
+            avg_price=round(plan.avg_price, 4),
+            levels_used=plan.levels_used,
+        )
+        if desired < max_contracts:
             logfire.warn(
-                "Scaling contract size down due to available cash",
+                "Scaling contract size down due to book depth",
                 desired=max_contracts,
-                affordable=affordable,
-                using=contracts,
-                cash_balance=round(cash_balance, 2),
+                using=desired,
+                limit_price_cents=limit_price_cents,
             )
-    else:
-        contracts = max_contracts
+    limit_price_decimal = limit_price_cents / 100
 
-    initial_price_cents = int(current_price_decimal * 100)
+    # Scale contract quantity down to what the account can actually afford.
+    # desired is the depth-limited ceiling; affordable may be lower if cash is
+    # running low. We never go below 1 — if even 1 contract is out of reach
+    # the trade is rejected cleanly rather than sending a $0 order.
+    # Sizing runs under the portfolio lock and reserves the order's cost so
+    # concurrent Traders cannot spend the same cash twice.
+    portfolio_lock = get_portfolio_lock()
+    async with portfolio_lock.hold("sizing"):
+        try:
+            # Cash-sensitive: always read the DB, never the cached summary.
+            portfolio_state = await load_portfolio_summary(max_age_seconds=0)
+            cash_balance = portfolio_lock.available_cash(portfolio_state.portfolio.cash_balance)
+        except Exception as e:
+            # Cannot verify available funds — reject rather than risk an unfunded order.
+            logfire.error("Could not load portfolio state for contract sizing; rejecting trade", error=str(e))
+            return output.model_copy(update={"execution_status": "rejected"})
 
-    with logfire.span("order execution", ticker=opportunity.market_ticker, side=side, contracts_requested=contracts):
-        order_result = await execute_working_order(
-            client=client,
-            ticker=opportunity.market_ticker,
-            side=side,
-            contracts=contracts,
-            initial_price_cents=initial_price_cents,
-            config=settings,
-            shutdown_event=shutdown_event,
-        )
+        if limit_price_decimal > 0:
+            affordable = int(cash_balance / limit_price_decimal)
+            if affordable < 1:
+                logfire.warn(
+                    "Insufficient cash to buy even one contract; rejecting trade",
+                    cash_balance=round(cash_balance, 2),
+                    price_per_contract=round(limit_price_decimal, 4),
+                )
+                return output.model_copy(update={"execution_status": "rejected"})
+            contracts = min(desired, affordable)
+            if contracts < desired:
+                logfire.warn(
+                    "Scaling contract size down due to available cash",
+                    desired=desired,
+                    affordable=affordable,
+                    using=contracts,
+                    cash_balance=round(cash_balance, 2),
+                )
+        else:
+            contracts = desired
+
+        children = split_child_orders(contracts, settings.execution.max_child_contracts)
+        working_orders = [
+            new_working_order(
+                opportunity_id=opportunity.id,
+                ticker=opportunity.market_ticker,
+                side=side,
+                contracts=child,
+                initial_price_cents=limit_price_cents,
+                config=settings,
+                reserved_cash=child * limit_price_decimal,
+            )
+            for child in children
+        ]
+        for working in working_orders:
+            portfolio_lock.reserve(working.id, working.reserved_cash)
+
+    # The order manager releases each child's reservation once it is done.
+    return await _place_and_record(client, opportunity, output, working_orders, shutdown_event=shutdown_event)
+
+
+async def _place_and_record(
+    client: KalshiClient,
+    opportunity: OpportunitySignal,
+    output: TraderOutput,
+    working_orders: list[WorkingOrder],
+    shutdown_event: asyncio.Event | None = None,
+) -> TraderOutput:
+    """Hand the orders to the order manager, or work them here when none is running.
+
+    The manager re-logs the decision and sends the fill alert once its
+    orders finish; ``run_trader`` only records them as ``pending``.
+    """
+    manager = get_order_manager()
+    if manager.running:
+        pending = output.model_copy(update={"execution_status": "pending"})
+        decision = _decision_entry(opportunity, pending)
+        for working in working_orders:
+            handle = await manager.submit(working, decision=decision)
+            logfire.info(
+                "Order submitted",
+                working_order_id=handle.id,
+                ticker=working.market_ticker,
+                side=working.side,
+                contracts_requested=working.contracts,
+            )
+        return pending
+
+    with logfire.span(
+        "order execution",
+        ticker=working_orders[0].market_ticker,
+        side=working_orders[0].side,
+        contracts_requested=sum(w.contracts for w in working_orders),
+        child_orders=len(working_orders),
+    ):
+        order_result = combine_order_results(await asyncio.gather(*(
+            manager.execute(client, working, shutdown_event=shutdown_event)
+            for working in working_orders
+        )))
         logfire.info(
             "Order result",
             status=order_result.status,
@@ -485,7 +401,7 @@ async def _execute_trade(
             fill_price=order_result.fill_price,
         )
 
-    output = output.model_copy(update={
+    return output.model_copy(update={
         "order_id": order_result.order_id,
         "fill_price": order_result.fill_price,
         "contracts_filled": order_result.contracts_filled,
@@ -493,58 +409,6 @@ async def _execute_trade(
         "execution_status": order_result.status,
     })
 
-    if order_result.contracts_filled > 0:
-        position_id = f"pos_{uuid4().hex[:8]}"
-
-        await _update_state_after_trade(
-            opportunity=opportunity,
-            side=side.upper(),
-            contracts=order_result.contracts_filled,
-            fill_price=order_result.fill_price or current_price_decimal,
-            total_cost=order_result.total_cost_usd,
-            config=settings,
-            position_id=position_id,
-        )
-
-        trade = TradeExecution(
-            id=generate_trade_id(),
-            position_id=position_id,
-            opportunity_id=opportunity.id,
-            market_ticker=opportunity.market_ticker,
-            side=side.upper(),
-            action="BUY",
-            contracts=order_result.contracts_filled,
-            price=order_result.fill_price or current_price_decimal,
-            total=order_result.total_cost_usd,
-            paper=False,
-            executed_at=datetime.now(timezone.utc),
-        )
-        try:
-            await save_trade_to_db(trade)
-        except Exception as e:
-            logfire.error("DB write failed for trade", trade_id=trade.id, error=str(e))
-
-        if order_result.fill_price:
-            fill_price_rounded = round(order_result.fill_price, 4)
-        else:
-            fill_price_rounded = None
-
-        if order_result.total_cost_usd:
-            total_cost_rounded = round(order_result.total_cost_usd, 2)
-        else:
-            total_cost_rounded = None
-
-        logfire.info(
-            "Trade executed",
-            ticker=opportunity.market_ticker,
-            side=side,
-            contracts=order_result.contracts_filled,
-            fill_price=fill_price_rounded,
-            total_cost_usd=total_cost_rounded,
-        )
-
-    return output
-
 
 _DECISION_LABELS = {
     "REJECT": "REJECTED",
@@ -576,12 +440,8 @@ async def _send_telegram_alert(
         logger.warning("Telegram alert failed (non-fatal): %s", e)
 
 
-async def _log_trader_decision(
-    opportunity: OpportunitySignal,
-    output: TraderOutput,
-) -> None:
-    """Log a trading decision to the persistent decision log."""
-    entry = DecisionEntry(
+def _decision_entry(opportunity: OpportunitySignal, output: TraderOutput) -> DecisionEntry:
+    return DecisionEntry(
         opportunity_id=opportunity.id,
         ticker=opportunity.market_ticker,
         action=output.decision.action,
@@ -591,48 +451,17 @@ async def _log_trader_decision(
         reasoning=output.decision.reasoning,
         tldr=output.tldr,
         execution_status=output.execution_status,
+        order_id=output.order_id,
     )
-    try:
-        await save_decision_to_db(entry)
-    except Exception as e:
-        logfire.error("DB write failed for decision", opportunity_id=opportunity.id, error=str(e))
 
 
-async def _update_state_after_trade(
+async def _log_trader_decision(
     opportunity: OpportunitySignal,
-    side: Literal["YES", "NO"],
-    contracts: int,
-    fill_price: float,
-    total_cost: float,
-    config: Settings,
-    position_id: str,
+    output: TraderOutput,
 ) -> None:
-    """Update DB portfolio with new position and adjusted balances."""
-    state = await load_state_from_db()
-
-    new_cash = state.portfolio.cash_balance - total_cost
-    new_positions_value = state.portfolio.positions_value + total_cost
-    position = Position(
-        id=position_id,
-        market_ticker=opportunity.market_ticker,
-        side=side,
-        contracts=contracts,
-        average_entry=fill_price,
-        current_price=fill_price,
-        opportunity_id=opportunity.id,
-    )
+    """Log a trading decision to the persistent decision log."""
+    entry = _decision_entry(opportunity, output)
     try:
-        await update_portfolio_after_trade_in_db(
-            position=position,
-            cash_balance=new_cash,
-            positions_value=new_positions_value,
-            total_value=new_cash + new_positions_value,
-        )
+        await save_decision_to_db(entry)
     except Exception as e:
-        logfire.error("DB write failed for portfolio update", opportunity_id=opportunity.id, error=str(e))
-
-    logger.info(
-        "Updated state: cash=$%.2f, positions=%d",
-        new_cash,
-        len(state.open_positions) + 1,
-    )
+        logfire.error("DB write failed for decision", opportunity_id=opportunity.id, error=str(e))
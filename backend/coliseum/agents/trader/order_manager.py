@@ -0,0 +1,441 @@
+"""Background owner of the Trader's working orders.
+
+While the daemon runs, ``run_trader`` hands each buy to the ``OrderManager``
+and returns with ``execution_status="pending"`` instead of holding its
+pipeline worker until the order is filled or given up on. The manager works
+every order on its own task (see ``execution.work_order``), then records the
+fill: portfolio update, trade row, Guardian wake-up. When the last order of
+an opportunity finishes, the manager writes a follow-up decision entry with
+the final status, fills and order id (superseding the ``pending`` one the
+Trader logged) and sends the fill alert.
+
+Each order is checkpointed to the ``working_orders`` table on submission,
+placement and every reprice. On start the manager reloads orders still
+marked ``working``, re-reserves their cash and resumes them; on shutdown it
+leaves them resting on the exchange for the next process. The row is marked
+terminal before the fill is recorded, so a crash in between can only miss a
+position (which the Guardian's Kalshi sync restores), never book it twice.
+
+Outside the daemon (CLI commands, tests) the manager isn't started and
+``execute`` works the order in the foreground, as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+from datetime import datetime, timezone
+
+import logfire
+
+from coliseum.agents.guardian.scheduler import get_guardian_scheduler
+from coliseum.agents.trader.execution import combine_order_results, work_order
+from coliseum.agents.trader.models import OrderResult
+from coliseum.agents.trader.portfolio_lock import get_portfolio_lock
+from coliseum.config import Settings, get_settings
+from coliseum.domain.portfolio import Position
+from coliseum.domain.trade import TradeExecution, generate_trade_id
+from coliseum.domain.working_order import WorkingOrder
+from coliseum.memory.decisions import DecisionEntry
+from coliseum.services.kalshi.client import KalshiClient
+from coliseum.services.supabase.db import unit_of_work
+from coliseum.services.supabase.repositories.decisions import (
+    load_latest_decision_from_db,
+    save_decision_to_db,
+)
+from coliseum.services.supabase.repositories.portfolio import (
+    load_portfolio_summary,
+    update_portfolio_after_trade_in_db,
+)
+from coliseum.services.supabase.repositories.trades import save_trade_to_db
+from coliseum.services.supabase.repositories.working_orders import (
+    load_open_working_orders_from_db,
+    load_working_orders_for_opportunity_from_db,
+    save_working_order_to_db,
+)
+from coliseum.services.telegram import create_telegram_client
+
+logger = logging.getLogger(__name__)
+
+_TERMINAL_STATUSES = ("filled", "partial", "cancelled", "rejected", "error")
+
+
+class OrderHandle:
+    """A submitted order; ``await handle.result()`` for its final outcome."""
+
+    def __init__(self, order: WorkingOrder, future: asyncio.Future[OrderResult]):
+        self.order = order
+        self._future = future
+
+    @property
+    def id(self) -> str:
+        return self.order.id
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    async def result(self) -> OrderResult:
+        """Wait for the order to finish; raises CancelledError if shutdown interrupted it."""
+        return await asyncio.shield(self._future)
+
+
+class OrderManager:
+    """Works submitted orders in the background and resumes them across restarts."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._client: KalshiClient | None = None
+        self._stopping: asyncio.Event | None = None
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._handles: dict[str, OrderHandle] = {}
+        # Per opportunity: orders still being worked, results of the finished
+        # ones, and the Trader decision to settle once all are done.
+        self._open: dict[str, set[str]] = {}
+        self._results: dict[str, dict[str, OrderResult]] = {}
+        self._decisions: dict[str, DecisionEntry] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._client is not None
+
+    def __len__(self) -> int:
+        """Number of orders currently being worked."""
+        return len(self._tasks)
+
+    def get(self, working_order_id: str) -> OrderHandle | None:
+        return self._handles.get(working_order_id)
+
+    async def start(self, client: KalshiClient) -> None:
+        """Resume orders left working by a previous process, then accept submissions."""
+        if self.running:
+            return
+        self._client = client
+        self._stopping = asyncio.Event()
+        resumed = await load_open_working_orders_from_db()
+        for order in resumed:
+            get_portfolio_lock().reserve(order.id, order.reserved_cash)
+            if order.order_id is not None:
+                get_portfolio_lock().placed(order.id, order.updated_at)
+            self._spawn(order, resume=True)
+        logger.info("OrderManager started (%d working orders resumed)", len(resumed))
+
+    async def close(self) -> None:
+        """Stop working orders; they stay resting and are resumed on the next start."""
+        if not self.running:
+            return
+        self._stopping.set()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._client = None
+        logger.info("OrderManager stopped")
+
+    async def submit(self, order: WorkingOrder, decision: DecisionEntry | None = None) -> OrderHandle:
+        """Persist ``order`` and start working it; takes over its cash reservation.
+
+        ``decision`` is the Trader's ``pending`` entry, re-logged with the
+        outcome once every order of the opportunity has finished.
+        """
+        if not self.running:
+            get_portfolio_lock().release(order.id)
+            raise RuntimeError("OrderManager is not running")
+        try:
+            await self._checkpoint(order)
+        except Exception:
+            get_portfolio_lock().release(order.id)
+            raise
+        if decision is not None:
+            self._decisions.setdefault(order.opportunity_id, decision)
+        return self._spawn(order, resume=False)
+
+    async def execute(
+        self,
+        client: KalshiClient,
+        order: WorkingOrder,
+        shutdown_event: asyncio.Event | None = None,
+    ) -> OrderResult:
+        """Work ``order`` in the foreground and record its fill (no persistence)."""
+        try:
+            result = await work_order(client, order, self.settings, shutdown_event=shutdown_event)
+            if result is None:
+                result = OrderResult(order_id=order.order_id, status="cancelled")
+            _apply_result(order, result)
+            await record_order_fill(order, result, self.settings)
+            return result
+        finally:
+            get_portfolio_lock().release(order.id)
+
+    def _spawn(self, order: WorkingOrder, resume: bool) -> OrderHandle:
+        future: asyncio.Future[OrderResult] = asyncio.get_running_loop().create_future()
+        handle = OrderHandle(order, future)
+        # Orders outlive the pipeline cycle that submitted them; don't inherit
+        # its context (per-cycle caches, the Trader's logfire span).
+        task = asyncio.create_task(
+            self._run(order, resume, future),
+            name=f"working-order-{order.id}",
+            context=contextvars.Context(),
+        )
+        self._tasks[order.id] = task
+        self._handles[order.id] = handle
+        self._open.setdefault(order.opportunity_id, set()).add(order.id)
+        return handle
+
+    async def _run(self, order: WorkingOrder, resume: bool, future: asyncio.Future[OrderResult]) -> None:
+        # Shutdown and cancellation leave ``finished`` unset: the order stays
+        # working for the next process to resume, so its decision isn't settled.
+        error: str | None = None
+        finished = False
+        try:
+            with logfire.span(
+                "order execution",
+                ticker=order.market_ticker,
+                side=order.side,
+                contracts_requested=order.contracts,
+                working_order_id=order.id,
+                resumed=resume,
+            ):
+                result = await work_order(
+                    self._client,
+                    order,
+                    self.settings,
+                    shutdown_event=self._stopping,
+                    checkpoint=self._checkpoint,
+                    resume=resume,
+                )
+                if result is None:
+                    future.cancel()
+                    return
+                finished = True
+                logfire.info(
+                    "Order result",
+                    status=result.status,
+                    contracts_filled=result.contracts_filled,
+                    fill_price=result.fill_price,
+                )
+
+                _apply_result(order, result)
+                self._results.setdefault(order.opportunity_id, {})[order.id] = result
+                try:
+                    await self._checkpoint(order)
+                except Exception as e:
+                    logfire.error("DB write failed for working order", working_order_id=order.id, error=str(e))
+                await record_order_fill(order, result, self.settings)
+                future.set_result(result)
+        except Exception as e:
+            logger.error("Working order %s failed: %s", order.id, e)
+            error = str(e)
+            finished = True
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            get_portfolio_lock().release(order.id)
+            self._tasks.pop(order.id, None)
+            self._handles.pop(order.id, None)
+            if self._finish(order) and finished:
+                await self._settle(order, error)
+
+    def _finish(self, order: WorkingOrder) -> bool:
+        """Mark ``order`` done; True for the last open order of its opportunity."""
+        remaining = self._open.get(order.opportunity_id)
+        if remaining is None or order.id not in remaining:
+            return False
+        remaining.discard(order.id)
+        if remaining:
+            return False
+        del self._open[order.opportunity_id]
+        return True
+
+    async def _settle(self, order: WorkingOrder, error: str | None = None) -> None:
+        """Log the opportunity's final order outcome and send the fill alert."""
+        opportunity_id = order.opportunity_id
+        results = self._results.pop(opportunity_id, {})
+        if order.id not in results:
+            results[order.id] = OrderResult(
+                order_id=order.order_id,
+                status="error",
+                error_message=error,
+            )
+        decision = self._decisions.pop(opportunity_id, None)
+        try:
+            # Orders finished by an earlier process are only in the DB.
+            for row in await load_working_orders_for_opportunity_from_db(opportunity_id):
+                if row.id not in results and row.status in _TERMINAL_STATUSES:
+                    results[row.id] = OrderResult(
+                        order_id=row.order_id,
+                        fill_price=row.fill_price,
+                        contracts_filled=row.contracts_filled,
+                        total_cost_usd=row.total_cost_usd,
+                        status=row.status,
+                        error_message=row.error_message,
+                    )
+            if decision is None:
+                decision = await load_latest_decision_from_db(opportunity_id)
+        except Exception as e:
+            logfire.error("DB read failed while settling orders", opportunity_id=opportunity_id, error=str(e))
+        if decision is None:
+            decision = DecisionEntry(
+                opportunity_id=opportunity_id,
+                ticker=order.market_ticker,
+                action=f"EXECUTE_BUY_{order.side.upper()}",
+            )
+
+        result = combine_order_results(list(results.values()))
+        entry = decision.model_copy(update={
+            "ts": datetime.now(timezone.utc),
+            "price": result.fill_price or decision.price,
+            "contracts": result.contracts_filled,
+            "execution_status": result.status,
+            "order_id": result.order_id,
+        })
+        try:
+            await save_decision_to_db(entry)
+        except Exception as e:
+            logfire.error("DB write failed for decision", opportunity_id=opportunity_id, error=str(e))
+        await send_order_alert(entry, result, self.settings)
+
+    async def _checkpoint(self, order: WorkingOrder) -> None:
+        order.updated_at = datetime.now(timezone.utc)
+        if order.order_id is not None:
+            get_portfolio_lock().placed(order.id, order.updated_at)
+        await save_working_order_to_db(order)
+
+
+def _apply_result(order: WorkingOrder, result: OrderResult) -> None:
+    order.status = result.status
+    order.order_id = result.order_id or order.order_id
+    order.contracts_filled = result.contracts_filled
+    order.fill_price = result.fill_price
+    order.total_cost_usd = result.total_cost_usd
+    order.error_message = result.error_message
+
+
+async def record_order_fill(order: WorkingOrder, result: OrderResult, settings: Settings) -> None:
+    """Book a filled (or partly filled) order: portfolio, trade row, Guardian wake-up."""
+    if result.contracts_filled <= 0:
+        return
+
+    position_id = f"pos_{order.id.removeprefix('wo_')}"
+    fill_price = result.fill_price or order.price_cents / 100
+
+    async with get_portfolio_lock().hold("portfolio_update"), unit_of_work():
+        await _update_state_after_trade(
+            order=order,
+            contracts=result.contracts_filled,
+            fill_price=fill_price,
+            total_cost=result.total_cost_usd,
+            position_id=position_id,
+        )
+
+    # Let the Guardian start watching the new position right away.
+    get_guardian_scheduler().wake("trade_fill")
+
+    trade = TradeExecution(
+        id=generate_trade_id(),
+        position_id=position_id,
+        opportunity_id=order.opportunity_id,
+        market_ticker=order.market_ticker,
+        side=order.side.upper(),
+        action="BUY",
+        contracts=result.contracts_filled,
+        price=fill_price,
+        total=result.total_cost_usd,
+        paper=False,
+        executed_at=datetime.now(timezone.utc),
+    )
+    try:
+        await save_trade_to_db(trade)
+    except Exception as e:
+        logfire.error("DB write failed for trade", trade_id=trade.id, error=str(e))
+
+    if result.fill_price:
+        fill_price_rounded = round(result.fill_price, 4)
+    else:
+        fill_price_rounded = None
+
+    if result.total_cost_usd:
+        total_cost_rounded = round(result.total_cost_usd, 2)
+    else:
+        total_cost_rounded = None
+
+    logfire.info(
+        "Trade executed",
+        ticker=order.market_ticker,
+        side=order.side,
+        contracts=result.contracts_filled,
+        fill_price=fill_price_rounded,
+        total_cost_usd=total_cost_rounded,
+    )
+
+
+async def send_order_alert(entry: DecisionEntry, result: OrderResult, settings: Settings) -> None:
+    """Telegram alert for a finished order (non-fatal on failure)."""
+    if not settings.telegram_send_alerts:
+        return
+    if result.contracts_filled > 0:
+        fill_line = (
+            f"{result.contracts_filled} contracts @ {(result.fill_price or 0) * 100:.0f}c "
+            f"(${result.total_cost_usd:.2f})"
+        )
+    else:
+        fill_line = "No contracts filled"
+    message = (
+        f"ORDER {result.status.upper()}\n\n"
+        f"{entry.ticker}\n"
+        f"{entry.action}\n\n"
+        f"{fill_line}"
+    )
+    try:
+        async with create_telegram_client(
+            bot_token=settings.telegram_bot_token,
+            chat_id=settings.telegram_chat_id,
+        ) as telegram_client:
+            await telegram_client.send_alert(message)
+    except Exception as e:
+        logger.warning("Telegram alert failed (non-fatal): %s", e)
+
+
+async def _update_state_after_trade(
+    order: WorkingOrder,
+    contracts: int,
+    fill_price: float,
+    total_cost: float,
+    position_id: str,
+) -> None:
+    """Update DB portfolio with new position and adjusted balances."""
+    state = await load_portfolio_summary(max_age_seconds=0)
+    new_cash = state.portfolio.cash_balance - total_cost
+    new_positions_value = state.portfolio.positions_value + total_cost
+    position = Position(
+        id=position_id,
+        market_ticker=order.market_ticker,
+        side=order.side.upper(),
+        contracts=contracts,
+        average_entry=fill_price,
+        current_price=fill_price,
+        opportunity_id=order.opportunity_id,
+    )
+    try:
+        await update_portfolio_after_trade_in_db(
+            position=position,
+            cash_balance=new_cash,
+            positions_value=new_positions_value,
+            total_value=new_cash + new_positions_value,
+        )
+    except Exception as e:
+        logfire.error("DB write failed for portfolio update", opportunity_id=order.opportunity_id, error=str(e))
+
+    logger.info(
+        "Updated state: cash=$%.2f, positions=%d",
+        new_cash,
+        len(state.open_positions) + 1,
+    )
+
+
+_order_manager: OrderManager | None = None
+
+
+def get_order_manager() -> OrderManager:
+    """Return the process-wide order manager, configured from Settings."""
+    global _order_manager
+    if _order_manager is None:
+        _order_manager = OrderManager(get_settings())
+    return _order_manager
@@ -0,0 +1,105 @@
+"""Portfolio lock and cash reservations shared by concurrent Trader runs.
+
+The pipeline runs several opportunities at once, so two Traders can size
+orders against the same cash balance or interleave the read-modify-write that
+books a fill. Sizing and portfolio writes happen under one lock; cash
+committed to an order that is still working is held as a reservation so the
+next Trader sizes against what is actually left.
+
+Once an order rests on Kalshi the exchange holds its collateral, and the next
+Guardian sync writes a ``cash_balance`` that already excludes it. From then
+on the reservation no longer counts against available cash; it is dropped
+when the order manager finishes the order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+
+import logfire
+
+_lock_wait_histogram = logfire.metric_histogram(
+    "trader.portfolio_lock.wait",
+    unit="s",
+    description="Time a Trader spent waiting for the portfolio lock",
+)
+
+
+@dataclass
+class _Reservation:
+    amount: float
+    placed_at: datetime | None = None
+    # True once a synced cash balance fetched after placement excludes it.
+    covered: bool = False
+
+
+class PortfolioLock:
+    """Async lock over portfolio sizing/writes plus per-order cash reservations."""
+
+    def __init__(self) -> None:
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reservations: dict[str, _Reservation] = {}
+
+    def _bind_loop(self) -> asyncio.Lock:
+        # Each CLI command runs under its own asyncio.run(); a lock contended on
+        # a finished loop can't be reused, so start fresh on a new loop.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._reservations = {}
+        return self._lock
+
+    @asynccontextmanager
+    async def hold(self, reason: str) -> AsyncIterator[float]:
+        """Hold the lock; yields the seconds spent waiting for it."""
+        lock = self._bind_loop()
+        started = time.monotonic()
+        async with lock:
+            waited = time.monotonic() - started
+            _lock_wait_histogram.record(waited, attributes={"reason": reason})
+            yield waited
+
+    @property
+    def reserved_cash(self) -> float:
+        """Reserved cash the synced balance doesn't account for yet."""
+        return sum(r.amount for r in self._reservations.values() if not r.covered)
+
+    def available_cash(self, cash_balance: float) -> float:
+        """Cash not already committed to a working order."""
+        return max(0.0, cash_balance - self.reserved_cash)
+
+    def reserve(self, key: str, amount: float) -> None:
+        """Hold ``amount`` for the working order ``key`` until it is released."""
+        self._bind_loop()
+        self._reservations[key] = _Reservation(amount)
+
+    def placed(self, key: str, at: datetime) -> None:
+        """Record when Kalshi accepted the order (first call wins)."""
+        reservation = self._reservations.get(key)
+        if reservation is not None and reservation.placed_at is None:
+            reservation.placed_at = at
+
+    def balance_synced(self, as_of: datetime) -> None:
+        """A Kalshi balance fetched at ``as_of`` is now the stored cash balance."""
+        for reservation in self._reservations.values():
+            if reservation.placed_at is not None and reservation.placed_at <= as_of:
+                reservation.covered = True
+
+    def release(self, key: str) -> None:
+        self._bind_loop()
+        self._reservations.pop(key, None)
+
+
+_portfolio_lock = PortfolioLock()
+
+
+def get_portfolio_lock() -> PortfolioLock:
+    """Return the process-wide portfolio lock."""
+    return _portfolio_lock
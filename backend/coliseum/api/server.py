@@ -31,11 +31,10 @@ from coliseum.domain.portfolio import Position
 from coliseum.observability import initialize_logfire
 from coliseum.pipeline import run_pipeline
 from coliseum.services.supabase.repositories.opportunities import (
-    get_opportunity_body_from_db,
     list_opportunities_from_db,
-    load_opportunity_from_db,
+    load_opportunity_record_from_db,
 )
-from coliseum.services.supabase.repositories.portfolio import load_state_from_db
+from coliseum.services.supabase.repositories.portfolio import load_portfolio_summary
 from coliseum.services.supabase.repositories.portfolio_snapshots import (
     list_portfolio_snapshots_from_db,
 )
@@ -196,7 +195,7 @@ async def _build_config() -> dict[str, Any]:
 
 
 async def _build_state() -> dict[str, Any]:
-    state = await load_state_from_db()
+    state = await load_portfolio_summary()
     enriched = [_enrich_position(p) for p in state.open_positions]
     return {
         "portfolio": {
@@ -259,7 +258,7 @@ async def _build_chart() -> dict[str, Any]:
 
     if not snapshots:
         try:
-            state = await load_state_from_db()
+            state = await load_portfolio_summary()
             current_nav = round(float(state.portfolio.total_value), 2)
         except Exception:
             current_nav = 0.0
@@ -357,13 +356,13 @@ async def list_opportunities():
 @router.get("/api/opportunities/{opportunity_id}")
 async def get_opportunity(opportunity_id: str):
     """Get full opportunity detail including markdown body."""
-    try:
-        opp = await load_opportunity_from_db(opportunity_id)
-    except ValueError:
+    record = await load_opportunity_record_from_db(opportunity_id)
+    if record is None:
         raise HTTPException(
             status_code=404, detail=f"Opportunity {opportunity_id} not found"
         )
-    markdown_body = await get_opportunity_body_from_db(opportunity_id)
+    opp = record.signal
+    markdown_body = record.body
     return {
         "summary": {
             "id": opp.id,
@@ -19,6 +19,18 @@ class LlmConfig(BaseModel):
     """LLM provider selection."""
 
     provider: Literal["openai", "xai"] = "openai"
+    # Agent outputs are cached by prompt fingerprint (agents/response_cache.py)
+    # so pipeline retries and CLI reruns reuse them. Agents missing from the
+    # TTL map, or mapped to 0, always call the model.
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: dict[str, int] = Field(
+        default_factory=lambda: {
+            "researcher": 7200,
+            "recommender": 7200,
+            "trader": 600,
+            "scribe": 3600,
+        }
+    )
 
 
 class TradingConfig(BaseModel):
@@ -38,6 +50,15 @@ class ScoutConfig(BaseModel):
     max_spread_cents: int = 3
     min_volume: int = 5000
     market_fetch_limit: int = 10000
+    # "markets": paginate markets, then resolve event metadata per event.
+    # "events": paginate events with nested markets (no per-event fan-out).
+    prefetch_mode: Literal["markets", "events"] = "markets"
+    event_metadata_ttl_hours: int = 168
+    event_metadata_cache_size: int = 20000
+    # Tickers first seen longer ago than this are treated as unseen again.
+    seen_ticker_ttl_days: int = Field(default=14, ge=1)
+    seen_ticker_bloom_error_rate: float = Field(default=0.001, gt=0, lt=1)
+    seen_ticker_snapshot_path: Path = Path(".spool/seen_tickers.bloom")
 
 
 class GuardianConfig(BaseModel):
@@ -47,16 +68,31 @@ class GuardianConfig(BaseModel):
     window_threshold_price: float = 0.85
     window_minutes: int = 15
     sell_aggression_cents: int = 2
+    # Adaptive loop timing; see agents/guardian/scheduler.py.
+    poll_fast_seconds: float = 5.0
+    poll_normal_seconds: float = 15.0
+    poll_max_seconds: float = 120.0
+    fast_poll_price_margin: float = 0.05
+    fast_poll_lead_minutes: int = 10
 
 
 class ExecutionConfig(BaseModel):
     """Order execution and slippage parameters."""
 
     max_slippage_pct: float = 0.05
-    order_check_interval_seconds: int = 120
+    # Time an order rests at one price before it is repriced.
+    reprice_interval_seconds: float = 120.0
+    # Order status is polled at the min interval right after placement or a
+    # fill event, backing off to the max while nothing happens.
+    status_poll_min_seconds: float = 1.0
+    status_poll_max_seconds: float = 10.0
     max_reprice_attempts: int = 3
     reprice_aggression: float = 0.02
     min_fill_pct_to_keep: float = 0.25
+    # Orderbook levels read when sizing an entry against depth.
+    orderbook_depth: int = 20
+    # Split an entry into child orders of at most this many contracts (0 = one order).
+    max_child_contracts: int = 0
     max_order_age_minutes: int = 60
 
 
@@ -67,6 +103,37 @@ class DaemonConfig(BaseModel):
     max_consecutive_failures: int = 5
 
 
+class DatabaseConfig(BaseModel):
+    """Postgres connection pooling parameters."""
+
+    # "null": open a fresh connection per session (no idle connections held).
+    # "queue": bounded pool reused across sessions, reaped when idle.
+    pool_mode: Literal["null", "queue"] = "null"
+    pool_size: int = Field(default=3, ge=1)
+    max_overflow: int = Field(default=2, ge=0)
+    pool_timeout_seconds: float = 30.0
+    pool_recycle_seconds: int = 1800
+    # Close pooled connections after this long with no session open, so the
+    # daemon doesn't hold Supavisor slots between heartbeat cycles.
+    pool_idle_timeout_seconds: float = 300.0
+    # Portfolio summary reads are served from memory when younger than this;
+    # this process's own portfolio writes update the cached copy directly.
+    portfolio_cache_max_age_seconds: float = 30.0
+    # Telemetry rows (decisions, run cycles, snapshots, seen tickers) are
+    # buffered by the daemon and flushed in batches; see write_behind.py.
+    write_behind_batch_size: int = Field(default=100, ge=1)
+    write_behind_flush_seconds: float = 5.0
+    write_behind_spool_path: Path = Path(".spool/telemetry.jsonl")
+    write_behind_max_spool_rows: int = Field(default=50_000, ge=1)
+
+
+class PipelineConfig(BaseModel):
+    """Pipeline cycle scheduling parameters."""
+
+    # Opportunities whose Analyst -> Trader chains run concurrently.
+    opportunity_workers: int = Field(default=3, ge=1)
+
+
 class MarketContextConfig(BaseModel):
     """Market context encyclopedia refresh parameters."""
 
@@ -121,6 +188,8 @@ class Settings(BaseSettings):
     guardian: GuardianConfig = Field(default_factory=GuardianConfig)
     execution: ExecutionConfig = Field(default_factory=ExecutionConfig)
     daemon: DaemonConfig = Field(default_factory=DaemonConfig)
+    pipeline: PipelineConfig = Field(default_factory=PipelineConfig)
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     market_context: MarketContextConfig = Field(default_factory=MarketContextConfig)
     dashboard_display: DashboardDisplayConfig = Field(default_factory=DashboardDisplayConfig)
 
@@ -182,6 +251,8 @@ class Settings(BaseSettings):
                 "guardian",
                 "execution",
                 "daemon",
+                "pipeline",
+                "database",
                 "market_context",
                 "dashboard_display",
             ]:
@@ -3,22 +3,25 @@
 import asyncio
 import logging
 import signal
+from contextlib import AsyncExitStack
 from datetime import datetime, timezone
 
 import logfire
 
 from coliseum.agents.markets_context.refresher import refresh_all_categories
 from coliseum.agents.guardian import run_guardian
+from coliseum.agents.guardian.scheduler import get_guardian_scheduler
+from coliseum.agents.trader.order_manager import get_order_manager
 from coliseum.config import Settings
 from coliseum.pipeline import run_pipeline
+from coliseum.services.kalshi import KalshiClient, KalshiConfig, KalshiMarketStream, KalshiTradingAuth
+from coliseum.services.kalshi.stream import set_market_stream
+from coliseum.services.supabase.write_behind import get_write_behind
 from coliseum.services.telegram import TelegramClient
 
 logger = logging.getLogger("coliseum.daemon")
 
 
-GUARDIAN_COOLDOWN_SECONDS = 15
-
-
 class ColiseumDaemon:
     """Long-lived autonomous trading daemon."""
 
@@ -44,20 +47,68 @@ class ColiseumDaemon:
             self._install_signal_handlers()
 
         logger.info(
-            "Daemon starting — heartbeat=%dm, guardian_cooldown=%ds, max_failures=%d",
+            "Daemon starting — heartbeat=%dm, guardian_poll=%g-%gs, max_failures=%d",
             self.settings.daemon.heartbeat_interval_minutes,
-            GUARDIAN_COOLDOWN_SECONDS,
+            self.settings.guardian.poll_fast_seconds,
+            self.settings.guardian.poll_max_seconds,
             self.settings.daemon.max_consecutive_failures,
         )
 
         try:
-            async with asyncio.TaskGroup() as tg:
-                tg.create_task(self._heartbeat_loop())
-                tg.create_task(self._guardian_loop())
+            async with AsyncExitStack() as stack:
+                # Telemetry writes are batched while the daemon runs; the
+                # callback flushes them after the loops have shut down.
+                write_behind = get_write_behind()
+                await write_behind.start()
+                stack.push_async_callback(write_behind.close)
+
+                stream = self._build_market_stream()
+                if stream is not None:
+                    await stack.enter_async_context(stream)
+                    set_market_stream(stream)
+                    stack.callback(set_market_stream, None)
+
+                # Working orders outlive pipeline cycles; the manager resumes
+                # any left by a previous run and leaves them resting on exit.
+                order_client = self._build_order_client()
+                if order_client is not None:
+                    await stack.enter_async_context(order_client)
+                    order_manager = get_order_manager()
+                    await order_manager.start(order_client)
+                    stack.push_async_callback(order_manager.close)
+
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self._heartbeat_loop())
+                    tg.create_task(self._guardian_loop())
         finally:
             self.running = False
             logger.info("Daemon stopped. Cycles completed: %d", self._cycle_count)
 
+    def _build_market_stream(self) -> KalshiMarketStream | None:
+        """Create the shared market-data stream; live mode only (the WS feed requires auth)."""
+        if self.settings.trading.paper_mode:
+            return None
+        private_key_pem = self.settings.get_rsa_private_key()
+        if not self.settings.kalshi_api_key or not private_key_pem:
+            logger.warning("Market stream disabled: Kalshi credentials not configured")
+            return None
+        auth = KalshiTradingAuth(self.settings.kalshi_api_key, private_key_pem)
+        return KalshiMarketStream(config=KalshiConfig(), auth=auth)
+
+    def _build_order_client(self) -> KalshiClient | None:
+        """Create the order manager's Kalshi client; live mode only (paper mode places no orders)."""
+        if self.settings.trading.paper_mode:
+            return None
+        private_key_pem = self.settings.get_rsa_private_key()
+        if not self.settings.kalshi_api_key or not private_key_pem:
+            logger.warning("Order manager disabled: Kalshi credentials not configured")
+            return None
+        return KalshiClient(
+            config=KalshiConfig(),
+            api_key=self.settings.kalshi_api_key,
+            private_key_pem=private_key_pem,
+        )
+
     async def _heartbeat_loop(self) -> None:
         """Main loop: run full pipeline cycles on the heartbeat interval."""
         while not self._shutdown_event.is_set():
@@ -140,19 +191,29 @@ class ColiseumDaemon:
             logger.error("Market context refresh failed: %s", e)
 
     async def _guardian_loop(self) -> None:
-        """Continuous guardian loop: run -> cooldown -> run, independent of pipeline cycles."""
+        """Continuous guardian loop, independent of pipeline cycles.
+
+        The delay between runs adapts to the open book and is cut short when
+        the Trader reports a fill; see GuardianScheduler.
+        """
+        scheduler = get_guardian_scheduler()
         while not self._shutdown_event.is_set():
             try:
                 guardian_result = await run_guardian(settings=self.settings)
+                delay = scheduler.next_delay(guardian_result.open_positions)
                 logger.info(
-                    "Guardian complete: synced=%d closed=%d",
+                    "Guardian complete: synced=%d closed=%d next_in=%.0fs",
                     guardian_result.positions_synced,
                     guardian_result.reconciliation.newly_closed,
+                    delay,
                 )
             except Exception as e:
                 logger.error("Guardian failed: %s", e)
+                delay = self.settings.guardian.poll_normal_seconds
 
-            await self._interruptible_sleep(GUARDIAN_COOLDOWN_SECONDS)
+            reason = await scheduler.wait(delay, self._shutdown_event)
+            if reason not in ("timer", "shutdown"):
+                logger.info("Guardian woken early: %s", reason)
 
 
     async def _interruptible_sleep(self, seconds: float) -> None:
@@ -0,0 +1,23 @@
+"""Kalshi fill domain model."""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class Fill(BaseModel):
+    """One execution against our orders, as recorded in the fills ledger.
+
+    ``price`` is the probability price of ``side``. ``action`` is None when
+    Kalshi omits it; such fills count toward both entry and exit averages.
+    """
+
+    fill_id: str
+    order_id: str | None
+    market_ticker: str
+    side: Literal["YES", "NO"]
+    action: Literal["buy", "sell"] | None
+    count: int
+    price: float
+    created_at: datetime
@@ -6,6 +6,7 @@ from decimal import Decimal
 from coliseum.domain.opportunity import OpportunitySignal
 from coliseum.domain.portfolio import ClosedPosition, Position, PortfolioStats, PortfolioState
 from coliseum.domain.trade import TradeClose, TradeExecution
+from coliseum.domain.working_order import WorkingOrder
 from coliseum.services.supabase.models import (
     ClosedPosition as DBClosedPosition,
     OpenPosition as DBOpenPosition,
@@ -14,6 +15,7 @@ from coliseum.services.supabase.models import (
     PortfolioState as DBPortfolioState,
     Trade as DBTrade,
     TradeClose as DBTradeClose,
+    WorkingOrder as DBWorkingOrder,
 )
 
 
@@ -209,6 +211,61 @@ def trade_close_to_db(tc: TradeClose) -> DBTradeClose:
     )
 
 
+def working_order_to_db(order: WorkingOrder) -> DBWorkingOrder:
+    """Convert domain WorkingOrder to DB WorkingOrder row."""
+    if order.fill_price is not None:
+        fill_price = to_decimal(round(order.fill_price, 4))
+    else:
+        fill_price = None
+    return DBWorkingOrder(
+        id=order.id,
+        opportunity_id=order.opportunity_id,
+        market_ticker=order.market_ticker,
+        side=order.side,
+        contracts=order.contracts,
+        client_order_id=order.client_order_id,
+        order_id=order.order_id,
+        price_cents=order.price_cents,
+        reprices_left=order.reprices_left,
+        reprice_at=order.reprice_at,
+        reserved_cash=to_decimal(round(order.reserved_cash, 2)),
+        status=order.status,
+        contracts_filled=order.contracts_filled,
+        fill_price=fill_price,
+        total_cost=to_decimal(round(order.total_cost_usd, 2)),
+        error_message=order.error_message,
+        created_at=order.created_at,
+        updated_at=order.updated_at,
+    )
+
+
+def db_to_working_order(row: DBWorkingOrder) -> WorkingOrder:
+    """Convert DB WorkingOrder row to domain WorkingOrder."""
+    if row.fill_price is not None:
+        fill_price = to_float(row.fill_price)
+    else:
+        fill_price = None
+    return WorkingOrder(
+        id=row.id,
+        opportunity_id=row.opportunity_id,
+        market_ticker=row.market_ticker,
+        side=row.side,
+        contracts=row.contracts,
+        client_order_id=row.client_order_id,
+        order_id=row.order_id,
+        price_cents=row.price_cents,
+        reprices_left=row.reprices_left,
+        reprice_at=row.reprice_at,
+        reserved_cash=to_float(row.reserved_cash),
+        status=row.status,
+        contracts_filled=row.contracts_filled,
+        fill_price=fill_price,
+        total_cost_usd=to_float(row.total_cost),
+        error_message=row.error_message,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
 
 def portfolio_stats_to_db(
     cash_balance: float,
@@ -0,0 +1,47 @@
+"""Working order domain model."""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+from coliseum.domain._utils import generate_prefixed_id
+
+
+class WorkingOrder(BaseModel):
+    """A buy order being worked toward a fill, checkpointed after every change.
+
+    ``price_cents``, ``reprices_left`` and ``reprice_at`` describe where the
+    reprice schedule stands, so a restarted process can pick the order up
+    where it left off. ``order_id`` is None until Kalshi acknowledges the
+    placement; ``client_order_id`` lets a resume find an order whose
+    acknowledgement was lost.
+    """
+
+    id: str
+    opportunity_id: str
+    market_ticker: str
+    side: Literal["yes", "no"]
+    contracts: int
+    client_order_id: str
+    order_id: str | None = None
+    price_cents: int
+    reprices_left: int
+    reprice_at: datetime | None = None
+    reserved_cash: float = 0.0
+    status: Literal["working", "filled", "partial", "cancelled", "rejected", "error"] = "working"
+    contracts_filled: int = 0
+    fill_price: float | None = None
+    total_cost_usd: float = 0.0
+    error_message: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    @property
+    def is_open(self) -> bool:
+        return self.status == "working"
+
+
+def generate_working_order_id() -> str:
+    """Generate unique working order ID."""
+    return generate_prefixed_id("wo")
@@ -6,7 +6,7 @@ from pathlib import Path
 from coliseum.memory.decisions import DecisionEntry
 from coliseum.services.supabase.repositories.decisions import load_recent_decisions_from_db
 from coliseum.services.supabase.repositories.learnings import load_learnings_from_db
-from coliseum.services.supabase.repositories.portfolio import load_state_from_db
+from coliseum.services.supabase.repositories.portfolio import load_portfolio_summary
 from coliseum.domain.portfolio import PortfolioState
 
 logger = logging.getLogger(__name__)
@@ -60,7 +60,7 @@ async def build_scout_context() -> str:
     learnings = "(Learnings unavailable)"
 
     try:
-        state = await load_state_from_db()
+        state = await load_portfolio_summary()
     except Exception as exc:
         logger.warning("build_scout_context: failed to load state: %s", exc)
 
@@ -102,7 +102,7 @@ async def build_analyst_context() -> str:
     learnings = "(Learnings unavailable)"
 
     try:
-        state = await load_state_from_db()
+        state = await load_portfolio_summary()
     except Exception as exc:
         logger.warning("build_analyst_context: failed to load state: %s", exc)
 
@@ -147,7 +147,7 @@ async def build_trader_context() -> str:
     learnings = "(Learnings unavailable)"
 
     try:
-        state = await load_state_from_db()
+        state = await load_portfolio_summary()
     except Exception as exc:
         logger.warning("build_trader_context: failed to load state: %s", exc)
 
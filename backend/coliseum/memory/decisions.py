@@ -18,3 +18,4 @@ class DecisionEntry(BaseModel):
     reasoning: str = ""
     tldr: str = ""
     execution_status: str = ""
+    order_id: str | None = None
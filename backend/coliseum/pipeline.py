@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -13,9 +14,14 @@ from coliseum.agents.analyst import run_analyst
 from coliseum.agents.scout import run_scout
 from coliseum.agents.trader import run_trader
 from coliseum.config import Settings
+from coliseum.domain.opportunity import OpportunitySignal
 from coliseum.memory.journal import JournalCycleSummary
-from coliseum.services.supabase.repositories.opportunities import mark_opportunity_failed_in_db
-from coliseum.services.supabase.repositories.portfolio import load_state_from_db
+from coliseum.services.supabase.db import RoundTripCounter, count_round_trips, unit_of_work
+from coliseum.services.supabase.repositories.opportunities import (
+    mark_opportunity_failed_in_db,
+    opportunity_cycle_cache,
+)
+from coliseum.services.supabase.repositories.portfolio import load_portfolio_summary
 from coliseum.services.supabase.repositories.run_cycles import save_run_cycle_to_db
 
 
@@ -27,6 +33,22 @@ class CycleMetrics:
     scout_found: int = 0
     analyst_results: dict[str, str] = field(default_factory=dict)
     trader_results: dict[str, str] = field(default_factory=dict)
+    # Wall-clock seconds per cycle stage ("scout", "opportunities").
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    # Per-ticker seconds: "queue_wait" for a worker slot, then "analyst" and "trader".
+    opportunity_timings: dict[str, dict[str, float]] = field(default_factory=dict)
+    # Statements issued by this cycle's own tasks, read at finalize.
+    round_trips: RoundTripCounter | None = None
+    db_round_trips: int | None = None
+
+    def stage_timings(self) -> dict | None:
+        """JSON-ready latency breakdown for the run_cycles row."""
+        if not self.stage_seconds and not self.opportunity_timings:
+            return None
+        timings: dict = {"stages": self.stage_seconds, "opportunities": self.opportunity_timings}
+        if self.db_round_trips is not None:
+            timings["db_round_trips"] = self.db_round_trips
+        return timings
 
 logger = logging.getLogger("coliseum.pipeline")
 
@@ -70,7 +92,9 @@ async def run_pipeline(settings: Settings, shutdown_event: asyncio.Event | None
     metrics = CycleMetrics()
     errors: list[str] = []
 
-    with logfire.span("pipeline cycle"):
+    # Analyst and Trader stages reload the same opportunity; share one record per cycle.
+    with logfire.span("pipeline cycle"), opportunity_cycle_cache(), count_round_trips() as round_trips:
+        metrics.round_trips = round_trips
         # Pre-trade cash gate: skip Scout/Analyst/Trader only when the account has
         # less than $1 (i.e. cannot afford even a single contract at any price).
         # Actual contract quantity is scaled down at execution time in the Trader.
@@ -78,7 +102,7 @@ async def run_pipeline(settings: Settings, shutdown_event: asyncio.Event | None
         if not settings.trading.paper_mode:
             min_cash = 1.0  # floor: at least enough for one contract
             try:
-                state = await load_state_from_db()
+                state = await load_portfolio_summary()
                 if state.portfolio.cash_balance < min_cash:
                     logfire.warn(
                         "Insufficient cash for trading cycle; skipping Scout/Analyst/Trader",
@@ -95,15 +119,19 @@ async def run_pipeline(settings: Settings, shutdown_event: asyncio.Event | None
 
         # Step 2: Scout
         with logfire.span("scout"):
+            scout_started = time.monotonic()
             try:
                 scout_output = await run_scout(settings=settings)
             except Exception as e:
                 errors.append(f"Scout: {e}")
                 logfire.error("Scout failed", error=str(e))
                 summary.scout_summary = f"Failed: {e}"
+                metrics.stage_seconds["scout"] = round(time.monotonic() - scout_started, 3)
                 await _finalize_summary(summary, cycle_start, errors, metrics)
                 return summary
 
+            metrics.stage_seconds["scout"] = round(time.monotonic() - scout_started, 3)
+
             if not scout_output or not scout_output.opportunities:
                 if scout_output:
                     metrics.scout_scanned = scout_output.markets_scanned
@@ -135,75 +163,16 @@ async def run_pipeline(settings: Settings, shutdown_event: asyncio.Event | None
             await _finalize_summary(summary, cycle_start, errors, metrics)
             return summary
 
-        analyst_summaries: list[str] = []
-        trader_summaries: list[str] = []
-
-        # Step 3+4: For each opportunity, Analyst then Trader
-        for i, opp in enumerate(opportunities, 1):
-            if _shutdown_requested(shutdown_event):
-                logger.info(
-                    "Shutdown requested, skipping remaining %d/%d opportunities",
-                    total - i + 1,
-                    total,
-                )
-                break
-
-            with logfire.span("opportunity {ticker}", ticker=opp.market_ticker, opportunity_id=opp.id, index=i, total=total):
-                with logfire.span("analyst", opportunity_id=opp.id):
-                    try:
-                        logger.info("Analyst starting for %s (%d/%d)", opp.market_ticker, i, total)
-                        analyzed = await _retry_transient(
-                            run_analyst,
-                            opportunity_id=opp.id,
-                            settings=settings,
-                        )
-                        metrics.analyst_results[opp.market_ticker] = analyzed.status
-                        analyst_summaries.append(f"{opp.market_ticker}: status={analyzed.status}")
-                        logfire.info("Analyst complete", status=analyzed.status)
-                        logger.info("Analyst complete for %s: status=%s", opp.market_ticker, analyzed.status)
-                    except Exception as e:
-                        errors.append(f"Analyst({opp.market_ticker}): {e}")
-                        logfire.error("Analyst failed", error=str(e))
-                        logger.error("Analyst failed for %s: %s", opp.market_ticker, e)
-                        await _mark_opportunity_failed(
-                            opp.id,
-                            failed_stage="analyst",
-                            error_message=str(e),
-                        )
-                        continue
-
-                if _shutdown_requested(shutdown_event):
-                    logger.info("Shutdown requested after Analyst for %s, skipping Trader", opp.market_ticker)
-                    break
-
-                with logfire.span("trader", opportunity_id=opp.id):
-                    try:
-                        trader_output = await _retry_transient(
-                            run_trader,
-                            opportunity_id=opp.id,
-                            settings=settings,
-                            shutdown_event=shutdown_event,
-                        )
-                        metrics.trader_results[opp.market_ticker] = (
-                            f"{trader_output.decision.action} ({trader_output.execution_status})"
-                        )
-                        trader_summaries.append(
-                            f"{opp.market_ticker}: {trader_output.decision.action} "
-                            f"({trader_output.execution_status})"
-                        )
-                        logfire.info(
-                            "Trader complete",
-                            decision=trader_output.decision.action,
-                            status=trader_output.execution_status,
-                        )
-                    except Exception as e:
-                        errors.append(f"Trader({opp.market_ticker}): {e}")
-                        logfire.error("Trader failed", error=str(e))
-                        await _mark_opportunity_failed(
-                            opp.id,
-                            failed_stage="trader",
-                            error_message=str(e),
-                        )
+        # Step 3+4: Analyst then Trader per opportunity, several opportunities at once
+        opportunities_started = time.monotonic()
+        analyst_summaries, trader_summaries = await _process_opportunities(
+            opportunities,
+            settings=settings,
+            shutdown_event=shutdown_event,
+            metrics=metrics,
+            errors=errors,
+        )
+        metrics.stage_seconds["opportunities"] = round(time.monotonic() - opportunities_started, 3)
 
         if analyst_summaries:
             summary.analyst_summary = "; ".join(analyst_summaries)
@@ -221,6 +190,148 @@ async def run_pipeline(settings: Settings, shutdown_event: asyncio.Event | None
     return summary
 
 
+async def _process_opportunities(
+    opportunities: list[OpportunitySignal],
+    *,
+    settings: Settings,
+    shutdown_event: asyncio.Event | None,
+    metrics: CycleMetrics,
+    errors: list[str],
+) -> tuple[list[str], list[str]]:
+    """Run Analyst -> Trader chains on a bounded pool of workers.
+
+    Chains for different opportunities are independent; the Trader serializes
+    its own cash-sensitive section behind the portfolio lock. Returns the
+    analyst and trader summary lines in Scout order.
+    """
+    total = len(opportunities)
+    queue: asyncio.Queue[tuple[int, OpportunitySignal, float]] = asyncio.Queue()
+    for i, opp in enumerate(opportunities, 1):
+        queue.put_nowait((i, opp, time.monotonic()))
+
+    analyst_summaries: dict[int, str] = {}
+    trader_summaries: dict[int, str] = {}
+
+    async def worker() -> None:
+        while not queue.empty():
+            i, opp, enqueued_at = queue.get_nowait()
+            if _shutdown_requested(shutdown_event):
+                remaining = queue.qsize() + 1
+                while not queue.empty():
+                    queue.get_nowait()
+                logger.info("Shutdown requested, skipping remaining %d/%d opportunities", remaining, total)
+                return
+            await _process_opportunity(
+                opp,
+                index=i,
+                total=total,
+                queue_wait=time.monotonic() - enqueued_at,
+                settings=settings,
+                shutdown_event=shutdown_event,
+                metrics=metrics,
+                errors=errors,
+                analyst_summaries=analyst_summaries,
+                trader_summaries=trader_summaries,
+            )
+
+    workers = min(settings.pipeline.opportunity_workers, total)
+    logfire.info("Processing opportunities", count=total, workers=workers)
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+    return (
+        [analyst_summaries[i] for i in sorted(analyst_summaries)],
+        [trader_summaries[i] for i in sorted(trader_summaries)],
+    )
+
+
+async def _process_opportunity(
+    opp: OpportunitySignal,
+    *,
+    index: int,
+    total: int,
+    queue_wait: float,
+    settings: Settings,
+    shutdown_event: asyncio.Event | None,
+    metrics: CycleMetrics,
+    errors: list[str],
+    analyst_summaries: dict[int, str],
+    trader_summaries: dict[int, str],
+) -> None:
+    """Run Analyst then Trader for one opportunity, recording stage latencies."""
+    timings = metrics.opportunity_timings.setdefault(opp.market_ticker, {})
+    timings["queue_wait"] = round(queue_wait, 3)
+
+    with logfire.span(
+        "opportunity {ticker}",
+        ticker=opp.market_ticker,
+        opportunity_id=opp.id,
+        index=index,
+        total=total,
+        queue_wait_seconds=round(queue_wait, 3),
+    ):
+        with logfire.span("analyst", opportunity_id=opp.id):
+            analyst_started = time.monotonic()
+            try:
+                logger.info("Analyst starting for %s (%d/%d)", opp.market_ticker, index, total)
+                analyzed = await _retry_transient(
+                    run_analyst,
+                    opportunity_id=opp.id,
+                    settings=settings,
+                )
+                metrics.analyst_results[opp.market_ticker] = analyzed.status
+                analyst_summaries[index] = f"{opp.market_ticker}: status={analyzed.status}"
+                logfire.info("Analyst complete", status=analyzed.status)
+                logger.info("Analyst complete for %s: status=%s", opp.market_ticker, analyzed.status)
+            except Exception as e:
+                errors.append(f"Analyst({opp.market_ticker}): {e}")
+                logfire.error("Analyst failed", error=str(e))
+                logger.error("Analyst failed for %s: %s", opp.market_ticker, e)
+                await _mark_opportunity_failed(
+                    opp.id,
+                    failed_stage="analyst",
+                    error_message=str(e),
+                )
+                return
+            finally:
+                timings["analyst"] = round(time.monotonic() - analyst_started, 3)
+
+        if _shutdown_requested(shutdown_event):
+            logger.info("Shutdown requested after Analyst for %s, skipping Trader", opp.market_ticker)
+            return
+
+        with logfire.span("trader", opportunity_id=opp.id):
+            trader_started = time.monotonic()
+            try:
+                trader_output = await _retry_transient(
+                    run_trader,
+                    opportunity_id=opp.id,
+                    settings=settings,
+                    shutdown_event=shutdown_event,
+                )
+                metrics.trader_results[opp.market_ticker] = (
+                    f"{trader_output.decision.action} ({trader_output.execution_status})"
+                )
+                trader_summaries[index] = (
+                    f"{opp.market_ticker}: {trader_output.decision.action} "
+                    f"({trader_output.execution_status})"
+                )
+                logfire.info(
+                    "Trader complete",
+                    decision=trader_output.decision.action,
+                    status=trader_output.execution_status,
+                )
+            except Exception as e:
+                errors.append(f"Trader({opp.market_ticker}): {e}")
+                logfire.error("Trader failed", error=str(e))
+                await _mark_opportunity_failed(
+                    opp.id,
+                    failed_stage="trader",
+                    error_message=str(e),
+                )
+            finally:
+                timings["trader"] = round(time.monotonic() - trader_started, 3)
+
+
 async def _mark_opportunity_failed(
     opportunity_id: str,
     *,
@@ -247,9 +358,21 @@ async def _finalize_summary(
     """Populate cycle summary fields and persist pipeline telemetry."""
     summary.duration_seconds = (datetime.now(timezone.utc) - cycle_start).total_seconds()
     summary.errors = errors
+    if metrics.round_trips is not None:
+        metrics.db_round_trips = metrics.round_trips.count
+        logfire.info("Pipeline cycle DB round trips", round_trips=metrics.db_round_trips)
+
+    try:
+        async with unit_of_work():
+            await _persist_cycle(summary, metrics)
+    except Exception as e:
+        logfire.error("Failed to write run_cycle to DB", error=str(e))
+
 
+async def _persist_cycle(summary: JournalCycleSummary, metrics: CycleMetrics) -> None:
+    """Read closing portfolio state into the summary and write the run_cycles row."""
     try:
-        state = await load_state_from_db()
+        state = await load_portfolio_summary()
         summary.portfolio_cash = state.portfolio.cash_balance
         summary.portfolio_positions_value = state.portfolio.positions_value
         summary.portfolio_total = state.portfolio.total_value
@@ -266,6 +389,7 @@ async def _finalize_summary(
             scout_found=metrics.scout_found,
             analyst_results=metrics.analyst_results if metrics.analyst_results else None,
             trader_results=metrics.trader_results if metrics.trader_results else None,
+            stage_timings=metrics.stage_timings(),
             cash_balance=summary.portfolio_cash,
             positions_value=summary.portfolio_positions_value,
             total_value=summary.portfolio_total,
@@ -11,20 +11,24 @@ from .models import (
     Balance,
     Market,
     Order,
-    OrderBook,
     OrderBookLevel,
     OrderStatus,
     OrderType,
     Position,
 )
+from .orderbook import OrderBook
+from .rate_limit import KalshiRateLimiter, RequestPriority
+from .stream import KalshiMarketStream, TopOfBook
 
 __all__ = [
     "KalshiClient",
+    "KalshiMarketStream",
     "KalshiTradingAuth",
     "KalshiConfig",
     "KalshiAPIError",
     "KalshiAuthError",
     "KalshiNotFoundError",
+    "KalshiRateLimiter",
     "KalshiRateLimitError",
     "Balance",
     "Market",
@@ -34,4 +38,6 @@ __all__ = [
     "OrderStatus",
     "OrderType",
     "Position",
+    "RequestPriority",
+    "TopOfBook",
 ]
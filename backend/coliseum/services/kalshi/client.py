@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import time
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any, Literal
 from uuid import uuid4
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional: faster decoding of large scan pages
+    orjson = None
+
 from .auth import KalshiTradingAuth
 from .config import KalshiConfig
 from .exceptions import (
@@ -17,10 +24,17 @@ from .exceptions import (
     KalshiNotFoundError,
     KalshiRateLimitError,
 )
-from .models import Balance, Market, Order, OrderBook, OrderBookLevel, Position
+from .models import Balance, Market, MarketRow, Order, Position
+from .orderbook import OrderBook, parse_levels
+from .rate_limit import KalshiRateLimiter, RequestPriority, get_rate_limiter
+from .sharding import ShardObservation, get_shard_planner, split_evenly
 
 logger = logging.getLogger(__name__)
 
+_SHARD_DONE = object()
+# Tickers per GET markets?tickers=... request; keeps the query string short.
+_MARKET_BATCH_SIZE = 100
+
 
 class KalshiClient:
     def __init__(
@@ -28,9 +42,13 @@ class KalshiClient:
         config: KalshiConfig | None = None,
         api_key: str | None = None,
         private_key_pem: str | None = None,
+        rate_limiter: KalshiRateLimiter | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         self.config = config or KalshiConfig()
         self._client: httpx.AsyncClient | None = None
+        self._transport = transport
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.config)
 
         if api_key and private_key_pem:
             self.auth = KalshiTradingAuth(api_key, private_key_pem)
@@ -53,6 +71,7 @@ class KalshiClient:
             base_url=self.config.base_url,
             timeout=self.config.timeout_seconds,
             limits=limits,
+            transport=self._transport,
         )
         return self
 
@@ -89,18 +108,28 @@ class KalshiClient:
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
         auth_required: bool = False,
+        priority: RequestPriority | None = None,
     ) -> dict[str, Any]:
-        headers: dict[str, str] = {}
-
-        if auth_required:
-            auth = self._require_auth()
-            full_path = f"/trade-api/v2/{endpoint.lstrip('/')}"
-            headers.update(auth.get_auth_headers(method, full_path))
+        if priority is None:
+            # Writes are order placement/cancellation and always jump the queue.
+            if method.upper() == "GET":
+                priority = RequestPriority.NORMAL
+            else:
+                priority = RequestPriority.CRITICAL
 
         retry_count = 0
         last_error: Exception | None = None
 
         while retry_count < self.config.max_retries:
+            await self.rate_limiter.acquire(method, priority)
+
+            # Signatures are timestamped, so sign after any queue wait.
+            headers: dict[str, str] = {}
+            if auth_required:
+                auth = self._require_auth()
+                full_path = f"/trade-api/v2/{endpoint.lstrip('/')}"
+                headers.update(auth.get_auth_headers(method, full_path))
+
             try:
                 response = await self.client.request(
                     method=method,
@@ -117,10 +146,14 @@ class KalshiClient:
                         f"Resource not found: {endpoint}", status_code=404
                     )
                 elif response.status_code == 429:
-                    wait_time = 2 ** retry_count
-                    logger.warning(f"Rate limited, waiting {wait_time}s...")
-                    await asyncio.sleep(wait_time)
+                    wait_time = _retry_after_seconds(response, 2 ** retry_count)
+                    logger.warning(f"Rate limited, pausing {method} bucket for {wait_time}s...")
+                    # Pause the whole bucket so queued requests back off too.
+                    self.rate_limiter.penalize(method, wait_time)
                     retry_count += 1
+                    last_error = KalshiRateLimitError(
+                        "Rate limit exceeded", status_code=429
+                    )
                     continue
                 elif response.status_code >= 500:
                     wait_time = 2 ** retry_count
@@ -133,7 +166,7 @@ class KalshiClient:
                     continue
 
                 response.raise_for_status()
-                return response.json()
+                return _decode_json(response.content)
 
             except httpx.TimeoutException as e:
                 last_error = e
@@ -158,6 +191,7 @@ class KalshiClient:
         limit: int,
         result_key: str,
         auth_required: bool = False,
+        priority: RequestPriority | None = None,
     ) -> list[dict[str, Any]]:
         all_items: list[dict[str, Any]] = []
         cursor: str | None = None
@@ -168,7 +202,11 @@ class KalshiClient:
                 current_params["cursor"] = cursor
 
             data = await self._request(
-                "GET", endpoint, params=current_params, auth_required=auth_required
+                "GET",
+                endpoint,
+                params=current_params,
+                auth_required=auth_required,
+                priority=priority,
             )
 
             items = data.get(result_key, [])
@@ -180,6 +218,50 @@ class KalshiClient:
 
         return all_items[:limit]
 
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        limit: int,
+        result_key: str,
+        auth_required: bool = False,
+        priority: RequestPriority | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of raw items, requesting page N+1 while the caller handles page N."""
+
+        def fetch(cursor: str | None) -> asyncio.Task[dict[str, Any]]:
+            current_params = params.copy()
+            if cursor:
+                current_params["cursor"] = cursor
+            return asyncio.create_task(
+                self._request(
+                    "GET",
+                    endpoint,
+                    params=current_params,
+                    auth_required=auth_required,
+                    priority=priority,
+                )
+            )
+
+        pending: asyncio.Task[dict[str, Any]] | None = fetch(None)
+        remaining = limit
+        try:
+            while pending is not None and remaining > 0:
+                data = await pending
+                pending = None
+                items = data.get(result_key, [])[:remaining]
+                remaining -= len(items)
+
+                cursor = data.get("cursor")
+                if cursor and items and remaining > 0:
+                    pending = fetch(cursor)
+                if items:
+                    yield items
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
     async def get_exchange_status(self) -> dict[str, Any]:
         return await self._request("GET", "exchange/status")
 
@@ -194,7 +276,35 @@ class KalshiClient:
             "status": status,
             "with_nested_markets": str(with_nested_markets).lower(),
         }
-        return await self._paginate("events", params, limit, "events")
+        return await self._paginate(
+            "events", params, limit, "events", priority=RequestPriority.BULK
+        )
+
+    async def iter_events(
+        self,
+        limit: int = 10000,
+        status: str = "open",
+        with_nested_markets: bool = False,
+        min_close_ts: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream raw events page by page, prefetching the next page."""
+        params: dict[str, Any] = {
+            "limit": min(limit, self.config.default_page_size),
+            "status": status,
+            "with_nested_markets": str(with_nested_markets).lower(),
+        }
+        if min_close_ts is not None:
+            params["min_close_ts"] = min_close_ts
+
+        pages = self._iter_pages(
+            "events", params, limit, "events", priority=RequestPriority.BULK
+        )
+        try:
+            async for page in pages:
+                for event in page:
+                    yield event
+        finally:
+            await pages.aclose()
 
     async def get_markets(
         self,
@@ -209,12 +319,18 @@ class KalshiClient:
         if event_ticker:
             params["event_ticker"] = event_ticker
 
-        raw_markets = await self._paginate("markets", params, limit, "markets")
+        raw_markets = await self._paginate(
+            "markets", params, limit, "markets", priority=RequestPriority.BULK
+        )
         return [Market.from_api(m) for m in raw_markets]
 
-    async def get_event(self, event_ticker: str) -> dict[str, Any]:
+    async def get_event(
+        self,
+        event_ticker: str,
+        priority: RequestPriority = RequestPriority.BULK,
+    ) -> dict[str, Any]:
         """Fetch event metadata for a given event ticker."""
-        data = await self._request("GET", f"events/{event_ticker}")
+        data = await self._request("GET", f"events/{event_ticker}", priority=priority)
         return data.get("event", {})
 
     async def get_markets_for_event(self, event_ticker: str) -> list[Market]:
@@ -226,13 +342,41 @@ class KalshiClient:
         data = await self._request("GET", f"markets/{ticker}")
         return Market.from_api(data.get("market", data))
 
+    async def get_markets_batch(
+        self,
+        tickers: list[str],
+        chunk_size: int = _MARKET_BATCH_SIZE,
+    ) -> dict[str, Market]:
+        """Fetch many markets by ticker with the list endpoint's ``tickers`` filter.
+
+        One request per ``chunk_size`` tickers, issued concurrently. Unknown
+        tickers are simply absent from the result.
+        """
+        unique = list(dict.fromkeys(t for t in tickers if t))
+        chunks = [unique[i:i + chunk_size] for i in range(0, len(unique), chunk_size)]
+        pages = await asyncio.gather(*[
+            self._paginate(
+                "markets",
+                {"tickers": ",".join(chunk), "limit": len(chunk)},
+                len(chunk),
+                "markets",
+            )
+            for chunk in chunks
+        ])
+        markets: dict[str, Market] = {}
+        for page in pages:
+            for raw in page:
+                market = Market.from_api(raw)
+                markets[market.ticker] = market
+        return markets
+
     async def get_markets_closing_in_range(
         self,
         min_hours: int = 0,
         max_hours: int = 24,
         limit: int = 10000,
         status: str = "open",
-    ) -> list[Market]:
+    ) -> list[MarketRow]:
         """Fetch markets closing within a specified hour range from now."""
         current_time = int(time.time())
         min_close_ts = current_time + (min_hours * 3600)
@@ -245,26 +389,141 @@ class KalshiClient:
             "max_close_ts": max_close_ts,
         }
 
-        raw_markets = await self._paginate("markets", params, limit, "markets")
-        return [Market.from_api(m) for m in raw_markets]
+        raw_markets = await self._paginate(
+            "markets", params, limit, "markets", priority=RequestPriority.BULK
+        )
+        return [MarketRow.from_api(m) for m in raw_markets]
+
+    async def iter_markets_closing_in_range(
+        self,
+        min_hours: int = 0,
+        max_hours: int = 24,
+        limit: int = 10000,
+        status: str = "open",
+        shards: int | None = None,
+    ) -> AsyncIterator[MarketRow]:
+        """Stream markets closing within an hour range, page by page as they arrive."""
+        pages = self.iter_market_pages_closing_in_range(
+            min_hours=min_hours,
+            max_hours=max_hours,
+            limit=limit,
+            status=status,
+            shards=shards,
+        )
+        try:
+            async for page in pages:
+                for raw in page:
+                    yield MarketRow.from_api(raw)
+        finally:
+            await pages.aclose()
+
+    async def iter_market_pages_closing_in_range(
+        self,
+        min_hours: int = 0,
+        max_hours: int = 24,
+        limit: int = 10000,
+        status: str = "open",
+        shards: int | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream raw market pages closing within an hour range.
+
+        The window is split into close-time shards that paginate concurrently;
+        pages are merged and deduplicated by ticker. ``shards=None`` lets the
+        planner size the split from the previous scan's page counts.
+        """
+        current_time = int(time.time())
+        min_close_ts = current_time + (min_hours * 3600)
+        max_close_ts = current_time + (max_hours * 3600)
+
+        planner = get_shard_planner(
+            f"markets:{status}",
+            initial_shards=self.config.scan_initial_shards,
+            max_shards=self.config.scan_max_shards,
+            target_pages_per_shard=self.config.scan_target_pages_per_shard,
+        )
+        if shards is None:
+            windows = planner.plan(min_close_ts, max_close_ts)
+        else:
+            windows = split_evenly(min_close_ts, max_close_ts, shards)
+
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=2 * len(windows))
+        page_counts = [0] * len(windows)
+
+        async def pump(index: int, lo: int, hi: int) -> None:
+            params = {
+                "limit": min(limit, 1000),
+                "status": status,
+                "min_close_ts": lo,
+                "max_close_ts": hi,
+            }
+            pages = self._iter_pages(
+                "markets", params, limit, "markets", priority=RequestPriority.BULK
+            )
+            try:
+                async for page in pages:
+                    page_counts[index] += 1
+                    await queue.put(page)
+                await queue.put(_SHARD_DONE)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await queue.put(e)
+            finally:
+                await pages.aclose()
+
+        tasks = [
+            asyncio.create_task(pump(i, lo, hi)) for i, (lo, hi) in enumerate(windows)
+        ]
+        seen: set[str] = set()
+        finished = 0
+        try:
+            while finished < len(tasks) and len(seen) < limit:
+                item = await queue.get()
+                if item is _SHARD_DONE:
+                    finished += 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                page: list[dict[str, Any]] = []
+                for raw in item:
+                    ticker = raw.get("ticker", "")
+                    if ticker in seen:
+                        continue  # shard boundaries overlap by one second
+                    seen.add(ticker)
+                    page.append(raw)
+                    if len(seen) >= limit:
+                        break
+                if page:
+                    yield page
+
+            # Truncated scans under-count the tail, so only learn from complete ones.
+            if finished == len(tasks):
+                planner.record(
+                    [
+                        ShardObservation(lo, hi, pages)
+                        for (lo, hi), pages in zip(windows, page_counts)
+                    ]
+                )
+                logger.debug(
+                    "Sharded market scan: %d shards, pages per shard %s",
+                    len(windows),
+                    page_counts,
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def get_orderbook(self, ticker: str, depth: int = 10) -> OrderBook:
         params = {"depth": depth}
         data = await self._request("GET", f"markets/{ticker}/orderbook", params=params)
 
-        orderbook = data.get("orderbook", {})
-
-        def parse_levels(levels: list[list[int]] | None) -> list[OrderBookLevel]:
-            if not levels:
-                return []
-            return [OrderBookLevel(price=lvl[0], count=lvl[1]) for lvl in levels]
-
-        return OrderBook(
-            ticker=ticker,
-            yes_bids=parse_levels(orderbook.get("yes", [])),
-            yes_asks=parse_levels(orderbook.get("no", [])),  # Kalshi inverts this
-            no_bids=parse_levels(orderbook.get("no", [])),
-            no_asks=parse_levels(orderbook.get("yes", [])),
+        # Both ladders are bids; OrderBook derives asks by complement.
+        orderbook = data.get("orderbook_fp") or data.get("orderbook") or {}
+        return OrderBook.from_levels(
+            ticker,
+            yes=parse_levels(orderbook.get("yes_dollars") or orderbook.get("yes")),
+            no=parse_levels(orderbook.get("no_dollars") or orderbook.get("no")),
         )
 
     async def get_balance(self) -> Balance:
@@ -414,12 +673,15 @@ class KalshiClient:
         ticker: str | None = None,
         order_id: str | None = None,
         limit: int = 100,
+        min_ts: int | None = None,
     ) -> list[dict[str, Any]]:
         params: dict[str, Any] = {"limit": min(limit, 200)}
         if ticker:
             params["ticker"] = ticker
         if order_id:
             params["order_id"] = order_id
+        if min_ts is not None:
+            params["min_ts"] = min_ts
 
         return await self._paginate(
             "portfolio/fills", params, limit, "fills", auth_required=True
@@ -463,3 +725,20 @@ class KalshiClient:
             taker_fill_cost=_c("taker_fill_cost_dollars"),
             maker_fill_cost=_c("maker_fill_cost_dollars"),
         )
+
+
+def _retry_after_seconds(response: httpx.Response, default: float) -> float:
+    """Seconds to back off after a 429, preferring the server's Retry-After hint."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return default
+
+
+def _decode_json(content: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
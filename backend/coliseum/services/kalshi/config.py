@@ -5,8 +5,22 @@ class KalshiConfig(BaseModel):
     """Configuration for Kalshi API client."""
 
     base_url: str = "https://api.elections.kalshi.com/trade-api/v2"
+    ws_url: str = "wss://api.elections.kalshi.com/trade-api/ws/v2"
     timeout_seconds: float = 30.0
     max_connections: int = 100
     max_keepalive_connections: int = 20
     default_page_size: int = 200
     max_retries: int = 3
+    stream_reconnect_min_seconds: float = 1.0
+    stream_reconnect_max_seconds: float = 30.0
+    # Markets kept subscribed on the stream; least recently requested are dropped.
+    stream_max_tickers: int = 200
+    # Client-side token buckets; defaults match Kalshi's Basic tier.
+    read_rate_per_second: float = 20.0
+    write_rate_per_second: float = 10.0
+    read_burst: int | None = None
+    write_burst: int | None = None
+    # Close-time sharding for full-universe market scans.
+    scan_initial_shards: int = 4
+    scan_max_shards: int = 8
+    scan_target_pages_per_shard: int = 2
@@ -0,0 +1,90 @@
+"""Depth-aware entry planning for Trader buys.
+
+``plan_entry`` takes an ask ladder as arrays (``OrderBook.asks``):
+cumulative size and cost per level give the volume-weighted price of any
+order size in closed form, so the largest size whose VWAP stays within ``max_slippage_pct`` of the
+reference price is found without a per-contract loop. The plan's limit is
+the deepest level that size needs, so a single order takes the liquidity
+up front instead of discovering it through reprices.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class EntryPlan:
+    """Size and limit for one entry, with its expected cost against the book."""
+
+    contracts: int
+    limit_price_cents: int
+    avg_price_cents: float
+    levels_used: int
+
+    @property
+    def avg_price(self) -> float:
+        """Expected volume-weighted fill price in decimal (0-1)."""
+        return self.avg_price_cents / 100
+
+    @property
+    def cost_usd(self) -> float:
+        return self.contracts * self.avg_price_cents / 100
+
+
+def split_child_orders(contracts: int, max_child_contracts: int) -> tuple[int, ...]:
+    """Split ``contracts`` into near-equal children of at most ``max_child_contracts``."""
+    if contracts <= 0:
+        return ()
+    if max_child_contracts <= 0 or contracts <= max_child_contracts:
+        return (contracts,)
+    children = -(-contracts // max_child_contracts)
+    base, extra = divmod(contracts, children)
+    return tuple([base + 1] * extra + [base] * (children - extra))
+
+
+def plan_entry(
+    ask_prices: np.ndarray,
+    ask_sizes: np.ndarray,
+    contracts: int,
+    reference_price_cents: float,
+    max_slippage_pct: float,
+) -> EntryPlan | None:
+    """Largest entry up to ``contracts`` whose VWAP is within slippage of the reference.
+
+    ``ask_prices`` must be ascending. Returns None when not even one contract
+    fits (empty book, or the best ask is already beyond the slippage bound).
+    """
+    if contracts <= 0 or ask_prices.size == 0:
+        return None
+
+    prices = ask_prices.astype(np.float64)
+    sizes = np.maximum(ask_sizes, 0).astype(np.int64)
+    depth_after = np.cumsum(sizes)
+    cost_after = np.cumsum(prices * sizes)
+    depth_before = depth_after - sizes
+    cost_before = cost_after - prices * sizes
+    bound = reference_price_cents * (1.0 + max_slippage_pct)
+
+    # Within level i, VWAP(n) = (cost_before + (n - depth_before) * p) / n,
+    # which is <= bound for every n when p <= bound, and otherwise for
+    # n <= (depth_before * p - cost_before) / (p - bound).
+    above = prices > bound
+    gap = np.where(above, prices - bound, 1.0)
+    crossing = np.floor((depth_before * prices - cost_before) / gap + 1e-9).astype(np.int64)
+    reachable = np.where(above, np.minimum(crossing, depth_after), depth_after)
+    feasible = (reachable > depth_before) & (sizes > 0)
+    if not feasible.any():
+        return None
+
+    size = int(min(contracts, reachable[feasible].max()))
+    level = int(np.searchsorted(depth_after, size))
+    cost = cost_before[level] + (size - depth_before[level]) * prices[level]
+    return EntryPlan(
+        contracts=size,
+        limit_price_cents=int(ask_prices[level]),
+        avg_price_cents=float(cost / size),
+        levels_used=level + 1,
+    )
@@ -0,0 +1,162 @@
+"""Two-tier cache for Kalshi event metadata (title and category).
+
+Event titles and categories never change once an event is listed, yet every
+Scout scan touches thousands of events. Lookups go memory (LRU with TTL) →
+``event_metadata`` table (one bulk query per scan) → ``GET events/{ticker}``,
+and anything fetched from the API is written through to both layers, so only
+never-seen events cost an API call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from coliseum.config import get_settings
+from coliseum.services.supabase.repositories.event_metadata import (
+    load_event_metadata_from_db,
+    save_event_metadata_to_db,
+)
+
+from .client import KalshiClient
+from .rate_limit import RequestPriority
+
+logger = logging.getLogger(__name__)
+
+EventMeta = tuple[str, str]  # (title, category)
+
+
+@dataclass
+class EventMetadataStats:
+    """Where each requested event's metadata came from on one lookup."""
+
+    memory_hits: int = 0
+    db_hits: int = 0
+    api_fetches: int = 0
+    api_failures: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.db_hits
+
+    @property
+    def misses(self) -> int:
+        return self.api_fetches + self.api_failures
+
+
+class EventMetadataCache:
+    """In-memory LRU over the persistent event_metadata table."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int, use_db: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.use_db = use_db
+        self._entries: OrderedDict[str, tuple[str, str, float]] = OrderedDict()
+        self.last_stats = EventMetadataStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_fresh(self, event_ticker: str, now: float) -> EventMeta | None:
+        entry = self._entries.get(event_ticker)
+        if entry is None:
+            return None
+        title, category, fetched_at = entry
+        if now - fetched_at > self.ttl_seconds:
+            del self._entries[event_ticker]
+            return None
+        self._entries.move_to_end(event_ticker)
+        return title, category
+
+    def _put(self, event_ticker: str, meta: EventMeta, fetched_at: float) -> None:
+        self._entries[event_ticker] = (meta[0], meta[1], fetched_at)
+        self._entries.move_to_end(event_ticker)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_many(
+        self,
+        client: KalshiClient,
+        event_tickers: Iterable[str],
+    ) -> dict[str, EventMeta]:
+        """Resolve metadata for every ticker; failed fetches map to ("", "") and are not cached."""
+        stats = EventMetadataStats()
+        now = time.time()
+        resolved: dict[str, EventMeta] = {}
+        missing: list[str] = []
+        for event_ticker in dict.fromkeys(event_tickers):
+            meta = self._get_fresh(event_ticker, now)
+            if meta is None:
+                missing.append(event_ticker)
+            else:
+                resolved[event_ticker] = meta
+        stats.memory_hits = len(resolved)
+
+        if missing and self.use_db:
+            cutoff = datetime.fromtimestamp(now - self.ttl_seconds, tz=timezone.utc)
+            try:
+                rows = await load_event_metadata_from_db(missing, fetched_after=cutoff)
+            except Exception as e:
+                logger.warning("Event metadata DB load failed, falling back to API: %s", e)
+                rows = {}
+            for event_ticker, (title, category, fetched_at) in rows.items():
+                resolved[event_ticker] = (title, category)
+                self._put(event_ticker, (title, category), fetched_at.timestamp())
+            stats.db_hits = len(rows)
+            missing = [et for et in missing if et not in rows]
+
+        if missing:
+            fetched = await self._fetch_from_api(client, missing)
+            stats.api_fetches = len(fetched)
+            stats.api_failures = len(missing) - len(fetched)
+            for event_ticker, meta in fetched.items():
+                self._put(event_ticker, meta, now)
+            resolved.update(fetched)
+            for event_ticker in missing:
+                resolved.setdefault(event_ticker, ("", ""))
+            if fetched and self.use_db:
+                try:
+                    await save_event_metadata_to_db(fetched)
+                except Exception as e:
+                    logger.warning("Event metadata DB save failed: %s", e)
+
+        self.last_stats = stats
+        return resolved
+
+    async def _fetch_from_api(
+        self,
+        client: KalshiClient,
+        event_tickers: list[str],
+    ) -> dict[str, EventMeta]:
+        results = await asyncio.gather(
+            *[client.get_event(et, priority=RequestPriority.BULK) for et in event_tickers],
+            return_exceptions=True,
+        )
+        failed = [et for et, res in zip(event_tickers, results) if isinstance(res, Exception)]
+        if failed:
+            logger.warning("Failed to fetch event metadata for %d tickers: %s", len(failed), failed[:5])
+        return {
+            et: (res.get("title") or "", res.get("category") or "")
+            for et, res in zip(event_tickers, results)
+            if isinstance(res, dict)
+        }
+
+
+_cache: EventMetadataCache | None = None
+
+
+def get_event_metadata_cache() -> EventMetadataCache:
+    """Return the process-wide event metadata cache, sized from ScoutConfig."""
+    global _cache
+    if _cache is None:
+        cfg = get_settings().scout
+        _cache = EventMetadataCache(
+            ttl_seconds=cfg.event_metadata_ttl_hours * 3600,
+            max_entries=cfg.event_metadata_cache_size,
+        )
+    return _cache
@@ -0,0 +1,269 @@
+"""Persistent Kalshi fills ledger with running per-position aggregates.
+
+Guardian and portfolio sync both need weighted-average entry and exit prices
+per (ticker, side). Instead of downloading the recent fills list on every
+loop and re-averaging it, the ledger keeps every fill in the ``kalshi_fills``
+table, fetches only fills newer than its watermark (``min_ts``), and folds
+each new fill into running totals. A cold process rebuilds the totals by
+folding the stored fills in order, once.
+
+Totals cover the current holding only: a sell that takes the net position
+to zero closes it, and the next fill for that (ticker, side) starts fresh,
+so re-entering a market never blends in an earlier position's prices.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import logfire
+
+from coliseum.domain.fill import Fill
+from coliseum.services.supabase.repositories.fills import load_fills_from_db, save_fills_to_db
+
+from .client import KalshiClient
+from .sync import extract_fill_count, extract_fill_price, normalize_kalshi_side
+
+logger = logging.getLogger(__name__)
+
+FillKey = tuple[str, str]  # (market_ticker, side)
+
+# Re-read this much history each sync so fills stamped slightly out of order
+# are still picked up; ids inside the window are deduplicated.
+_OVERLAP = timedelta(seconds=60)
+# First sync with an empty ledger pulls at most this many historical fills.
+_BACKFILL_LIMIT = 5000
+_INCREMENTAL_LIMIT = 1000
+
+
+def parse_fill(raw: dict[str, Any]) -> Fill | None:
+    """Normalize a ``GET portfolio/fills`` payload; None if it lacks essentials."""
+    ticker = raw.get("ticker") or raw.get("market_ticker")
+    side = normalize_kalshi_side(raw.get("side"))
+    count = extract_fill_count(raw)
+    if not ticker or not side or not count:
+        return None
+    price = extract_fill_price(raw, side)
+    if price is None:
+        return None
+
+    action = raw.get("action")
+    if action is None:
+        normalized_action = None
+    elif str(action).lower() in {"buy", "b"}:
+        normalized_action = "buy"
+    elif str(action).lower() in {"sell", "s"}:
+        normalized_action = "sell"
+    else:
+        return None
+
+    created_time = raw.get("created_time")
+    if created_time:
+        created_at = datetime.fromisoformat(str(created_time).replace("Z", "+00:00"))
+    else:
+        created_at = datetime.now(timezone.utc)
+
+    fill_id = raw.get("fill_id") or raw.get("trade_id")
+    if not fill_id:
+        fingerprint = f"{raw.get('order_id')}|{created_time}|{ticker}|{side}|{action}|{count}|{price}"
+        fill_id = "synthetic_" + hashlib.sha1(fingerprint.encode()).hexdigest()[:16]
+
+    return Fill(
+        fill_id=str(fill_id),
+        order_id=raw.get("order_id"),
+        market_ticker=ticker,
+        side=side,
+        action=normalized_action,
+        count=count,
+        price=price,
+        created_at=created_at,
+    )
+
+
+@dataclass
+class FillAggregate:
+    """Contract and cost totals for the current holding of one (ticker, side).
+
+    A closed holding's totals stay readable (the Guardian prices its exit
+    from them) until the next fill opens a new holding.
+    """
+
+    buy_count: int = 0
+    buy_cost: float = 0.0
+    sell_count: int = 0
+    sell_cost: float = 0.0
+    net_contracts: int = 0
+    closed: bool = False
+
+    def add(self, action: str | None, count: int, cost: float) -> None:
+        if self.closed:
+            self.buy_count = self.sell_count = self.net_contracts = 0
+            self.buy_cost = self.sell_cost = 0.0
+            self.closed = False
+        # Fills without an action count toward both sides, as before the ledger.
+        if action in (None, "buy"):
+            self.buy_count += count
+            self.buy_cost += cost
+        if action in (None, "sell"):
+            self.sell_count += count
+            self.sell_cost += cost
+
+        if action == "buy":
+            self.net_contracts += count
+        elif action == "sell":
+            self.net_contracts -= count
+            if self.net_contracts <= 0:
+                self.closed = True
+
+    @property
+    def average_entry(self) -> float | None:
+        if self.buy_count <= 0:
+            return None
+        return self.buy_cost / self.buy_count
+
+    @property
+    def average_exit(self) -> float | None:
+        if self.sell_count <= 0:
+            return None
+        return self.sell_cost / self.sell_count
+
+
+class FillsLedger:
+    """Incrementally synced fills with weighted-average entry/exit per position."""
+
+    def __init__(self, use_db: bool = True):
+        self.use_db = use_db
+        self._aggregates: dict[FillKey, FillAggregate] = {}
+        self._watermark: datetime | None = None
+        # Fills inside the overlap window, used to skip re-fetched ones.
+        self._recent_ids: dict[str, datetime] = {}
+        self._unsaved: list[Fill] = []
+        self._loaded = False
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _bind_loop(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def average_entries(self) -> dict[FillKey, float]:
+        """Weighted-average buy price for every (ticker, side) with buys."""
+        return {
+            key: agg.average_entry
+            for key, agg in self._aggregates.items()
+            if agg.average_entry is not None
+        }
+
+    def average_exit(self, market_ticker: str, side: str) -> float | None:
+        """Weighted-average sell price for a position, or None without sells."""
+        agg = self._aggregates.get((market_ticker, side))
+        if agg is None:
+            return None
+        return agg.average_exit
+
+    def apply(self, fills: list[Fill]) -> list[Fill]:
+        """Fold fills not already seen into the totals; returns the new ones."""
+        new: list[Fill] = []
+        for fill in fills:
+            if fill.fill_id in self._recent_ids:
+                continue
+            if self._watermark is not None and fill.created_at < self._watermark - _OVERLAP:
+                continue
+            self._recent_ids[fill.fill_id] = fill.created_at
+            self._fold(fill)
+            new.append(fill)
+
+        for fill in new:
+            if self._watermark is None or fill.created_at > self._watermark:
+                self._watermark = fill.created_at
+        if self._watermark is not None:
+            cutoff = self._watermark - _OVERLAP
+            self._recent_ids = {
+                fill_id: created_at
+                for fill_id, created_at in self._recent_ids.items()
+                if created_at >= cutoff
+            }
+        return new
+
+    def _fold(self, fill: Fill) -> None:
+        key = (fill.market_ticker, fill.side)
+        self._aggregates.setdefault(key, FillAggregate()).add(fill.action, fill.count, fill.price * fill.count)
+
+    async def sync(self, client: KalshiClient) -> int:
+        """Fetch fills past the watermark, fold them in and persist them."""
+        async with self._bind_loop():
+            if not self._loaded:
+                await self._load()
+
+            if self._watermark is None:
+                raw_fills = await client.get_fills(limit=_BACKFILL_LIMIT)
+            else:
+                min_ts = int((self._watermark - _OVERLAP).timestamp())
+                raw_fills = await client.get_fills(limit=_INCREMENTAL_LIMIT, min_ts=min_ts)
+
+            parsed = [fill for fill in map(parse_fill, raw_fills) if fill is not None]
+            # Kalshi returns newest first; apply oldest first.
+            parsed.sort(key=lambda fill: fill.created_at)
+            new = self.apply(parsed)
+            if new:
+                logfire.info("Fills ledger updated", new_fills=len(new), fetched=len(raw_fills))
+            await self._persist(new)
+            return len(new)
+
+    async def _load(self) -> None:
+        self._loaded = True
+        if not self.use_db:
+            return
+        try:
+            fills = await load_fills_from_db()
+        except Exception as e:
+            logger.warning("Fills ledger DB load failed, backfilling from Kalshi: %s", e)
+            return
+        # Holdings are delimited by order, so totals are rebuilt fill by fill.
+        for fill in fills:
+            self._fold(fill)
+        if fills:
+            newest = max(fill.created_at for fill in fills)
+            self._watermark = newest
+            self._recent_ids = {
+                fill.fill_id: fill.created_at
+                for fill in fills
+                if fill.created_at >= newest - _OVERLAP
+            }
+        else:
+            newest = None
+        logger.info("Loaded fills ledger: %d positions, watermark %s", len(self._aggregates), newest)
+
+    async def _persist(self, new: list[Fill]) -> None:
+        if not self.use_db:
+            return
+        pending = self._unsaved + new
+        if not pending:
+            return
+        try:
+            await save_fills_to_db(pending)
+        except Exception as e:
+            # Kept in memory and retried next sync, so the table stays complete.
+            logger.warning("Fills ledger DB save of %d fills failed: %s", len(pending), e)
+            self._unsaved = pending
+            return
+        self._unsaved = []
+
+
+_ledger: FillsLedger | None = None
+
+
+def get_fills_ledger() -> FillsLedger:
+    """Return the process-wide fills ledger."""
+    global _ledger
+    if _ledger is None:
+        _ledger = FillsLedger()
+    return _ledger
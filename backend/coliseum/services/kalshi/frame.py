@@ -0,0 +1,146 @@
+"""Columnar NumPy view over raw Kalshi market payloads for bulk scans.
+
+Scout scans tens of thousands of markets per cycle and keeps a few hundred.
+``MarketFrame`` decodes a page of raw ``GET /markets`` JSON straight into
+NumPy columns (cents as integers, close time as epoch seconds) so volume,
+price-band, spread and close-window filters run as array masks. Row objects
+are only built for the markets that survive.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Container, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from .models import MarketRow
+
+# Sentinel for markets without a parseable close_time.
+NO_CLOSE_TS = np.iinfo(np.int64).min
+
+SIDE_NONE = 0
+SIDE_YES = 1
+SIDE_NO = 2
+
+
+def _cents_column(raw_markets: Sequence[dict[str, Any]], key: str) -> np.ndarray:
+    # FixedPointDollars strings parse to float in C; round to integer cents.
+    dollars = np.array([m.get(key) or "0" for m in raw_markets], dtype=np.float64)
+    return np.rint(dollars * 100).astype(np.int32)
+
+
+def _count_column(raw_markets: Sequence[dict[str, Any]], key: str) -> np.ndarray:
+    return np.array([m.get(key) or "0" for m in raw_markets], dtype=np.float64).astype(np.int64)
+
+
+def _close_ts_column(raw_markets: Sequence[dict[str, Any]]) -> np.ndarray:
+    values = [m.get("close_time") or "NaT" for m in raw_markets]
+    if all(v.endswith("Z") or v == "NaT" for v in values):
+        # Kalshi timestamps are UTC with a trailing "Z"; numpy parses the naive
+        # remainder in C. Anything else (explicit offsets) takes the slow path.
+        try:
+            stamps = np.array([v.removesuffix("Z") for v in values], dtype="datetime64[s]")
+            return stamps.astype(np.int64)
+        except ValueError:
+            pass
+    return np.array([_parse_close_ts(v) for v in values], dtype=np.int64)
+
+
+def _parse_close_ts(value: str) -> int:
+    try:
+        return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return int(NO_CLOSE_TS)
+
+
+@dataclass(frozen=True)
+class MarketFrame:
+    """Parallel columns for one batch of markets; row ``i`` is ``raw[i]``."""
+
+    raw: list[dict[str, Any]]
+    tickers: np.ndarray
+    event_tickers: np.ndarray
+    yes_bid: np.ndarray
+    yes_ask: np.ndarray
+    no_bid: np.ndarray
+    no_ask: np.ndarray
+    volume: np.ndarray
+    close_ts: np.ndarray
+
+    @classmethod
+    def from_raw(cls, raw_markets: Sequence[dict[str, Any]]) -> MarketFrame:
+        """Decode raw API market dicts into columns."""
+        raw = list(raw_markets)
+        # Interned so repeated event tickers share storage and compare by identity.
+        tickers = np.array([sys.intern(m.get("ticker", "")) for m in raw], dtype=object)
+        event_tickers = np.array(
+            [sys.intern(m.get("event_ticker", "")) for m in raw], dtype=object
+        )
+        return cls(
+            raw=raw,
+            tickers=tickers,
+            event_tickers=event_tickers,
+            yes_bid=_cents_column(raw, "yes_bid_dollars"),
+            yes_ask=_cents_column(raw, "yes_ask_dollars"),
+            no_bid=_cents_column(raw, "no_bid_dollars"),
+            no_ask=_cents_column(raw, "no_ask_dollars"),
+            volume=_count_column(raw, "volume_fp"),
+            close_ts=_close_ts_column(raw),
+        )
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def unseen_mask(self, seen_tickers: Container[str]) -> np.ndarray:
+        if not seen_tickers:
+            return np.ones(len(self), dtype=bool)
+        return np.fromiter(
+            (ticker not in seen_tickers for ticker in self.tickers),
+            dtype=bool,
+            count=len(self),
+        )
+
+    def close_window_mask(self, min_close_ts: int, max_close_ts: int) -> np.ndarray:
+        return (self.close_ts >= min_close_ts) & (self.close_ts <= max_close_ts)
+
+    def entry_sides(
+        self,
+        min_price_cents: int,
+        max_price_cents: int,
+        max_spread_cents: int,
+    ) -> np.ndarray:
+        """Actionable side per row: SIDE_YES, SIDE_NO, or SIDE_NONE.
+
+        A side is tradeable when it has a real bid, its ask is inside the price
+        band, and its spread is within limits. YES wins when both qualify.
+        """
+        yes_ok = _tradeable(self.yes_bid, self.yes_ask, min_price_cents, max_price_cents, max_spread_cents)
+        no_ok = _tradeable(self.no_bid, self.no_ask, min_price_cents, max_price_cents, max_spread_cents)
+        sides = np.full(len(self), SIDE_NONE, dtype=np.int8)
+        sides[no_ok] = SIDE_NO
+        sides[yes_ok] = SIDE_YES
+        return sides
+
+    def row(self, index: int) -> MarketRow:
+        """Materialize one surviving row."""
+        return MarketRow.from_api(self.raw[index])
+
+
+def _tradeable(
+    bid: np.ndarray,
+    ask: np.ndarray,
+    min_price_cents: int,
+    max_price_cents: int,
+    max_spread_cents: int,
+) -> np.ndarray:
+    return (
+        (ask > 0)
+        & (bid > 0)
+        & (ask >= min_price_cents)
+        & (ask <= max_price_cents)
+        & ((ask - bid) <= max_spread_cents)
+    )
@@ -2,12 +2,33 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, field_validator
 
 
-class Market(BaseModel):
+class _MarketDisplay:
+    """Display helpers shared by Market and MarketRow."""
+
+    __slots__ = ()
+
+    @property
+    def formatted_close_time(self) -> str:
+        if not self.close_time:
+            return "N/A"
+        return self.close_time.strftime("%b %d, %I:%M%p")
+
+    @property
+    def formatted_volume(self) -> str:
+        if self.volume >= 1_000_000:
+            return f"{self.volume / 1_000_000:.1f}M"
+        elif self.volume >= 1_000:
+            return f"{self.volume / 1_000:.1f}K"
+        return str(self.volume)
+
+
+class Market(_MarketDisplay, BaseModel):
     ticker: str
     event_ticker: str = ""
     title: str = ""
@@ -35,20 +56,6 @@ class Market(BaseModel):
         except (ValueError, AttributeError):
             return None
 
-    @property
-    def formatted_close_time(self) -> str:
-        if not self.close_time:
-            return "N/A"
-        return self.close_time.strftime("%b %d, %I:%M%p")
-
-    @property
-    def formatted_volume(self) -> str:
-        if self.volume >= 1_000_000:
-            return f"{self.volume / 1_000_000:.1f}M"
-        elif self.volume >= 1_000:
-            return f"{self.volume / 1_000:.1f}K"
-        return str(self.volume)
-
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> "Market":
         def _c(key: str) -> int:
@@ -85,6 +92,118 @@ class Market(BaseModel):
         )
 
 
+@lru_cache(maxsize=4096)
+def _parse_close_time(value: str) -> datetime | None:
+    # Markets in one event share a close time, so most lookups are cache hits.
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _cents(value: Any) -> int:
+    if value is None:
+        return 0
+    return round(float(value) * 100)
+
+
+def _count(value: Any) -> int:
+    if value is None:
+        return 0
+    return int(float(value))
+
+
+class MarketRow(_MarketDisplay):
+    """Unvalidated market record for bulk scans; same fields as Market.
+
+    Decoding skips Pydantic entirely, which matters when a scan parses tens of
+    thousands of markets per cycle. Order-path code should keep using the
+    validated Market (``to_market`` converts without re-validating).
+    """
+
+    __slots__ = (
+        "ticker",
+        "event_ticker",
+        "title",
+        "subtitle",
+        "yes_bid",
+        "no_bid",
+        "yes_ask",
+        "no_ask",
+        "volume",
+        "volume_24h",
+        "open_interest",
+        "close_time",
+        "status",
+        "result",
+    )
+
+    def __init__(
+        self,
+        ticker: str,
+        event_ticker: str = "",
+        title: str = "",
+        subtitle: str = "",
+        yes_bid: int = 0,
+        no_bid: int = 0,
+        yes_ask: int = 0,
+        no_ask: int = 0,
+        volume: int = 0,
+        volume_24h: int = 0,
+        open_interest: int = 0,
+        close_time: datetime | None = None,
+        status: str = "unknown",
+        result: str | None = None,
+    ):
+        self.ticker = ticker
+        self.event_ticker = event_ticker
+        self.title = title
+        self.subtitle = subtitle
+        self.yes_bid = yes_bid
+        self.no_bid = no_bid
+        self.yes_ask = yes_ask
+        self.no_ask = no_ask
+        self.volume = volume
+        self.volume_24h = volume_24h
+        self.open_interest = open_interest
+        self.close_time = close_time
+        self.status = status
+        self.result = result
+
+    def __repr__(self) -> str:
+        return f"MarketRow(ticker={self.ticker!r}, yes_ask={self.yes_ask}, no_ask={self.no_ask})"
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> MarketRow:
+        """Decode one raw API market dict in a single pass."""
+        get = data.get
+        close_time = get("close_time")
+        if close_time:
+            parsed_close_time = _parse_close_time(close_time)
+        else:
+            parsed_close_time = None
+        return cls(
+            ticker=get("ticker", ""),
+            event_ticker=get("event_ticker", ""),
+            title=get("title", ""),
+            subtitle=get("yes_sub_title", get("subtitle", "")),
+            yes_bid=_cents(get("yes_bid_dollars")),
+            no_bid=_cents(get("no_bid_dollars")),
+            yes_ask=_cents(get("yes_ask_dollars")),
+            no_ask=_cents(get("no_ask_dollars")),
+            volume=_count(get("volume_fp")),
+            volume_24h=_count(get("volume_24h_fp")),
+            open_interest=_count(get("open_interest_fp")),
+            close_time=parsed_close_time,
+            status=get("status", "unknown"),
+            result=get("result"),
+        )
+
+    def to_market(self) -> Market:
+        """Promote to a Market without re-running validation."""
+        return Market.model_construct(**{name: getattr(self, name) for name in self.__slots__})
+
+
 class Balance(BaseModel):
     balance: int = 0
     portfolio_value: int = 0
@@ -176,29 +295,3 @@ class Order(BaseModel):
 class OrderBookLevel(BaseModel):
     price: int
     count: int
-
-
-class OrderBook(BaseModel):
-    ticker: str
-    yes_bids: list[OrderBookLevel] = Field(default_factory=list)
-    yes_asks: list[OrderBookLevel] = Field(default_factory=list)
-    no_bids: list[OrderBookLevel] = Field(default_factory=list)
-    no_asks: list[OrderBookLevel] = Field(default_factory=list)
-
-    @property
-    def best_yes_bid(self) -> int | None:
-        if self.yes_bids:
-            return max(level.price for level in self.yes_bids)
-        return None
-
-    @property
-    def best_yes_ask(self) -> int | None:
-        if self.yes_asks:
-            return min(level.price for level in self.yes_asks)
-        return None
-
-    @property
-    def spread(self) -> int | None:
-        if self.best_yes_bid and self.best_yes_ask:
-            return self.best_yes_ask - self.best_yes_bid
-        return None
@@ -0,0 +1,233 @@
+"""NumPy-backed Kalshi order book.
+
+Kalshi books only carry bids. The ``yes`` ladder holds resting YES bids and
+the ``no`` ladder resting NO bids; a YES ask at ``p`` is a NO bid at
+``100 - p`` and vice versa. ``OrderBook`` stores the two bid ladders and
+derives asks by that complement, never by reading the other side raw.
+
+Each ``BidLadder`` keeps its levels in sorted price/size arrays with spare
+capacity, so the best price is the last element, a delta to an existing
+level is an O(log n) search plus an in-place write, and a new or emptied
+level shifts the tail in place. Cumulative depth is a suffix sum rebuilt
+lazily after changes and queried with ``searchsorted``. The REST client
+builds books from snapshots; the market stream applies WebSocket deltas to
+the same structure.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, Literal
+
+import numpy as np
+
+from .models import OrderBookLevel
+
+Side = Literal["yes", "no"]
+
+_INITIAL_CAPACITY = 16
+
+
+def to_cents(value: Any) -> int | None:
+    """Convert a cents int or FixedPointDollars string to integer cents."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return round(float(value) * 100)
+    return int(value)
+
+
+def to_count(value: Any) -> int:
+    """Convert a count int or FixedPointCount string to int."""
+    if value is None:
+        return 0
+    return int(float(value))
+
+
+def parse_levels(levels: Iterable[Any] | None) -> list[tuple[int, int]]:
+    """Parse ``[price, count]`` pairs (cents ints or dollar strings), dropping empty levels."""
+    parsed: list[tuple[int, int]] = []
+    for price, count in levels or ():
+        cents = to_cents(price)
+        qty = to_count(count)
+        if cents is not None and qty > 0:
+            parsed.append((cents, qty))
+    return parsed
+
+
+class BidLadder:
+    """Resting bids for one side, as price-ascending arrays."""
+
+    __slots__ = ("_prices", "_sizes", "_n", "_depth")
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY):
+        self._prices = np.zeros(max(1, capacity), dtype=np.int64)
+        self._sizes = np.zeros(max(1, capacity), dtype=np.int64)
+        self._n = 0
+        # Suffix sums of sizes (depth at or above each level); None when stale.
+        self._depth: np.ndarray | None = None
+
+    @classmethod
+    def from_levels(cls, levels: Iterable[tuple[int, int]]) -> BidLadder:
+        """Build from (price, size) pairs; repeated prices are summed."""
+        pairs = np.array([(p, s) for p, s in levels if s > 0], dtype=np.int64).reshape(-1, 2)
+        prices, inverse = np.unique(pairs[:, 0], return_inverse=True)
+        sizes = np.bincount(inverse, weights=pairs[:, 1], minlength=prices.size).astype(np.int64)
+        ladder = cls(capacity=max(_INITIAL_CAPACITY, 2 * prices.size))
+        ladder._prices[:prices.size] = prices
+        ladder._sizes[:prices.size] = sizes
+        ladder._n = int(prices.size)
+        return ladder
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Level prices, ascending (a read-only view)."""
+        view = self._prices[:self._n]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Level sizes aligned with ``prices`` (a read-only view)."""
+        view = self._sizes[:self._n]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def best(self) -> int | None:
+        if self._n == 0:
+            return None
+        return int(self._prices[self._n - 1])
+
+    def size_at(self, price: int) -> int:
+        i = int(np.searchsorted(self._prices[:self._n], price))
+        if i < self._n and self._prices[i] == price:
+            return int(self._sizes[i])
+        return 0
+
+    def depth_at_or_above(self, price: int) -> int:
+        """Total size bid at ``price`` or better (higher)."""
+        if self._depth is None:
+            self._depth = np.cumsum(self._sizes[:self._n][::-1])[::-1]
+        i = int(np.searchsorted(self._prices[:self._n], price))
+        if i >= self._n:
+            return 0
+        return int(self._depth[i])
+
+    def apply_delta(self, price: int, delta: int) -> None:
+        """Add ``delta`` contracts at ``price``; levels at or below zero are removed."""
+        n = self._n
+        i = int(np.searchsorted(self._prices[:n], price))
+        self._depth = None
+        if i < n and self._prices[i] == price:
+            remaining = int(self._sizes[i]) + delta
+            if remaining > 0:
+                self._sizes[i] = remaining
+                return
+            self._prices[i:n - 1] = self._prices[i + 1:n]
+            self._sizes[i:n - 1] = self._sizes[i + 1:n]
+            self._n = n - 1
+            return
+        if delta <= 0:
+            return
+        if n == self._prices.size:
+            self._grow()
+        self._prices[i + 1:n + 1] = self._prices[i:n]
+        self._sizes[i + 1:n + 1] = self._sizes[i:n]
+        self._prices[i] = price
+        self._sizes[i] = delta
+        self._n = n + 1
+
+    def _grow(self) -> None:
+        capacity = 2 * self._prices.size
+        self._prices = np.resize(self._prices, capacity)
+        self._sizes = np.resize(self._sizes, capacity)
+
+
+class OrderBook:
+    """Both bid ladders of one market, with asks derived by complement."""
+
+    __slots__ = ("ticker", "yes", "no")
+
+    def __init__(self, ticker: str, yes: BidLadder | None = None, no: BidLadder | None = None):
+        self.ticker = ticker
+        self.yes = yes or BidLadder()
+        self.no = no or BidLadder()
+
+    @classmethod
+    def from_levels(
+        cls,
+        ticker: str,
+        yes: Iterable[tuple[int, int]],
+        no: Iterable[tuple[int, int]],
+    ) -> OrderBook:
+        return cls(ticker, BidLadder.from_levels(yes), BidLadder.from_levels(no))
+
+    def _ladder(self, side: Side) -> BidLadder:
+        if side == "yes":
+            return self.yes
+        return self.no
+
+    def _opposite(self, side: Side) -> BidLadder:
+        if side == "yes":
+            return self.no
+        return self.yes
+
+    def apply_delta(self, side: Side, price: int, delta: int) -> None:
+        self._ladder(side).apply_delta(price, delta)
+
+    def best_bid(self, side: Side) -> int | None:
+        return self._ladder(side).best
+
+    def best_ask(self, side: Side) -> int | None:
+        opposite = self._opposite(side).best
+        if opposite is None:
+            return None
+        return 100 - opposite
+
+    def asks(self, side: Side) -> tuple[np.ndarray, np.ndarray]:
+        """Ask ladder for buying ``side``: prices ascending and their sizes."""
+        opposite = self._opposite(side)
+        return 100 - opposite.prices[::-1], opposite.sizes[::-1].copy()
+
+    def ask_depth(self, side: Side, limit_price: int) -> int:
+        """Contracts of ``side`` that can be bought at ``limit_price`` or better."""
+        return self._opposite(side).depth_at_or_above(100 - limit_price)
+
+    def bid_depth(self, side: Side, limit_price: int) -> int:
+        """Contracts of ``side`` that can be sold at ``limit_price`` or better."""
+        return self._ladder(side).depth_at_or_above(limit_price)
+
+    @property
+    def best_yes_bid(self) -> int | None:
+        return self.best_bid("yes")
+
+    @property
+    def best_yes_ask(self) -> int | None:
+        return self.best_ask("yes")
+
+    @property
+    def best_no_bid(self) -> int | None:
+        return self.best_bid("no")
+
+    @property
+    def best_no_ask(self) -> int | None:
+        return self.best_ask("no")
+
+    @property
+    def spread(self) -> int | None:
+        if self.best_yes_bid and self.best_yes_ask:
+            return self.best_yes_ask - self.best_yes_bid
+        return None
+
+    def levels(self, side: Side, kind: Literal["bids", "asks"]) -> list[OrderBookLevel]:
+        """Levels as models, best first (for display and serialization)."""
+        if kind == "bids":
+            ladder = self._ladder(side)
+            prices, sizes = ladder.prices[::-1], ladder.sizes[::-1]
+        else:
+            prices, sizes = self.asks(side)
+        return [OrderBookLevel(price=int(p), count=int(s)) for p, s in zip(prices, sizes)]
@@ -0,0 +1,207 @@
+"""Client-side token-bucket rate limiting for the Kalshi REST API.
+
+Kalshi meters reads and writes separately, so every request draws from one of
+two process-wide buckets sized to the account tier. Requests that find a bucket
+empty queue by priority lane: order placement and stop-loss sells
+(``CRITICAL``) are granted tokens before portfolio reads (``NORMAL``), which in
+turn go ahead of Scout scans and metadata prefetches (``BULK``). Queue wait is
+recorded per bucket and lane so starvation shows up in telemetry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+
+import logfire
+
+from .config import KalshiConfig
+
+logger = logging.getLogger(__name__)
+
+_queue_wait_histogram = logfire.metric_histogram(
+    "kalshi.rate_limit.queue_wait",
+    unit="s",
+    description="Time a Kalshi request spent waiting for a rate-limit token",
+)
+
+
+class RequestPriority(IntEnum):
+    """Scheduling lane for a Kalshi request; lower values are served first."""
+
+    CRITICAL = 0  # order placement, cancels, stop-loss exits
+    NORMAL = 1  # portfolio reads, single-market lookups
+    BULK = 2  # market scans, event metadata fan-outs
+
+
+@dataclass
+class LaneStats:
+    """Queue-wait counters for one (bucket, priority) lane."""
+
+    requests: int = 0
+    queued: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        if self.requests == 0:
+            return 0.0
+        return self.total_wait_seconds / self.requests
+
+
+class TokenBucket:
+    """Async token bucket whose waiters are served in priority order."""
+
+    def __init__(self, name: str, rate_per_second: float, burst: int):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.name = name
+        self.rate = rate_per_second
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._drainer: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.stats: dict[RequestPriority, LaneStats] = {
+            priority: LaneStats() for priority in RequestPriority
+        }
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _bind_loop(self) -> None:
+        # The CLI runs each command under its own asyncio.run(); waiters from a
+        # finished loop can never be woken, so start fresh on a new loop.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._waiters.clear()
+            self._drainer = None
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.NORMAL) -> float:
+        """Take one token, waiting behind higher-priority requests. Returns seconds waited."""
+        self._bind_loop()
+        started = time.monotonic()
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self._record(priority, 0.0, queued=False)
+            return 0.0
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), future))
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain(), name=f"kalshi-bucket-{self.name}")
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as we were cancelled: hand the token back.
+                self._tokens += 1
+            else:
+                future.cancel()
+            raise
+
+        waited = time.monotonic() - started
+        self._record(priority, waited, queued=True)
+        return waited
+
+    def penalize(self, seconds: float) -> None:
+        """Drain the bucket so nothing is sent for ``seconds`` (e.g. after a 429)."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    async def _drain(self) -> None:
+        while self._waiters:
+            self._refill()
+            while self._waiters and self._waiters[0][2].done():
+                heapq.heappop(self._waiters)
+            if not self._waiters:
+                break
+            if self._tokens >= 1:
+                _, _, future = heapq.heappop(self._waiters)
+                self._tokens -= 1
+                future.set_result(None)
+                continue
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def _record(self, priority: RequestPriority, waited: float, queued: bool) -> None:
+        lane = self.stats[priority]
+        lane.requests += 1
+        lane.total_wait_seconds += waited
+        lane.max_wait_seconds = max(lane.max_wait_seconds, waited)
+        if queued:
+            lane.queued += 1
+        _queue_wait_histogram.record(
+            waited, attributes={"bucket": self.name, "priority": priority.name.lower()}
+        )
+
+
+class KalshiRateLimiter:
+    """Separate read and write buckets shared by every KalshiClient in the process."""
+
+    def __init__(
+        self,
+        read_rate_per_second: float,
+        write_rate_per_second: float,
+        read_burst: int | None = None,
+        write_burst: int | None = None,
+    ):
+        if read_burst is None:
+            read_burst = int(read_rate_per_second)
+        if write_burst is None:
+            write_burst = int(write_rate_per_second)
+        self.read = TokenBucket("read", read_rate_per_second, read_burst)
+        self.write = TokenBucket("write", write_rate_per_second, write_burst)
+
+    def bucket_for(self, method: str) -> TokenBucket:
+        if method.upper() == "GET":
+            return self.read
+        return self.write
+
+    async def acquire(self, method: str, priority: RequestPriority) -> float:
+        return await self.bucket_for(method).acquire(priority)
+
+    def penalize(self, method: str, seconds: float) -> None:
+        self.bucket_for(method).penalize(seconds)
+
+    def snapshot(self) -> dict[str, dict[str, LaneStats]]:
+        """Per-bucket, per-lane queue-wait counters for logging and dashboards."""
+        return {
+            bucket.name: {priority.name.lower(): stats for priority, stats in bucket.stats.items()}
+            for bucket in (self.read, self.write)
+        }
+
+
+_limiters: dict[tuple[str, float, float, int | None, int | None], KalshiRateLimiter] = {}
+
+
+def get_rate_limiter(config: KalshiConfig) -> KalshiRateLimiter:
+    """Return the process-wide limiter for this API host and tier."""
+    key = (
+        config.base_url,
+        config.read_rate_per_second,
+        config.write_rate_per_second,
+        config.read_burst,
+        config.write_burst,
+    )
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = KalshiRateLimiter(
+            read_rate_per_second=config.read_rate_per_second,
+            write_rate_per_second=config.write_rate_per_second,
+            read_burst=config.read_burst,
+            write_burst=config.write_burst,
+        )
+        _limiters[key] = limiter
+    return limiter
@@ -0,0 +1,128 @@
+"""Close-time shard planning for concurrent Kalshi market scans.
+
+A full-universe scan over one ``min_close_ts``/``max_close_ts`` range is a
+single serial cursor chain. Splitting the window into close-time shards lets
+each shard paginate independently. The planner remembers how many pages each
+shard returned on the previous scan and places the next scan's boundaries so
+every shard expects roughly ``target_pages_per_shard`` pages, since markets
+cluster heavily around a few daily close times.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ShardObservation:
+    """Pages returned by one close-time shard on a completed scan."""
+
+    min_close_ts: int
+    max_close_ts: int
+    pages: int
+
+
+def split_evenly(min_ts: int, max_ts: int, shards: int) -> list[tuple[int, int]]:
+    """Split ``[min_ts, max_ts]`` into ``shards`` equal-width windows."""
+    shards = max(1, min(shards, max_ts - min_ts))
+    width = (max_ts - min_ts) / shards
+    bounds = [min_ts + round(width * i) for i in range(shards)] + [max_ts]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+class CloseTimeShardPlanner:
+    """Adaptive shard layout driven by page counts from the previous scan."""
+
+    def __init__(
+        self,
+        initial_shards: int = 4,
+        max_shards: int = 8,
+        target_pages_per_shard: int = 2,
+    ):
+        self.initial_shards = initial_shards
+        self.max_shards = max_shards
+        self.target_pages_per_shard = max(1, target_pages_per_shard)
+        self._history: list[ShardObservation] = []
+
+    def record(self, observations: list[ShardObservation]) -> None:
+        """Replace the density estimate with the latest completed scan."""
+        self._history = sorted(observations, key=lambda o: o.min_close_ts)
+
+    def plan(self, min_ts: int, max_ts: int) -> list[tuple[int, int]]:
+        """Return close-time windows covering ``[min_ts, max_ts]``."""
+        if max_ts <= min_ts:
+            return [(min_ts, max_ts)]
+        if not self._history:
+            return split_evenly(min_ts, max_ts, min(self.initial_shards, self.max_shards))
+
+        pieces = self._density_pieces(min_ts, max_ts)
+        total_pages = sum(pages for _, _, pages in pieces)
+        shards = math.ceil(total_pages / self.target_pages_per_shard)
+        shards = max(1, min(shards, self.max_shards))
+        if shards == 1 or total_pages <= 0:
+            return [(min_ts, max_ts)]
+
+        # Place boundaries at equal-mass quantiles of the piecewise density.
+        bounds = [min_ts]
+        cumulative = 0.0
+        step = total_pages / shards
+        next_mass = step
+        for lo, hi, pages in pieces:
+            while pages > 0 and cumulative + pages >= next_mass and len(bounds) < shards:
+                fraction = (next_mass - cumulative) / pages
+                boundary = lo + round((hi - lo) * fraction)
+                if boundary > bounds[-1]:
+                    bounds.append(boundary)
+                next_mass += step
+            cumulative += pages
+        if bounds[-1] < max_ts:
+            bounds.append(max_ts)
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def _density_pieces(self, min_ts: int, max_ts: int) -> list[tuple[int, int, float]]:
+        """Expected pages per sub-interval, using the historical average where unobserved."""
+        observed_span = sum(o.max_close_ts - o.min_close_ts for o in self._history)
+        observed_pages = sum(o.pages for o in self._history)
+        if observed_span > 0:
+            average_density = observed_pages / observed_span
+        else:
+            average_density = 0.0
+
+        pieces: list[tuple[int, int, float]] = []
+        cursor = min_ts
+        for obs in self._history:
+            lo = max(obs.min_close_ts, min_ts)
+            hi = min(obs.max_close_ts, max_ts)
+            if hi <= lo or hi <= cursor:
+                continue
+            lo = max(lo, cursor)
+            if lo > cursor:
+                pieces.append((cursor, lo, (lo - cursor) * average_density))
+            width = obs.max_close_ts - obs.min_close_ts
+            pieces.append((lo, hi, obs.pages * (hi - lo) / width))
+            cursor = hi
+        if cursor < max_ts:
+            pieces.append((cursor, max_ts, (max_ts - cursor) * average_density))
+        return pieces
+
+
+_planners: dict[str, CloseTimeShardPlanner] = {}
+
+
+def get_shard_planner(
+    key: str,
+    initial_shards: int,
+    max_shards: int,
+    target_pages_per_shard: int,
+) -> CloseTimeShardPlanner:
+    """Return the process-wide planner for one scan shape (e.g. market status)."""
+    planner = _planners.get(key)
+    if planner is None:
+        planner = CloseTimeShardPlanner(
+            initial_shards=initial_shards,
+            max_shards=max_shards,
+            target_pages_per_shard=target_pages_per_shard,
+        )
+        _planners[key] = planner
+    return planner
@@ -0,0 +1,69 @@
+"""Short-lived market snapshot shared by the stages of one Guardian loop.
+
+Portfolio sync, stop-loss evaluation and reconciliation all need market data
+for the same handful of tickers within a few seconds of each other. A
+``MarketSnapshot`` fetches whatever tickers it hasn't seen through
+``get_markets_batch`` and serves repeats from memory until ``max_age_seconds``
+elapses, so a loop costs a constant number of market requests however many
+positions are open. Create one per loop; it is not a long-lived cache.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterable
+
+from .client import KalshiClient
+from .exceptions import KalshiNotFoundError
+from .models import Market
+
+logger = logging.getLogger(__name__)
+
+
+class MarketSnapshot:
+    """Per-loop view of market state, filled in batches."""
+
+    def __init__(self, client: KalshiClient, max_age_seconds: float = 10.0):
+        self.client = client
+        self.max_age_seconds = max_age_seconds
+        self._markets: dict[str, tuple[Market, float]] = {}
+        self.batch_requests = 0
+
+    def _fresh(self, ticker: str, now: float) -> Market | None:
+        entry = self._markets.get(ticker)
+        if entry is None or now - entry[1] > self.max_age_seconds:
+            return None
+        return entry[0]
+
+    async def get_many(self, tickers: Iterable[str]) -> dict[str, Market]:
+        """Markets for every known ticker; unknown tickers are omitted."""
+        wanted = list(dict.fromkeys(tickers))
+        now = time.monotonic()
+        missing = [t for t in wanted if self._fresh(t, now) is None]
+        if missing:
+            self.batch_requests += 1
+            fetched = await self.client.get_markets_batch(missing)
+            for ticker, market in fetched.items():
+                self._markets[ticker] = (market, now)
+        return {
+            ticker: self._markets[ticker][0]
+            for ticker in wanted
+            if ticker in self._markets
+        }
+
+    async def get(self, ticker: str) -> Market:
+        """One market, raising KalshiNotFoundError like ``client.get_market``."""
+        markets = await self.get_many([ticker])
+        market = markets.get(ticker)
+        if market is None:
+            raise KalshiNotFoundError(f"Resource not found: markets/{ticker}", status_code=404)
+        return market
+
+    def invalidate(self, tickers: Iterable[str] | None = None) -> None:
+        """Drop tickers (or everything) so the next read refetches them."""
+        if tickers is None:
+            self._markets.clear()
+            return
+        for ticker in tickers:
+            self._markets.pop(ticker, None)
@@ -0,0 +1,437 @@
+"""Streaming Kalshi market-data feed with an in-process top-of-book per ticker.
+
+Subscribes to the ``orderbook_delta`` and ``ticker`` WebSocket channels and keeps
+an ``OrderBook`` plus the best bid/ask for each subscribed market in memory, so
+price and depth reads on hot paths (Trader entry planning, Guardian stop-loss
+evaluation) cost no network round-trip. Callers must treat a ``None`` quote as "unknown" and fall back to
+the REST client.
+
+Orderbook messages carry a per-subscription ``seq``. A gap means a delta was
+lost, so the affected books are dropped (callers fall back to REST) and the
+markets are resubscribed for a fresh snapshot. At most
+``stream_max_tickers`` markets stay subscribed; subscribing past that drops
+the least recently requested ones.
+
+With credentials the stream also subscribes to the private ``fill`` channel so
+order executors can wait on ``watch_order`` instead of sleeping between status
+polls. Fill events only signal that an order changed; REST stays the source
+of truth for fill counts and costs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from websockets.asyncio.client import connect as ws_connect
+
+from .auth import KalshiTradingAuth
+from .config import KalshiConfig
+from .orderbook import OrderBook, parse_levels, to_cents, to_count
+
+logger = logging.getLogger(__name__)
+
+_WS_SIGN_PATH = "/trade-api/ws/v2"
+_BOOK_CHANNEL = "orderbook_delta"
+_CHANNELS = [_BOOK_CHANNEL, "ticker"]
+_BOOK_MESSAGES = ("orderbook_snapshot", "orderbook_delta")
+_FILL_CHANNEL = "fill"
+
+
+class WebSocketLike(Protocol):
+    """Minimal connection surface the stream needs (satisfied by websockets)."""
+
+    async def send(self, message: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+    def __aiter__(self) -> Any: ...
+
+
+Connector = Callable[[str, dict[str, str]], Awaitable[WebSocketLike]]
+
+
+@dataclass(frozen=True)
+class TopOfBook:
+    """Best bid/ask for both sides of one market, in cents (0 when absent)."""
+
+    ticker: str
+    yes_bid: int = 0
+    yes_ask: int = 0
+    no_bid: int = 0
+    no_ask: int = 0
+    updated_at: float = 0.0  # time.monotonic() of the last applied message
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.updated_at
+
+
+def _top_of_book(book: OrderBook) -> TopOfBook:
+    # Asks are the complement of the opposite side's best bid.
+    return TopOfBook(
+        ticker=book.ticker,
+        yes_bid=book.best_yes_bid or 0,
+        yes_ask=book.best_yes_ask or 0,
+        no_bid=book.best_no_bid or 0,
+        no_ask=book.best_no_ask or 0,
+        updated_at=time.monotonic(),
+    )
+
+
+async def _default_connect(url: str, headers: dict[str, str]) -> WebSocketLike:
+    return await ws_connect(url, additional_headers=headers or None)
+
+
+class KalshiMarketStream:
+    """Long-lived WebSocket subscriber maintaining top-of-book per ticker."""
+
+    def __init__(
+        self,
+        config: KalshiConfig | None = None,
+        auth: KalshiTradingAuth | None = None,
+        connect: Connector | None = None,
+    ):
+        self.config = config or KalshiConfig()
+        self.auth = auth
+        self._connect = connect or _default_connect
+        # Subscribed tickers, least recently requested first.
+        self._tickers: OrderedDict[str, None] = OrderedDict()
+        # Per subscription id: last orderbook seq, and the markets it covers.
+        self._seqs: dict[int, int] = {}
+        self._sid_tickers: dict[int, set[str]] = {}
+        # Subscriptions dropped after a gap; their in-flight messages are ignored.
+        self._stale_sids: set[int] = set()
+        self._books: dict[str, OrderBook] = {}
+        self._quotes: dict[str, TopOfBook] = {}
+        self._updated = asyncio.Condition()
+        self._ws: WebSocketLike | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+        self._msg_ids = itertools.count(1)
+        self._order_watchers: dict[str, asyncio.Event] = {}
+
+    async def __aenter__(self) -> KalshiMarketStream:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any) -> None:
+        await self.close()
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    @property
+    def streams_fills(self) -> bool:
+        """True when fill events for our own orders are being received."""
+        return self.auth is not None and self._ws is not None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._closing = False
+            self._task = asyncio.create_task(self._run(), name="kalshi-market-stream")
+
+    async def close(self) -> None:
+        self._closing = True
+        if self._ws is not None:
+            try:
+                await self._ws.close()
+            except Exception:
+                pass
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        logger.info("Closed KalshiMarketStream")
+
+    async def subscribe(self, tickers: Iterable[str]) -> None:
+        """Track tickers; sends a subscribe command for new ones when connected.
+
+        Past ``stream_max_tickers`` the least recently requested tickers are
+        unsubscribed.
+        """
+        requested = {t for t in tickers if t}
+        new = []
+        for ticker in requested:
+            if ticker in self._tickers:
+                self._tickers.move_to_end(ticker)
+            else:
+                self._tickers[ticker] = None
+                new.append(ticker)
+
+        evicted = []
+        while len(self._tickers) > self.config.stream_max_tickers:
+            oldest = next(iter(self._tickers))
+            if oldest in requested:
+                break  # everything left was just asked for
+            evicted.append(self._tickers.popitem(last=False)[0])
+        if evicted:
+            await self._drop_tickers(evicted)
+        if new and self._ws is not None:
+            await self._send_subscribe(sorted(new))
+
+    async def unsubscribe(self, tickers: Iterable[str]) -> None:
+        """Stop tracking ``tickers`` and discard their books and quotes."""
+        gone = [t for t in tickers if t in self._tickers]
+        for ticker in gone:
+            del self._tickers[ticker]
+        if gone:
+            await self._drop_tickers(gone)
+
+    async def latest(
+        self,
+        ticker: str,
+        timeout: float = 0.0,
+        max_age_seconds: float | None = None,
+    ) -> TopOfBook | None:
+        """Return the in-memory top of book, optionally waiting for the first snapshot."""
+        quote = self._fresh_quote(ticker, max_age_seconds)
+        if quote is not None or timeout <= 0:
+            return quote
+
+        async def _wait() -> TopOfBook | None:
+            async with self._updated:
+                await self._updated.wait_for(
+                    lambda: self._fresh_quote(ticker, max_age_seconds) is not None
+                )
+            return self._fresh_quote(ticker, max_age_seconds)
+
+        try:
+            return await asyncio.wait_for(_wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def watch_order(self, order_id: str) -> asyncio.Event:
+        """Return an event set on each fill for ``order_id`` and on every reconnect.
+
+        The caller clears it after handling and must ``unwatch_order`` when done.
+        """
+        event = self._order_watchers.get(order_id)
+        if event is None:
+            event = asyncio.Event()
+            self._order_watchers[order_id] = event
+        return event
+
+    def unwatch_order(self, order_id: str) -> None:
+        self._order_watchers.pop(order_id, None)
+
+    def book(self, ticker: str) -> OrderBook | None:
+        """Full streamed book for ``ticker`` once its snapshot has arrived."""
+        return self._books.get(ticker)
+
+    def _fresh_quote(self, ticker: str, max_age_seconds: float | None) -> TopOfBook | None:
+        quote = self._quotes.get(ticker)
+        if quote is None:
+            return None
+        if max_age_seconds is not None and quote.age_seconds > max_age_seconds:
+            return None
+        return quote
+
+    async def _drop_tickers(self, tickers: list[str]) -> None:
+        """Forget untracked tickers locally and remove them from their subscriptions."""
+        gone = set(tickers)
+        for ticker in gone:
+            self._books.pop(ticker, None)
+            self._quotes.pop(ticker, None)
+        for sid, members in list(self._sid_tickers.items()):
+            removed = members & gone
+            if not removed:
+                continue
+            members -= removed
+            if members:
+                await self._send_command("update_subscription", {
+                    "sids": [sid],
+                    "market_tickers": sorted(removed),
+                    "action": "delete_markets",
+                })
+            else:
+                del self._sid_tickers[sid]
+                self._seqs.pop(sid, None)
+                self._stale_sids.add(sid)
+                await self._send_command("unsubscribe", {"sids": [sid]})
+
+    async def _resync(self, sid: int, last_seq: int, seq: int) -> None:
+        """Drop the books behind a sequence gap and resubscribe for fresh snapshots."""
+        tickers = sorted(self._sid_tickers.pop(sid, set()) & self._tickers.keys())
+        self._seqs.pop(sid, None)
+        self._stale_sids.add(sid)
+        logger.warning(
+            "KalshiMarketStream seq gap on sid %d (%d -> %d); resubscribing %d markets",
+            sid, last_seq, seq, len(tickers),
+        )
+        for ticker in tickers:
+            self._books.pop(ticker, None)
+            self._quotes.pop(ticker, None)
+        await self._send_command("unsubscribe", {"sids": [sid]})
+        if tickers:
+            await self._send_subscribe(tickers, channels=[_BOOK_CHANNEL])
+
+    def _auth_headers(self) -> dict[str, str]:
+        if self.auth is None:
+            return {}
+        return self.auth.get_auth_headers("GET", _WS_SIGN_PATH)
+
+    async def _send_command(self, cmd: str, params: dict[str, Any]) -> None:
+        if self._ws is None:
+            return
+        command = {"id": next(self._msg_ids), "cmd": cmd, "params": params}
+        await self._ws.send(json.dumps(command))
+
+    async def _send_subscribe(self, tickers: list[str], channels: list[str] = _CHANNELS) -> None:
+        await self._send_command("subscribe", {"channels": channels, "market_tickers": tickers})
+
+    async def _send_fill_subscribe(self) -> None:
+        await self._send_command("subscribe", {"channels": [_FILL_CHANNEL]})
+
+    async def _run(self) -> None:
+        """Connect, subscribe, and pump messages forever, reconnecting with backoff."""
+        backoff = self.config.stream_reconnect_min_seconds
+        while not self._closing:
+            try:
+                self._ws = await self._connect(self.config.ws_url, self._auth_headers())
+                logger.info("KalshiMarketStream connected (%d tickers)", len(self._tickers))
+                backoff = self.config.stream_reconnect_min_seconds
+                if self._tickers:
+                    await self._send_subscribe(sorted(self._tickers))
+                if self.auth is not None:
+                    await self._send_fill_subscribe()
+                async for raw in self._ws:
+                    await self._handle_message(raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not self._closing:
+                    logger.warning("KalshiMarketStream disconnected: %s", e)
+            finally:
+                self._ws = None
+                # Books cannot be trusted across a gap in the delta sequence.
+                self._books.clear()
+                self._quotes.clear()
+                self._seqs.clear()
+                self._sid_tickers.clear()
+                self._stale_sids.clear()
+                # Fills may have been missed during the gap; make watchers re-poll.
+                for event in self._order_watchers.values():
+                    event.set()
+
+            if self._closing:
+                break
+            logger.info("KalshiMarketStream reconnecting in %.1fs", backoff)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.config.stream_reconnect_max_seconds)
+
+    async def _handle_message(self, raw: str | bytes) -> None:
+        try:
+            message = json.loads(raw)
+        except (TypeError, ValueError):
+            logger.debug("KalshiMarketStream ignoring non-JSON frame")
+            return
+
+        msg_type = message.get("type")
+        msg = message.get("msg") or {}
+        ticker = msg.get("market_ticker")
+
+        if msg_type == "error":
+            logger.warning("KalshiMarketStream error: %s", msg)
+            return
+        if msg_type == "fill":
+            event = self._order_watchers.get(msg.get("order_id", ""))
+            if event is not None:
+                event.set()
+            return
+        if not ticker or ticker not in self._tickers:
+            return  # includes messages still in flight after an unsubscribe
+
+        sid = message.get("sid")
+        if sid is not None:
+            if sid in self._stale_sids:
+                return
+            self._sid_tickers.setdefault(sid, set()).add(ticker)
+            seq = message.get("seq")
+            if msg_type in _BOOK_MESSAGES and seq is not None:
+                last_seq = self._seqs.get(sid)
+                self._seqs[sid] = seq
+                if last_seq is not None and seq != last_seq + 1:
+                    await self._resync(sid, last_seq, seq)
+                    return
+
+        if msg_type == "orderbook_snapshot":
+            book = OrderBook.from_levels(
+                ticker,
+                yes=parse_levels(msg.get("yes_dollars_fp") or msg.get("yes_dollars") or msg.get("yes")),
+                no=parse_levels(msg.get("no_dollars_fp") or msg.get("no_dollars") or msg.get("no")),
+            )
+            self._books[ticker] = book
+            await self._publish(_top_of_book(book))
+        elif msg_type == "orderbook_delta":
+            book = self._books.get(ticker)
+            if book is None:
+                return  # delta before snapshot; wait for the snapshot
+            price = to_cents(msg.get("price_dollars") or msg.get("price"))
+            if price is None:
+                return
+            delta = to_count(msg.get("delta_fp") or msg.get("delta"))
+            book.apply_delta(msg.get("side", "yes"), price, delta)
+            await self._publish(_top_of_book(book))
+        elif msg_type == "ticker" and ticker not in self._books:
+            # Ticker updates only fill in markets whose book has not arrived yet;
+            # the orderbook channel is authoritative once a snapshot exists.
+            yes_bid = to_cents(msg.get("yes_bid_dollars") or msg.get("yes_bid")) or 0
+            yes_ask = to_cents(msg.get("yes_ask_dollars") or msg.get("yes_ask")) or 0
+            await self._publish(
+                TopOfBook(
+                    ticker=ticker,
+                    yes_bid=yes_bid,
+                    yes_ask=yes_ask,
+                    no_bid=100 - yes_ask if yes_ask else 0,
+                    no_ask=100 - yes_bid if yes_bid else 0,
+                    updated_at=time.monotonic(),
+                )
+            )
+
+    async def _publish(self, quote: TopOfBook) -> None:
+        self._quotes[quote.ticker] = quote
+        async with self._updated:
+            self._updated.notify_all()
+
+
+_active_stream: KalshiMarketStream | None = None
+
+
+def set_market_stream(stream: KalshiMarketStream | None) -> None:
+    """Register the process-wide stream (the daemon owns its lifecycle)."""
+    global _active_stream
+    _active_stream = stream
+
+
+def get_market_stream() -> KalshiMarketStream | None:
+    """Return the process-wide stream, or None when not running (CLI, paper mode)."""
+    return _active_stream
+
+
+async def get_streamed_quote(ticker: str, timeout: float = 0.0) -> TopOfBook | None:
+    """Subscribe to ``ticker`` on the active stream and return its top of book, if known."""
+    stream = get_market_stream()
+    if stream is None or not stream.connected:
+        return None
+    await stream.subscribe([ticker])
+    return await stream.latest(ticker, timeout=timeout)
+
+
+async def get_streamed_book(ticker: str, timeout: float = 0.0) -> OrderBook | None:
+    """Subscribe to ``ticker`` on the active stream and return its full book, if known."""
+    stream = get_market_stream()
+    if stream is None or not stream.connected:
+        return None
+    await stream.subscribe([ticker])
+    if await stream.latest(ticker, timeout=timeout) is None:
+        return None
+    return stream.book(ticker)
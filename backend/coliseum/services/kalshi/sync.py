@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
 from coliseum.services.kalshi import KalshiClient
 from coliseum.services.kalshi.models import Market, Position as KalshiPosition
-from coliseum.services.supabase.repositories.opportunities import load_opportunity_by_ticker_from_db
-from coliseum.services.supabase.repositories.portfolio import load_state_from_db
+from coliseum.services.kalshi.snapshot import MarketSnapshot
+from coliseum.services.supabase.repositories.opportunities import load_latest_opportunities_by_tickers
+from coliseum.services.supabase.repositories.portfolio import (
+    get_closed_position_index,
+    load_portfolio_summary,
+)
 from coliseum.domain.portfolio import (
     ClosedPosition,
     PortfolioState,
@@ -26,9 +29,13 @@ async def fetch_market_side_price(
     client: KalshiClient,
     market_ticker: str,
     side: str,
+    snapshot: MarketSnapshot | None = None,
 ) -> float | None:
     """Fetch best available bid/ask price for a side in decimal probability format."""
-    market = await client.get_market(market_ticker)
+    if snapshot is not None:
+        market = await snapshot.get(market_ticker)
+    else:
+        market = await client.get_market(market_ticker)
 
     # For finalized markets, use the resolution result directly.
     # Bid/ask values are meaningless artifacts after settlement.
@@ -138,37 +145,6 @@ def extract_fill_price(fill: dict[str, Any], side: str | None) -> float | None:
     )
 
 
-def _compute_average_entries(
-    fills: list[dict[str, Any]],
-) -> dict[tuple[str, str], float]:
-    """Compute weighted average entry price per ticker and side."""
-    totals: dict[tuple[str, str], tuple[float, int]] = {}
-    for fill in fills:
-        ticker = fill.get("ticker") or fill.get("market_ticker")
-        if not ticker:
-            continue
-        side = normalize_kalshi_side(fill.get("side"))
-        if not side:
-            continue
-        action = fill.get("action")
-        if action and str(action).lower() not in {"buy", "b"}:
-            continue
-        count = extract_fill_count(fill)
-        if not count:
-            continue
-        price = extract_fill_price(fill, side)
-        if price is None:
-            continue
-        key = (ticker, side)
-        total_cost, total_count = totals.get(key, (0.0, 0))
-        totals[key] = (total_cost + price * count, total_count + count)
-    return {
-        key: total_cost / total_count
-        for key, (total_cost, total_count) in totals.items()
-        if total_count > 0
-    }
-
-
 def _map_kalshi_position(
     kalshi_pos: KalshiPosition,
     avg_entry: float,
@@ -197,35 +173,54 @@ def _map_kalshi_position(
     )
 
 
-async def sync_portfolio_from_kalshi(client: KalshiClient) -> PortfolioState:
-    """Fetch live account data from Kalshi and build a fresh PortfolioState."""
+async def sync_portfolio_from_kalshi(
+    client: KalshiClient,
+    snapshot: MarketSnapshot | None = None,
+) -> PortfolioState:
+    """Fetch live account data from Kalshi and build a fresh PortfolioState.
+
+    ``last_updated`` is when the balance was requested: orders Kalshi accepted
+    before then have their collateral excluded from ``cash_balance``.
+    """
+    balance_requested_at = datetime.now(timezone.utc)
     balance = await client.get_balance()
     kalshi_positions = [
         pos for pos in await client.get_positions() if pos.position != 0
     ]
-    fills = await client.get_fills()
-    avg_entries = _compute_average_entries(fills)
+    # Imported here: the ledger module builds on the fill helpers above.
+    from coliseum.services.kalshi.fills import get_fills_ledger
 
-    existing_state = await load_state_from_db()
+    ledger = get_fills_ledger()
+    await ledger.sync(client)
+    avg_entries = ledger.average_entries()
+
+    existing_state = await load_portfolio_summary()
     existing_by_key = {
         (pos.market_ticker, pos.side): pos for pos in existing_state.open_positions
     }
 
-    # Fetch all market prices concurrently (avoids N+1 sequential API calls)
-    market_results = await asyncio.gather(
-        *[client.get_market(pos.market_ticker) for pos in kalshi_positions],
-        return_exceptions=True,
-    )
-    markets: dict[str, Any] = {}
-    for pos, result in zip(kalshi_positions, market_results):
-        if isinstance(result, Exception):
-            logger.warning(
-                "Failed to fetch market data for %s: %s",
-                pos.market_ticker,
-                result,
-            )
-        else:
-            markets[pos.market_ticker] = result
+    # One batched request for every position's market (shared with the rest of
+    # the Guardian loop when a snapshot is passed in).
+    if snapshot is None:
+        snapshot = MarketSnapshot(client)
+    tickers = [pos.market_ticker for pos in kalshi_positions]
+    try:
+        markets: dict[str, Any] = await snapshot.get_many(tickers)
+    except Exception as e:
+        logger.warning("Failed to fetch market data for %d positions: %s", len(tickers), e)
+        markets = {}
+    missing = [ticker for ticker in tickers if ticker not in markets]
+    if missing:
+        logger.warning("No market data for %s", ", ".join(missing))
+
+    # Positions without a real opp_ id are matched to the latest opportunity for
+    # their ticker; resolve them all in one query rather than one per position.
+    unresolved_tickers: set[str] = set()
+    for kalshi_pos in kalshi_positions:
+        existing = existing_by_key.get((kalshi_pos.market_ticker, normalize_kalshi_side(kalshi_pos.side)))
+        if existing is None or not (existing.opportunity_id or "").startswith("opp_"):
+            unresolved_tickers.add(kalshi_pos.market_ticker)
+    latest_opportunities = await load_latest_opportunities_by_tickers(unresolved_tickers)
 
     open_positions: list[Position] = []
     for kalshi_pos in kalshi_positions:
@@ -264,7 +259,7 @@ async def sync_portfolio_from_kalshi(client: KalshiClient) -> PortfolioState:
         if existing_opp_id and existing_opp_id.startswith("opp_"):
             opp_id = existing_opp_id
         else:
-            opp = await load_opportunity_by_ticker_from_db(kalshi_pos.market_ticker)
+            opp = latest_opportunities.get(kalshi_pos.market_ticker)
             if opp:
                 opp_id = opp.id
             else:
@@ -283,10 +278,7 @@ async def sync_portfolio_from_kalshi(client: KalshiClient) -> PortfolioState:
 
     # Filter out positions already reconciled as closed — Kalshi API can lag
     # after a limit sell fills, causing closed positions to reappear here.
-    already_closed_keys = {
-        (pos.market_ticker, pos.side)
-        for pos in existing_state.closed_positions
-    }
+    already_closed_keys = await get_closed_position_index().keys()
     pre_filter_count = len(open_positions)
     open_positions = [
         p for p in open_positions
@@ -306,14 +298,13 @@ async def sync_portfolio_from_kalshi(client: KalshiClient) -> PortfolioState:
     total_value = cash_balance + positions_value
 
     new_state = PortfolioState(
-        last_updated=None,
+        last_updated=balance_requested_at,
         portfolio=PortfolioStats(
             total_value=total_value,
             cash_balance=cash_balance,
             positions_value=positions_value,
         ),
         open_positions=open_positions,
-        closed_positions=existing_state.closed_positions,
         seen_tickers=existing_state.seen_tickers,
     )
     logger.info(
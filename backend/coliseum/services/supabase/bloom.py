@@ -0,0 +1,94 @@
+"""Fixed-size Bloom filter with a compact on-disk snapshot format.
+
+Used to persist large, append-only membership sets (seen tickers) so a cold
+process can answer "have we seen this?" without reading the whole table.
+Lookups can return false positives at roughly ``error_rate`` but never false
+negatives.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+_SNAPSHOT_VERSION = 1
+
+
+class BloomFilter:
+    """Bit-array Bloom filter using double hashing over one BLAKE2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size_bits = max(8, math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size_bits / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size_bits + 7) // 8)
+
+    @classmethod
+    def from_items(cls, items: Iterable[str], capacity: int, error_rate: float = 0.001) -> BloomFilter:
+        bloom = cls(capacity, error_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    @property
+    def saturated(self) -> bool:
+        """True once more items were added than the filter was sized for."""
+        return self.count > self.capacity
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def dump(self, path: Path, meta: dict[str, Any]) -> None:
+        """Atomically write the filter plus caller metadata to ``path``."""
+        header = {
+            "version": _SNAPSHOT_VERSION,
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "size_bits": self.size_bits,
+            "hashes": self.hashes,
+            "count": self.count,
+            "meta": meta,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            f.write(self._bits)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> tuple[BloomFilter, dict[str, Any]]:
+        """Read a snapshot written by ``dump``; raises ValueError if it is unusable."""
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            bits = f.read()
+        if header.get("version") != _SNAPSHOT_VERSION:
+            raise ValueError(f"unsupported snapshot version {header.get('version')!r}")
+        bloom = cls(header["capacity"], header["error_rate"])
+        if bloom.size_bits != header["size_bits"] or len(bits) != len(bloom._bits):
+            raise ValueError("snapshot size does not match its header")
+        bloom.hashes = header["hashes"]
+        bloom.count = header["count"]
+        bloom._bits = bytearray(bits)
+        return bloom, header.get("meta") or {}
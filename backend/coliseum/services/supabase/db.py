@@ -2,17 +2,43 @@
 
 Reads SUPABASE_DB_URL from environment (set via .env).
 Direct Postgres connection using asyncpg — not PostgREST.
+
+Pooling is selected by ``database.pool_mode`` in config.yaml. ``unit_of_work()``
+lets one pipeline stage run several repository calls on a single connection:
+``get_db_session()`` calls made inside it (in the same task) reuse its session.
 """
 
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import logfire
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from coliseum.config import get_settings
 
+logger = logging.getLogger(__name__)
+
+_acquire_histogram = logfire.metric_histogram(
+    "db.connection.acquire",
+    unit="s",
+    description="Time to obtain a Postgres connection for a session",
+)
+_session_reuse_counter = logfire.metric_counter(
+    "db.session.reused",
+    description="Repository calls served by an enclosing unit of work",
+)
+_round_trip_counter = logfire.metric_counter(
+    "db.round_trips",
+    description="SQL statements sent to Postgres",
+)
+
 
 class Base(DeclarativeBase):
     pass
@@ -23,12 +49,26 @@ def _build_engine():
     url = settings.supabase_db_url
     if not url:
         raise RuntimeError("SUPABASE_DB_URL is not set in environment")
+    db_config = settings.database
     # Session pooler (port 5432, Supavisor session mode):
     # - Compatible with asyncpg prepared statements, unlike transaction pooler (port 6543)
     #   which breaks asyncpg's prepared statement cache.
     # - NullPool means no persistent idle connections between daemon heartbeat cycles
     #   (queries run every 15-60 min), so we don't hold open connections that count
     #   against Supabase's connection limit. The pooler handles server-side connection reuse.
+    # - Queue mode keeps a small bounded pool for the burst of queries inside a cycle
+    #   and reaps it after pool_idle_timeout_seconds, trading a few idle slots for
+    #   skipping a connect + TLS handshake on every repository call.
+    if db_config.pool_mode == "queue":
+        return create_async_engine(
+            url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=db_config.pool_size,
+            max_overflow=db_config.max_overflow,
+            pool_timeout=db_config.pool_timeout_seconds,
+            pool_recycle=db_config.pool_recycle_seconds,
+            pool_pre_ping=True,
+        )
     return create_async_engine(
         url,
         poolclass=NullPool,
@@ -46,13 +86,188 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+class RoundTripCounter:
+    """Statements sent to Postgres from one counting scope."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+# Counter of the innermost count_round_trips() scope. SQLAlchemy runs the
+# cursor hook in a greenlet that shares the awaiting task's context, so only
+# statements from that task (and tasks it spawns) reach the counter.
+_round_trip_scope: ContextVar[RoundTripCounter | None] = ContextVar(
+    "coliseum_db_round_trips", default=None
+)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count_round_trip(conn, cursor, statement, parameters, context, executemany) -> None:
+    _round_trip_counter.add(1)
+    counter = _round_trip_scope.get()
+    if counter is not None:
+        counter.count += 1
+
+
+@contextmanager
+def count_round_trips() -> Generator[RoundTripCounter, None, None]:
+    """Count statements issued by the current task and its children until exit.
+
+    Concurrent work with its own context (the Guardian loop, background order
+    tasks, the telemetry flusher) is not counted.
+    """
+    counter = RoundTripCounter()
+    token = _round_trip_scope.set(counter)
+    try:
+        yield counter
+    finally:
+        _round_trip_scope.reset(token)
+
+
+# (session, owning task) of the innermost unit of work. Child tasks inherit the
+# context but must not share an AsyncSession, so reuse is limited to the owner.
+_current_unit: ContextVar[tuple[AsyncSession, asyncio.Task | None] | None] = ContextVar(
+    "coliseum_db_unit_of_work", default=None
+)
+
+
+class _PoolTracker:
+    """Open-session count and idle reaping for queue mode."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.reaper: asyncio.TimerHandle | None = None
+        self.disposal: asyncio.Task | None = None
+
+    def bind_loop(self) -> None:
+        # asyncpg connections belong to the loop that opened them; each CLI
+        # command runs its own asyncio.run(), so drop (without closing) any
+        # connections pooled by a previous loop.
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            if self.loop is not None and not isinstance(engine.pool, NullPool):
+                engine.sync_engine.dispose(close=False)
+            self.loop = loop
+            self.active = 0
+            self.reaper = None
+            self.disposal = None
+
+    def opened(self) -> None:
+        self.active += 1
+        if self.reaper is not None:
+            self.reaper.cancel()
+            self.reaper = None
+
+    def closed(self) -> None:
+        self.active -= 1
+        if self.active > 0 or isinstance(engine.pool, NullPool):
+            return
+        idle_timeout = get_settings().database.pool_idle_timeout_seconds
+        self.reaper = asyncio.get_running_loop().call_later(idle_timeout, self._reap)
+
+    def _reap(self) -> None:
+        self.reaper = None
+        if self.active == 0:
+            logger.debug("Reaping idle DB pool (%s)", engine.pool.status())
+            self.disposal = asyncio.get_running_loop().create_task(engine.dispose(), name="db-pool-reaper")
+            self.disposal.add_done_callback(self._reaped)
+
+    def _reaped(self, task: asyncio.Task) -> None:
+        if self.disposal is task:
+            self.disposal = None
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("Failed to dispose idle DB pool: %s", exc)
+
+
+_tracker = _PoolTracker()
+
+
+async def _acquire(session: AsyncSession) -> None:
+    started = time.monotonic()
+    await session.connection()
+    _acquire_histogram.record(
+        time.monotonic() - started,
+        attributes={"pool": engine.pool.__class__.__name__},
+    )
+
+
+@asynccontextmanager
+async def _tracked_connection() -> AsyncGenerator[AsyncConnection, None]:
+    _tracker.bind_loop()
+    _tracker.opened()
+    try:
+        started = time.monotonic()
+        async with engine.connect() as connection:
+            _acquire_histogram.record(
+                time.monotonic() - started,
+                attributes={"pool": engine.pool.__class__.__name__},
+            )
+            yield connection
+    finally:
+        _tracker.closed()
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncGenerator[AsyncSession, None]:
+    """Hold one connection for a stage; nested get_db_session() calls reuse it.
+
+    Repository commits still commit their own transactions; only the
+    connection (and its checkout/handshake) is shared.
+    """
+    outer = _current_unit.get()
+    if outer is not None and outer[1] is asyncio.current_task():
+        yield outer[0]
+        return
+
+    async with _tracked_connection() as connection:
+        async with AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            autoflush=False,
+        ) as session:
+            token = _current_unit.set((session, asyncio.current_task()))
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
+            finally:
+                _current_unit.reset(token)
+
 
 @asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Async context manager yielding a database session with auto-rollback on error."""
-    async with AsyncSessionLocal() as session:
+    unit = _current_unit.get()
+    if unit is not None and unit[1] is asyncio.current_task():
+        session = unit[0]
+        _session_reuse_counter.add(1)
         try:
             yield session
         except Exception:
+            # Leave the shared session usable for the rest of the unit of work.
             await session.rollback()
             raise
+        return
+
+    _tracker.bind_loop()
+    _tracker.opened()
+    try:
+        async with AsyncSessionLocal() as session:
+            try:
+                await _acquire(session)
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
+    finally:
+        _tracker.closed()
+
+
+def pool_status() -> str:
+    """Human-readable pool occupancy for logs."""
+    return engine.pool.status()
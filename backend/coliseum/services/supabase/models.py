@@ -8,6 +8,7 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     Text,
@@ -171,6 +172,9 @@ class PortfolioSnapshot(Base):
 
 class SeenTicker(Base):
     __tablename__ = "seen_tickers"
+    __table_args__ = (
+        Index("ix_seen_tickers_first_seen_at", "first_seen_at"),
+    )
 
     ticker: Mapped[str] = mapped_column(Text, primary_key=True)
     first_seen_at: Mapped[datetime] = mapped_column(
@@ -178,6 +182,73 @@ class SeenTicker(Base):
     )
 
 
+class KalshiFill(Base):
+    __tablename__ = "kalshi_fills"
+    __table_args__ = (
+        Index("ix_kalshi_fills_created_at", "created_at"),
+    )
+
+    fill_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    order_id: Mapped[str | None] = mapped_column(Text, nullable=True)
+    market_ticker: Mapped[str] = mapped_column(Text, nullable=False)
+    side: Mapped[str] = mapped_column(Text, nullable=False)
+    action: Mapped[str | None] = mapped_column(Text, nullable=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+    price: Mapped[Decimal] = mapped_column(Numeric(5, 4), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+
+
+class WorkingOrder(Base):
+    __tablename__ = "working_orders"
+    __table_args__ = (
+        Index("ix_working_orders_status", "status"),
+    )
+
+    id: Mapped[str] = mapped_column(Text, primary_key=True)
+    opportunity_id: Mapped[str] = mapped_column(Text, nullable=False)
+    market_ticker: Mapped[str] = mapped_column(Text, nullable=False)
+    side: Mapped[str] = mapped_column(Text, nullable=False)
+    contracts: Mapped[int] = mapped_column(Integer, nullable=False)
+    client_order_id: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    order_id: Mapped[str | None] = mapped_column(Text, nullable=True)
+    price_cents: Mapped[int] = mapped_column(Integer, nullable=False)
+    reprices_left: Mapped[int] = mapped_column(Integer, nullable=False)
+    reprice_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
+    reserved_cash: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    status: Mapped[str] = mapped_column(Text, nullable=False)
+    contracts_filled: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    fill_price: Mapped[Decimal | None] = mapped_column(Numeric(5, 4), nullable=True)
+    total_cost: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, server_default=text("0"))
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+
+
+class LlmResponse(Base):
+    __tablename__ = "llm_responses"
+    __table_args__ = (
+        Index("ix_llm_responses_expires_at", "expires_at"),
+    )
+
+    key: Mapped[str] = mapped_column(Text, primary_key=True)
+    agent: Mapped[str] = mapped_column(Text, nullable=False)
+    model: Mapped[str] = mapped_column(Text, nullable=False)
+    output: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+
+
+class EventMetadata(Base):
+    __tablename__ = "event_metadata"
+
+    event_ticker: Mapped[str] = mapped_column(Text, primary_key=True)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    category: Mapped[str] = mapped_column(Text, nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")
+    )
+
+
 class Decision(Base):
     __tablename__ = "decisions"
 
@@ -192,6 +263,7 @@ class Decision(Base):
     reasoning: Mapped[str] = mapped_column(Text, nullable=False)
     tldr: Mapped[str | None] = mapped_column(Text, nullable=True)
     execution_status: Mapped[str] = mapped_column(Text, nullable=False)
+    order_id: Mapped[str | None] = mapped_column(Text, nullable=True)
 
 
 class RunCycle(Base):
@@ -204,6 +276,7 @@ class RunCycle(Base):
     scout_found: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
     analyst_results: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     trader_results: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    stage_timings: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     cash_balance: Mapped[Decimal | None] = mapped_column(Numeric(12, 2), nullable=True)
     positions_value: Mapped[Decimal | None] = mapped_column(Numeric(12, 2), nullable=True)
     total_value: Mapped[Decimal | None] = mapped_column(Numeric(12, 2), nullable=True)
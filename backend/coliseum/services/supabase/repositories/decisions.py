@@ -9,13 +9,14 @@ from sqlalchemy import select
 from coliseum.memory.decisions import DecisionEntry
 from coliseum.services.supabase.db import get_db_session
 from coliseum.services.supabase.models import Decision
+from coliseum.services.supabase.write_behind import get_write_behind
 
 logger = logging.getLogger(__name__)
 
 
 async def save_decision_to_db(entry: DecisionEntry) -> None:
     """Persist a trading decision to the database."""
-    decision_row = Decision(
+    decision_values = dict(
         ts=entry.ts,
         opportunity_id=entry.opportunity_id if entry.opportunity_id else None,
         ticker=entry.ticker,
@@ -26,17 +27,37 @@ async def save_decision_to_db(entry: DecisionEntry) -> None:
         reasoning=entry.reasoning,
         tldr=entry.tldr if entry.tldr else None,
         execution_status=entry.execution_status,
+        order_id=entry.order_id,
     )
 
-    async with get_db_session() as session:
-        session.add(decision_row)
-        await session.commit()
+    await get_write_behind().submit("decisions", decision_values)
 
     logger.info("Saved decision for ticker %s (opportunity_id=%s) to DB", entry.ticker, entry.opportunity_id)
 
 
+def _row_to_entry(row: Decision) -> DecisionEntry:
+    return DecisionEntry(
+        ts=row.ts,
+        opportunity_id=row.opportunity_id or "",
+        ticker=row.ticker,
+        action=row.action,
+        price=float(row.price),
+        contracts=row.contracts,
+        confidence=float(row.confidence),
+        reasoning=row.reasoning,
+        tldr=row.tldr or "",
+        execution_status=row.execution_status,
+        order_id=row.order_id,
+    )
+
+
 async def load_recent_decisions_from_db(hours: int = 24) -> list[DecisionEntry]:
-    """Load decisions recorded within the last `hours` hours, newest first."""
+    """Load decisions recorded within the last `hours` hours, newest first.
+
+    A ``pending`` entry (an order handed to the OrderManager) is dropped once
+    another entry for the same opportunity records how the order finished.
+    The two can land in either order when an order fills quickly.
+    """
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
 
     async with get_db_session() as session:
@@ -45,18 +66,28 @@ async def load_recent_decisions_from_db(hours: int = 24) -> list[DecisionEntry]:
         )
         rows = result.scalars().all()
 
+    settled = {
+        row.opportunity_id
+        for row in rows
+        if row.opportunity_id and row.execution_status != "pending"
+    }
     return [
-        DecisionEntry(
-            ts=row.ts,
-            opportunity_id=row.opportunity_id or "",
-            ticker=row.ticker,
-            action=row.action,
-            price=float(row.price),
-            contracts=row.contracts,
-            confidence=float(row.confidence),
-            reasoning=row.reasoning,
-            tldr=row.tldr or "",
-            execution_status=row.execution_status,
-        )
+        _row_to_entry(row)
         for row in rows
+        if row.execution_status != "pending" or row.opportunity_id not in settled
     ]
+
+
+async def load_latest_decision_from_db(opportunity_id: str) -> DecisionEntry | None:
+    """Return the most recent decision recorded for an opportunity."""
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(Decision)
+            .where(Decision.opportunity_id == opportunity_id)
+            .order_by(Decision.ts.desc())
+            .limit(1)
+        )
+        row = result.scalars().first()
+    if row is None:
+        return None
+    return _row_to_entry(row)
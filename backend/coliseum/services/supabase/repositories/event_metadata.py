@@ -0,0 +1,65 @@
+"""DB repository for cached Kalshi event metadata (title and category)."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from coliseum.services.supabase.db import get_db_session
+from coliseum.services.supabase.models import EventMetadata
+
+logger = logging.getLogger(__name__)
+
+# Keeps IN lists and multi-row VALUES well under asyncpg's bind-parameter cap.
+_CHUNK_SIZE = 1000
+
+
+async def load_event_metadata_from_db(
+    event_tickers: list[str],
+    fetched_after: datetime,
+) -> dict[str, tuple[str, str, datetime]]:
+    """Return (title, category, fetched_at) for tickers fetched after the cutoff."""
+    found: dict[str, tuple[str, str, datetime]] = {}
+    if not event_tickers:
+        return found
+    async with get_db_session() as session:
+        for start in range(0, len(event_tickers), _CHUNK_SIZE):
+            chunk = event_tickers[start:start + _CHUNK_SIZE]
+            result = await session.execute(
+                select(EventMetadata).where(
+                    EventMetadata.event_ticker.in_(chunk),
+                    EventMetadata.fetched_at >= fetched_after,
+                )
+            )
+            for row in result.scalars().all():
+                found[row.event_ticker] = (row.title, row.category, row.fetched_at)
+    return found
+
+
+async def save_event_metadata_to_db(entries: dict[str, tuple[str, str]]) -> None:
+    """Upsert (title, category) for each event ticker."""
+    if not entries:
+        return
+    now = datetime.now(timezone.utc)
+    values = [
+        {"event_ticker": ticker, "title": title, "category": category, "fetched_at": now}
+        for ticker, (title, category) in entries.items()
+    ]
+    async with get_db_session() as session:
+        for start in range(0, len(values), _CHUNK_SIZE):
+            stmt = pg_insert(EventMetadata).values(values[start:start + _CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["event_ticker"],
+                set_={
+                    "title": stmt.excluded.title,
+                    "category": stmt.excluded.category,
+                    "fetched_at": stmt.excluded.fetched_at,
+                },
+            )
+            await session.execute(stmt)
+        await session.commit()
+
+    logger.info("Saved metadata for %d events", len(entries))
@@ -0,0 +1,63 @@
+"""DB repository for the Kalshi fills ledger."""
+
+from __future__ import annotations
+
+import logging
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from coliseum.domain.fill import Fill
+from coliseum.domain.mappers import to_decimal, to_float
+from coliseum.services.supabase.db import get_db_session
+from coliseum.services.supabase.models import KalshiFill
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1000
+
+async def save_fills_to_db(fills: list[Fill]) -> None:
+    """Insert fills, ignoring any already in the ledger."""
+    if not fills:
+        return
+    values = [
+        {
+            "fill_id": fill.fill_id,
+            "order_id": fill.order_id,
+            "market_ticker": fill.market_ticker,
+            "side": fill.side,
+            "action": fill.action,
+            "count": fill.count,
+            "price": to_decimal(round(fill.price, 4)),
+            "created_at": fill.created_at,
+        }
+        for fill in fills
+    ]
+    async with get_db_session() as session:
+        for start in range(0, len(values), _CHUNK_SIZE):
+            stmt = pg_insert(KalshiFill).values(values[start:start + _CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_nothing(index_elements=["fill_id"])
+            await session.execute(stmt)
+        await session.commit()
+
+    logger.info("Saved %d fills to ledger", len(fills))
+
+
+async def load_fills_from_db() -> list[Fill]:
+    """Return every ledger fill, oldest first."""
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(KalshiFill).order_by(KalshiFill.created_at, KalshiFill.fill_id)
+        )
+        return [
+            Fill(
+                fill_id=row.fill_id,
+                order_id=row.order_id,
+                market_ticker=row.market_ticker,
+                side=row.side,
+                action=row.action,
+                count=row.count,
+                price=to_float(row.price),
+                created_at=row.created_at,
+            )
+            for row in result.scalars().all()
+        ]
@@ -0,0 +1,61 @@
+"""DB repository for cached LLM agent outputs, keyed by prompt fingerprint."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from coliseum.services.supabase.db import get_db_session
+from coliseum.services.supabase.models import LlmResponse
+
+logger = logging.getLogger(__name__)
+
+
+async def load_llm_response_from_db(key: str, now: datetime) -> dict[str, Any] | None:
+    """Return the cached output for ``key`` if it hasn't expired."""
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(LlmResponse.output).where(
+                LlmResponse.key == key,
+                LlmResponse.expires_at > now,
+            )
+        )
+        return result.scalar_one_or_none()
+
+
+async def save_llm_response_to_db(
+    key: str,
+    agent: str,
+    model: str,
+    output: dict[str, Any],
+    created_at: datetime,
+    expires_at: datetime,
+) -> None:
+    """Upsert a cached output and drop rows that have expired."""
+    values = {
+        "key": key,
+        "agent": agent,
+        "model": model,
+        "output": output,
+        "created_at": created_at,
+        "expires_at": expires_at,
+    }
+    stmt = pg_insert(LlmResponse).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["key"],
+        set_={
+            "output": stmt.excluded.output,
+            "created_at": stmt.excluded.created_at,
+            "expires_at": stmt.excluded.expires_at,
+        },
+    )
+    async with get_db_session() as session:
+        await session.execute(stmt)
+        await session.execute(delete(LlmResponse).where(LlmResponse.expires_at <= created_at))
+        await session.commit()
+
+    logger.debug("Cached %s response %s", agent, key[:12])
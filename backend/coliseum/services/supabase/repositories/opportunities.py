@@ -1,9 +1,15 @@
 """DB repository for opportunity persistence."""
 
 import logging
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import date, datetime, time, timezone
 
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects.postgresql import distinct_on
 
 from coliseum.domain.mappers import db_to_opportunity, opportunity_to_db, to_float
 from coliseum.domain.opportunity import OpportunitySignal
@@ -12,6 +18,27 @@ from coliseum.services.supabase.models import Opportunity, OpportunityAnalysis
 
 logger = logging.getLogger(__name__)
 
+_RECORD_CACHE_SIZE = 64
+
+# Built once so SQLAlchemy's compiled cache (and asyncpg's per-connection
+# prepared statement cache) are hit on every load.
+_OPPORTUNITY_WITH_ANALYSIS = select(Opportunity, OpportunityAnalysis).outerjoin(
+    OpportunityAnalysis, Opportunity.id == OpportunityAnalysis.opportunity_id
+)
+_RECORD_BY_ID = _OPPORTUNITY_WITH_ANALYSIS.where(Opportunity.id == bindparam("opportunity_id"))
+_LATEST_RECORD_BY_TICKER = (
+    _OPPORTUNITY_WITH_ANALYSIS
+    .where(Opportunity.market_ticker == bindparam("market_ticker"))
+    .order_by(Opportunity.discovered_at.desc())
+    .limit(1)
+)
+_LATEST_RECORDS_BY_TICKERS = (
+    _OPPORTUNITY_WITH_ANALYSIS
+    .where(Opportunity.market_ticker.in_(bindparam("market_tickers", expanding=True)))
+    .ext(distinct_on(Opportunity.market_ticker))
+    .order_by(Opportunity.market_ticker, Opportunity.discovered_at.desc())
+)
+
 
 def _map_trader_decision_to_action(trader_decision: str) -> str | None:
     """Map Trader decision enums to normalized opportunity action values."""
@@ -36,6 +63,7 @@ async def save_opportunity_to_db(
         await session.merge(opp_row)
         await session.merge(analysis_row)
         await session.commit()
+    _evict_cached_opportunity(opportunity.id)
 
     logger.info("Saved opportunity %s to DB", opportunity.id)
 
@@ -62,6 +90,7 @@ async def update_opportunity_research(
             .values(research_completed_at=completed_at)
         )
         await session.commit()
+    _evict_cached_opportunity(opportunity_id)
 
     if analysis_result.rowcount == 0:
         logger.warning(
@@ -95,6 +124,7 @@ async def update_opportunity_recommendation(
             )
         )
         await session.commit()
+    _evict_cached_opportunity(opportunity_id)
 
     if result.rowcount == 0:
         logger.warning(
@@ -123,6 +153,7 @@ async def mark_opportunity_failed_in_db(
             )
         )
         await session.commit()
+    _evict_cached_opportunity(opportunity_id)
 
     if result.rowcount == 0:
         logger.warning(
@@ -159,6 +190,7 @@ async def update_opportunity_trader_decision(
             .values(trader_tldr=trader_tldr)
         )
         await session.commit()
+    _evict_cached_opportunity(opportunity_id)
 
     if opp_result.rowcount == 0:
         logger.warning(
@@ -174,66 +206,8 @@ async def update_opportunity_trader_decision(
         logger.info("Updated trader decision for opportunity %s", opportunity_id)
 
 
-async def load_opportunity_from_db(opportunity_id: str) -> OpportunitySignal:
-    """Load a single opportunity and its analysis by ID, raising if absent."""
-    async with get_db_session() as session:
-        opp_result = await session.execute(
-            select(Opportunity).where(Opportunity.id == opportunity_id)
-        )
-        opp = opp_result.scalar_one_or_none()
-        if opp is None:
-            raise ValueError(f"Opportunity {opportunity_id} not found in DB")
-
-        analysis_result = await session.execute(
-            select(OpportunityAnalysis).where(
-                OpportunityAnalysis.opportunity_id == opportunity_id
-            )
-        )
-        analysis = analysis_result.scalar_one_or_none()
-
-    return db_to_opportunity(opp, analysis)
-
-
-async def load_opportunity_by_ticker_from_db(market_ticker: str) -> OpportunitySignal | None:
-    """Load the most recently discovered opportunity for a market ticker, or None."""
-    async with get_db_session() as session:
-        opp_result = await session.execute(
-            select(Opportunity)
-            .where(Opportunity.market_ticker == market_ticker)
-            .order_by(Opportunity.discovered_at.desc())
-            .limit(1)
-        )
-        opp = opp_result.scalar_one_or_none()
-        if opp is None:
-            return None
-
-        analysis_result = await session.execute(
-            select(OpportunityAnalysis).where(
-                OpportunityAnalysis.opportunity_id == opp.id
-            )
-        )
-        analysis = analysis_result.scalar_one_or_none()
-
-    return db_to_opportunity(opp, analysis)
-
-
-async def get_opportunity_body_from_db(opportunity_id: str) -> str:
-    """Reconstruct a markdown prompt body for an opportunity from DB rows."""
-    async with get_db_session() as session:
-        opp_result = await session.execute(
-            select(Opportunity).where(Opportunity.id == opportunity_id)
-        )
-        opp = opp_result.scalar_one_or_none()
-        if opp is None:
-            return ""
-
-        analysis_result = await session.execute(
-            select(OpportunityAnalysis).where(
-                OpportunityAnalysis.opportunity_id == opportunity_id
-            )
-        )
-        analysis = analysis_result.scalar_one_or_none()
-
+def render_opportunity_body(opp: Opportunity, analysis: OpportunityAnalysis | None) -> str:
+    """Render the markdown prompt body for an opportunity from its DB rows."""
     yes_price = to_float(opp.yes_price)
     no_price = to_float(opp.no_price)
 
@@ -318,6 +292,135 @@ async def get_opportunity_body_from_db(opportunity_id: str) -> str:
     return body
 
 
+@dataclass(frozen=True)
+class OpportunityRecord:
+    """An opportunity with its rendered markdown body, loaded in one query."""
+
+    signal: OpportunitySignal
+    body: str
+
+
+class OpportunityRecordCache:
+    """Small LRU of loaded records shared by the stages of one cycle."""
+
+    def __init__(self, max_entries: int = _RECORD_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._records: OrderedDict[str, OpportunityRecord] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, opportunity_id: str) -> OpportunityRecord | None:
+        record = self._records.get(opportunity_id)
+        if record is None:
+            self.misses += 1
+            return None
+        self._records.move_to_end(opportunity_id)
+        self.hits += 1
+        return record
+
+    def put(self, record: OpportunityRecord) -> None:
+        self._records[record.signal.id] = record
+        self._records.move_to_end(record.signal.id)
+        while len(self._records) > self.max_entries:
+            self._records.popitem(last=False)
+
+    def evict(self, opportunity_id: str) -> None:
+        self._records.pop(opportunity_id, None)
+
+
+# Cache of the enclosing opportunity_cycle_cache() scope (inherited by child
+# tasks). Outside a scope, e.g. in the API, every load reads the DB.
+_cycle_cache: ContextVar[OpportunityRecordCache | None] = ContextVar(
+    "coliseum_opportunity_cycle_cache", default=None
+)
+_live_caches: set[OpportunityRecordCache] = set()
+
+
+@contextmanager
+def opportunity_cycle_cache(max_entries: int = _RECORD_CACHE_SIZE) -> Iterator[OpportunityRecordCache]:
+    """Cache opportunity records for the duration of one pipeline/guardian cycle."""
+    cache = OpportunityRecordCache(max_entries)
+    token = _cycle_cache.set(cache)
+    _live_caches.add(cache)
+    try:
+        yield cache
+    finally:
+        _live_caches.discard(cache)
+        _cycle_cache.reset(token)
+
+
+def _evict_cached_opportunity(opportunity_id: str) -> None:
+    # Writes can come from another cycle's scope (pipeline vs guardian).
+    for cache in _live_caches:
+        cache.evict(opportunity_id)
+
+
+def _record_from_row(opp: Opportunity, analysis: OpportunityAnalysis | None) -> OpportunityRecord:
+    record = OpportunityRecord(
+        signal=db_to_opportunity(opp, analysis),
+        body=render_opportunity_body(opp, analysis),
+    )
+    cache = _cycle_cache.get()
+    if cache is not None:
+        cache.put(record)
+    return record
+
+
+async def load_opportunity_record_from_db(opportunity_id: str) -> OpportunityRecord | None:
+    """Load an opportunity and its rendered body in one round trip, or None if absent."""
+    cache = _cycle_cache.get()
+    if cache is not None:
+        record = cache.get(opportunity_id)
+        if record is not None:
+            return record
+
+    async with get_db_session() as session:
+        row = (await session.execute(_RECORD_BY_ID, {"opportunity_id": opportunity_id})).one_or_none()
+    if row is None:
+        return None
+    return _record_from_row(*row)
+
+
+async def load_opportunity_from_db(opportunity_id: str) -> OpportunitySignal:
+    """Load a single opportunity and its analysis by ID, raising if absent."""
+    record = await load_opportunity_record_from_db(opportunity_id)
+    if record is None:
+        raise ValueError(f"Opportunity {opportunity_id} not found in DB")
+    return record.signal
+
+
+async def load_opportunity_by_ticker_from_db(market_ticker: str) -> OpportunitySignal | None:
+    """Load the most recently discovered opportunity for a market ticker, or None."""
+    async with get_db_session() as session:
+        row = (await session.execute(_LATEST_RECORD_BY_TICKER, {"market_ticker": market_ticker})).one_or_none()
+    if row is None:
+        return None
+    return _record_from_row(*row).signal
+
+
+async def load_latest_opportunities_by_tickers(
+    market_tickers: Iterable[str],
+) -> dict[str, OpportunitySignal]:
+    """Map each ticker to its most recently discovered opportunity, in one query.
+
+    Tickers without any opportunity are absent from the result.
+    """
+    tickers = sorted(set(market_tickers))
+    if not tickers:
+        return {}
+    async with get_db_session() as session:
+        rows = (await session.execute(_LATEST_RECORDS_BY_TICKERS, {"market_tickers": tickers})).all()
+    return {opp.market_ticker: _record_from_row(opp, analysis).signal for opp, analysis in rows}
+
+
+async def get_opportunity_body_from_db(opportunity_id: str) -> str:
+    """Reconstruct a markdown prompt body for an opportunity from DB rows."""
+    record = await load_opportunity_record_from_db(opportunity_id)
+    if record is None:
+        return ""
+    return record.body
+
+
 async def get_entry_rationale_from_db(opportunity_id: str) -> str | None:
     """Fetch only the rationale field for an opportunity, or None if absent."""
     async with get_db_session() as session:
@@ -373,5 +476,6 @@ async def append_x_sentiment_to_research(
         if result.rowcount == 0:
             logger.warning("No analysis row found for %s — X sentiment not persisted", opportunity_id)
         await session.commit()
+    _evict_cached_opportunity(opportunity_id)
 
     logger.info("Appended X sentiment to research for opportunity %s", opportunity_id)
@@ -1,6 +1,7 @@
 """DB repository for portfolio state and position persistence."""
 
 import logging
+import time
 from datetime import datetime, timezone
 
 from sqlalchemy import delete, select
@@ -13,7 +14,8 @@ from coliseum.domain.mappers import (
     portfolio_stats_to_db,
     to_decimal,
 )
-from coliseum.domain.portfolio import ClosedPosition, PortfolioState, Position
+from coliseum.config import get_settings
+from coliseum.domain.portfolio import ClosedPosition, PortfolioState, PortfolioStats, Position
 from coliseum.services.supabase.db import get_db_session
 from coliseum.services.supabase.models import (
     ClosedPosition as DBClosedPosition,
@@ -23,9 +25,118 @@ from coliseum.services.supabase.models import (
 
 logger = logging.getLogger(__name__)
 
+ClosedKey = tuple[str, str]  # (market_ticker, side)
+
+
+class PortfolioStateCache:
+    """Latest portfolio summary held in memory, kept in step with this process's writes.
+
+    Writes made through this module replace or patch the cached copy after
+    they commit. Reads older than the staleness bound, or made before any
+    load, go to the DB. A version counter stops a slow DB read from
+    overwriting a newer write-through.
+    """
+
+    def __init__(self, max_age_seconds: float):
+        self.max_age_seconds = max_age_seconds
+        self._state: PortfolioState | None = None
+        self._stored_at = 0.0
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, max_age_seconds: float | None = None) -> PortfolioState | None:
+        """Return a copy of the cached summary if it is fresh enough."""
+        if max_age_seconds is None:
+            max_age_seconds = self.max_age_seconds
+        if self._state is None or time.monotonic() - self._stored_at > max_age_seconds:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._state.model_copy(deep=True)
+
+    def fill(self, state: PortfolioState, version: int) -> None:
+        """Store a DB read unless a write landed while it was in flight."""
+        if version == self._version:
+            self._store(state)
+
+    def write_through(self, state: PortfolioState) -> None:
+        self._version += 1
+        self._store(state)
+
+    def apply_trade(self, position: Position, stats: PortfolioStats) -> None:
+        """Patch the cached summary with an upserted position and new balances."""
+        self._version += 1
+        if self._state is None:
+            return
+        open_positions = [p for p in self._state.open_positions if p.id != position.id]
+        open_positions.append(position)
+        self._store(PortfolioState(portfolio=stats, open_positions=open_positions))
+
+    def invalidate(self) -> None:
+        self._version += 1
+        self._state = None
+
+    def _store(self, state: PortfolioState) -> None:
+        self._state = PortfolioState(
+            portfolio=state.portfolio.model_copy(),
+            open_positions=[p.model_copy() for p in state.open_positions],
+        )
+        self._stored_at = time.monotonic()
+
+
+_portfolio_cache: PortfolioStateCache | None = None
+
+
+def get_portfolio_cache() -> PortfolioStateCache:
+    """Return the process-wide portfolio summary cache."""
+    global _portfolio_cache
+    if _portfolio_cache is None:
+        _portfolio_cache = PortfolioStateCache(
+            max_age_seconds=get_settings().database.portfolio_cache_max_age_seconds,
+        )
+    return _portfolio_cache
+
+
+async def load_portfolio_summary(max_age_seconds: float | None = None) -> PortfolioState:
+    """Load the portfolio singleton and open positions; closed_positions is left empty.
+
+    This is what nearly every caller needs (cash gate, sizing, prompt context).
+    Served from ``PortfolioStateCache`` when the cached copy is younger than
+    ``max_age_seconds`` (the configured bound by default; pass 0 to force a DB
+    read). Use ``get_closed_position_index()`` for closed-position lookups and
+    ``load_state_from_db()`` only when the full closed history is required.
+    """
+    cache = get_portfolio_cache()
+    cached = cache.get(max_age_seconds)
+    if cached is not None:
+        return cached
+
+    version = cache.version
+    state = await _load_portfolio_summary_from_db()
+    cache.fill(state, version)
+    return state
+
+
+async def _load_portfolio_summary_from_db() -> PortfolioState:
+    async with get_db_session() as session:
+        portfolio_result = await session.execute(
+            select(DBPortfolioState).where(DBPortfolioState.id == 1)
+        )
+        portfolio_row = portfolio_result.scalar_one_or_none()
+
+        open_result = await session.execute(select(DBOpenPosition))
+        open_rows = list(open_result.scalars().all())
+
+    return db_to_portfolio_state(portfolio_row, open_rows, [])
+
 
 async def load_state_from_db() -> PortfolioState:
-    """Load full portfolio state from the database."""
+    """Load full portfolio state from the database, including every closed position."""
     async with get_db_session() as session:
         portfolio_result = await session.execute(
             select(DBPortfolioState).where(DBPortfolioState.id == 1)
@@ -41,6 +152,53 @@ async def load_state_from_db() -> PortfolioState:
     return db_to_portfolio_state(portfolio_row, open_rows, closed_rows)
 
 
+async def load_closed_position_keys_from_db(after_id: int = 0) -> tuple[set[ClosedKey], int]:
+    """Return (market_ticker, side) keys of closed_positions rows with id > after_id, and the highest id read."""
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(DBClosedPosition.id, DBClosedPosition.market_ticker, DBClosedPosition.side)
+            .where(DBClosedPosition.id > after_id)
+        )
+        rows = result.all()
+
+    keys = {(row.market_ticker, row.side) for row in rows}
+    max_id = max((row.id for row in rows), default=after_id)
+    return keys, max_id
+
+
+class ClosedPositionIndex:
+    """Incrementally maintained set of (market_ticker, side) keys in closed_positions.
+
+    closed_positions is append-only, so each refresh reads only rows past the
+    highest id already indexed (a primary-key range scan) instead of the table.
+    """
+
+    def __init__(self) -> None:
+        self._keys: set[ClosedKey] = set()
+        self._watermark = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: ClosedKey) -> None:
+        self._keys.add(key)
+
+    async def keys(self) -> set[ClosedKey]:
+        """Refresh from the DB and return the live key set (do not mutate)."""
+        new_keys, max_id = await load_closed_position_keys_from_db(self._watermark)
+        self._keys.update(new_keys)
+        self._watermark = max(self._watermark, max_id)
+        return self._keys
+
+
+_closed_index = ClosedPositionIndex()
+
+
+def get_closed_position_index() -> ClosedPositionIndex:
+    """Return the process-wide closed-position key index."""
+    return _closed_index
+
+
 def _build_open_position_values(position: Position, *, updated_at: datetime) -> dict[str, object]:
     """Convert a domain Position to insert values for open_positions upserts."""
     return {
@@ -109,6 +267,17 @@ async def sync_portfolio_to_db(
         await session.merge(portfolio_row)
         await session.commit()
 
+    get_portfolio_cache().write_through(
+        PortfolioState(
+            portfolio=PortfolioStats(
+                cash_balance=cash_balance,
+                positions_value=positions_value,
+                total_value=total_value,
+            ),
+            open_positions=open_positions,
+        )
+    )
+
     logger.info(
         "Synced portfolio to DB: %d open positions, total_value=%.2f",
         len(open_positions),
@@ -130,6 +299,15 @@ async def update_portfolio_after_trade_in_db(
         await session.merge(portfolio_row)
         await session.commit()
 
+    get_portfolio_cache().apply_trade(
+        position,
+        PortfolioStats(
+            cash_balance=cash_balance,
+            positions_value=positions_value,
+            total_value=total_value,
+        ),
+    )
+
     logger.info(
         "Updated portfolio after trade: position=%s, total_value=%.2f",
         position.id,
@@ -145,6 +323,8 @@ async def save_closed_position_to_db(closed_pos: ClosedPosition) -> None:
         session.add(closed_row)
         await session.commit()
 
+    _closed_index.add((closed_pos.market_ticker, closed_pos.side))
+
     logger.info(
         "Saved closed position for ticker=%s, pnl=%.2f",
         closed_pos.market_ticker,
@@ -8,6 +8,7 @@ from sqlalchemy import func, select
 
 from coliseum.services.supabase.db import get_db_session
 from coliseum.services.supabase.models import ClosedPosition, PortfolioSnapshot
+from coliseum.services.supabase.write_behind import get_write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +35,7 @@ async def save_portfolio_snapshot_to_db(
     snapshot_at: datetime | None = None,
 ) -> None:
     """Persist one portfolio snapshot row for charting and operational history."""
-    row = PortfolioSnapshot(
+    row = dict(
         total_value=Decimal(str(total_value)),
         cash_balance=Decimal(str(cash_balance)),
         positions_value=Decimal(str(positions_value)),
@@ -43,13 +44,11 @@ async def save_portfolio_snapshot_to_db(
         snapshot_at=snapshot_at or datetime.now(timezone.utc),
     )
 
-    async with get_db_session() as session:
-        session.add(row)
-        await session.commit()
+    await get_write_behind().submit("portfolio_snapshots", row)
 
     logger.info(
         "Saved portfolio snapshot to DB (snapshot_at=%s)",
-        row.snapshot_at.isoformat(),
+        row["snapshot_at"].isoformat(),
     )
 
 
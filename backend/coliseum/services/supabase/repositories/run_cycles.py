@@ -8,6 +8,7 @@ from sqlalchemy import select
 
 from coliseum.services.supabase.db import get_db_session
 from coliseum.services.supabase.models import RunCycle
+from coliseum.services.supabase.write_behind import get_write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ async def save_run_cycle_to_db(
     scout_found: int = 0,
     analyst_results: dict | None = None,
     trader_results: dict | None = None,
+    stage_timings: dict | None = None,
     cash_balance: float = 0.0,
     positions_value: float = 0.0,
     total_value: float = 0.0,
@@ -27,13 +29,14 @@ async def save_run_cycle_to_db(
     errors: list[str] | None = None,
 ) -> None:
     """Persist a pipeline cycle summary row to the run_cycles telemetry table."""
-    row = RunCycle(
+    row = dict(
         cycle_at=cycle_at,
         duration_seconds=int(duration_seconds),
         scout_scanned=scout_scanned,
         scout_found=scout_found,
         analyst_results=analyst_results,
         trader_results=trader_results,
+        stage_timings=stage_timings,
         cash_balance=Decimal(str(cash_balance)),
         positions_value=Decimal(str(positions_value)),
         total_value=Decimal(str(total_value)),
@@ -41,9 +44,7 @@ async def save_run_cycle_to_db(
         errors=errors if errors else [],
     )
 
-    async with get_db_session() as session:
-        session.add(row)
-        await session.commit()
+    await get_write_behind().submit("run_cycles", row)
 
     logger.info("Saved run cycle to DB (cycle_at=%s)", cycle_at.isoformat())
 
@@ -1,15 +1,24 @@
 """DB repository for seen ticker persistence."""
 
 import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from coliseum.config import get_settings
+from coliseum.services.supabase.bloom import BloomFilter
 from coliseum.services.supabase.db import get_db_session
 from coliseum.services.supabase.models import SeenTicker
+from coliseum.services.supabase.write_behind import get_write_behind
 
 logger = logging.getLogger(__name__)
 
+# Seen-ticker rows are written behind a buffer, so a row can commit slightly
+# after rows with later timestamps. Incremental loads re-read this much history.
+_WATERMARK_OVERLAP = timedelta(minutes=10)
+_MIN_BLOOM_CAPACITY = 10_000
+
 
 async def get_seen_tickers_from_db() -> list[str]:
     """Return all tickers previously discovered by Scout."""
@@ -18,13 +27,157 @@ async def get_seen_tickers_from_db() -> list[str]:
         return list(result.scalars().all())
 
 
+async def load_seen_tickers_since_from_db(since: datetime) -> list[tuple[str, datetime]]:
+    """Return (ticker, first_seen_at) for tickers first seen at or after ``since``."""
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(SeenTicker.ticker, SeenTicker.first_seen_at)
+            .where(SeenTicker.first_seen_at >= since)
+        )
+        return [(row.ticker, row.first_seen_at) for row in result.all()]
+
+
 async def add_seen_ticker_to_db(ticker: str) -> None:
     """Insert a seen ticker, ignoring if it already exists."""
-    stmt = pg_insert(SeenTicker).values(ticker=ticker).on_conflict_do_nothing(
-        index_elements=["ticker"]
+    seen_at = datetime.now(timezone.utc)
+    await get_write_behind().submit(
+        "seen_tickers",
+        {"ticker": ticker, "first_seen_at": seen_at},
     )
-    async with get_db_session() as session:
-        await session.execute(stmt)
-        await session.commit()
+    get_seen_ticker_index().add(ticker, seen_at)
 
     logger.info("Added seen ticker %s", ticker)
+
+
+class SeenTickerIndex:
+    """Incrementally loaded seen-ticker membership with a Bloom filter snapshot.
+
+    Only tickers first seen within ``ttl`` count as seen; older ones belong to
+    markets long closed and are dropped. A warm index holds the exact set in
+    memory and each refresh reads only rows past the last watermark.
+
+    The Bloom filter covering the same window is written to ``snapshot_path``
+    after every refresh. A cold process loads it and fetches only rows newer
+    than its watermark; until the next rebuild, tickers not in the in-memory
+    set are answered by the filter (false positives at about ``error_rate``,
+    i.e. an occasional unseen market is skipped). The window is rebuilt from
+    the DB once the filter is older than ``ttl`` or over capacity.
+    """
+
+    def __init__(self, snapshot_path: Path, ttl: timedelta, error_rate: float = 0.001):
+        self.snapshot_path = snapshot_path
+        self.ttl = ttl
+        self.error_rate = error_rate
+        self._recent: dict[str, datetime] = {}
+        self._bloom: BloomFilter | None = None
+        self._bloom_built_at: datetime | None = None
+        # True while tickers older than the in-memory set are only in the filter.
+        self._use_bloom = False
+        self._watermark: datetime | None = None
+        self._snapshot_checked = False
+
+    def __contains__(self, ticker: object) -> bool:
+        if ticker in self._recent:
+            return True
+        return self._use_bloom and self._bloom is not None and ticker in self._bloom
+
+    def __len__(self) -> int:
+        """Approximate member count (exact when no snapshot is in use)."""
+        if self._use_bloom and self._bloom is not None:
+            return max(len(self._recent), self._bloom.count)
+        return len(self._recent)
+
+    def add(self, ticker: str, seen_at: datetime | None = None) -> None:
+        if seen_at is None:
+            seen_at = datetime.now(timezone.utc)
+        self._recent.setdefault(ticker, seen_at)
+        if self._bloom is not None:
+            self._bloom.add(ticker)
+
+    async def refresh(self, now: datetime | None = None) -> None:
+        """Bring the index up to date with the DB and persist the snapshot."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        cutoff = now - self.ttl
+        if not self._snapshot_checked:
+            self._snapshot_checked = True
+            self._load_snapshot(cutoff)
+
+        if (
+            self._bloom is None
+            or self._bloom_built_at is None
+            or self._bloom_built_at < cutoff
+            or self._bloom.saturated
+        ):
+            await self._rebuild(now, cutoff)
+        else:
+            rows = await load_seen_tickers_since_from_db(self._watermark - _WATERMARK_OVERLAP)
+            self._merge(rows)
+
+        for ticker in [t for t, seen_at in self._recent.items() if seen_at < cutoff]:
+            del self._recent[ticker]
+        self._save_snapshot()
+
+    async def _rebuild(self, now: datetime, cutoff: datetime) -> None:
+        rows = await load_seen_tickers_since_from_db(cutoff)
+        # Keep local additions that may still be waiting in the write-behind buffer.
+        rows.extend((t, seen_at) for t, seen_at in self._recent.items() if seen_at >= cutoff)
+        self._recent = {}
+        self._bloom = BloomFilter(max(_MIN_BLOOM_CAPACITY, 2 * len(rows)), self.error_rate)
+        self._bloom_built_at = now
+        self._use_bloom = False
+        self._watermark = cutoff
+        self._merge(rows)
+        logger.info("Rebuilt seen-ticker index: %d tickers in the last %s", len(self._recent), self.ttl)
+
+    def _merge(self, rows: list[tuple[str, datetime]]) -> None:
+        for ticker, seen_at in rows:
+            if ticker not in self._recent:
+                self.add(ticker, seen_at)
+            if self._watermark is None or seen_at > self._watermark:
+                self._watermark = seen_at
+
+    def _load_snapshot(self, cutoff: datetime) -> None:
+        if not self.snapshot_path.exists():
+            return
+        try:
+            bloom, meta = BloomFilter.load(self.snapshot_path)
+            built_at = datetime.fromisoformat(meta["built_at"])
+            watermark = datetime.fromisoformat(meta["watermark"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable seen-ticker snapshot %s: %s", self.snapshot_path, e)
+            return
+        if built_at < cutoff:
+            return
+        self._bloom = bloom
+        self._bloom_built_at = built_at
+        self._watermark = watermark
+        self._use_bloom = True
+        logger.info("Loaded seen-ticker snapshot (%d tickers, watermark %s)", bloom.count, watermark)
+
+    def _save_snapshot(self) -> None:
+        if self._bloom is None or self._watermark is None:
+            return
+        try:
+            self._bloom.dump(
+                self.snapshot_path,
+                {"built_at": self._bloom_built_at.isoformat(), "watermark": self._watermark.isoformat()},
+            )
+        except OSError as e:
+            logger.warning("Could not write seen-ticker snapshot %s: %s", self.snapshot_path, e)
+
+
+_seen_index: SeenTickerIndex | None = None
+
+
+def get_seen_ticker_index() -> SeenTickerIndex:
+    """Return the process-wide seen-ticker index, configured from ScoutConfig."""
+    global _seen_index
+    if _seen_index is None:
+        cfg = get_settings().scout
+        _seen_index = SeenTickerIndex(
+            snapshot_path=cfg.seen_ticker_snapshot_path,
+            ttl=timedelta(days=cfg.seen_ticker_ttl_days),
+            error_rate=cfg.seen_ticker_bloom_error_rate,
+        )
+    return _seen_index
@@ -0,0 +1,45 @@
+"""DB repository for in-flight working orders."""
+
+import logging
+
+from sqlalchemy import select
+
+from coliseum.domain.mappers import db_to_working_order, working_order_to_db
+from coliseum.domain.working_order import WorkingOrder
+from coliseum.services.supabase.db import get_db_session
+from coliseum.services.supabase.models import WorkingOrder as DBWorkingOrder
+
+logger = logging.getLogger(__name__)
+
+
+async def save_working_order_to_db(order: WorkingOrder) -> None:
+    """Insert or update a working order checkpoint."""
+    row = working_order_to_db(order)
+
+    async with get_db_session() as session:
+        await session.merge(row)
+        await session.commit()
+
+    logger.debug("Saved working order %s (%s)", order.id, order.status)
+
+
+async def load_working_orders_for_opportunity_from_db(opportunity_id: str) -> list[WorkingOrder]:
+    """Return every order (in any status) placed for one opportunity."""
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(DBWorkingOrder)
+            .where(DBWorkingOrder.opportunity_id == opportunity_id)
+            .order_by(DBWorkingOrder.created_at)
+        )
+        return [db_to_working_order(row) for row in result.scalars().all()]
+
+
+async def load_open_working_orders_from_db() -> list[WorkingOrder]:
+    """Return orders that were still being worked, oldest first."""
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(DBWorkingOrder)
+            .where(DBWorkingOrder.status == "working")
+            .order_by(DBWorkingOrder.created_at)
+        )
+        return [db_to_working_order(row) for row in result.scalars().all()]
@@ -0,0 +1,309 @@
+"""Write-behind buffer for append-only telemetry rows.
+
+Decisions, run cycles, portfolio snapshots and seen tickers are only ever
+inserted, and nothing on the trading path reads them back immediately. While
+the daemon is running, their repositories hand rows to ``WriteBehindBuffer``
+instead of committing one row per session. The buffer flushes them with
+multi-row INSERTs, all tables in one transaction, when ``batch_size`` rows
+are pending, every ``flush_interval_seconds``, and on shutdown. A batch
+either commits whole or not at all, so a retry never repeats rows that an
+earlier partial flush already wrote.
+
+Every accepted row is first appended to a local JSONL spool. The spool is
+rewritten to the unflushed remainder after each successful flush and replayed
+on the next start, so rows survive a Postgres outage or a crash (delivery is
+at-least-once: a crash between commit and spool rewrite replays the batch;
+seen tickers are deduplicated by key, the others may repeat). The spool is
+capped at ``max_spool_rows``; past that the oldest rows are dropped.
+
+A batch the database rejects outright (a constraint or data error rather
+than an outage) is retried one row per transaction, and the rows that still
+fail are moved to a ``.rejected`` file beside the spool instead of blocking
+every later flush. Outside the daemon (CLI commands, tests) the buffer is
+not started and ``submit`` inserts synchronously, as before.
+
+Trades and positions never go through this module.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import logfire
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DataError, IntegrityError
+
+from coliseum.config import get_settings
+from coliseum.services.supabase.db import get_db_session
+from coliseum.services.supabase.models import Decision, PortfolioSnapshot, RunCycle, SeenTicker
+
+logger = logging.getLogger(__name__)
+
+_TABLES = {
+    "decisions": Decision,
+    "run_cycles": RunCycle,
+    "portfolio_snapshots": PortfolioSnapshot,
+    "seen_tickers": SeenTicker,
+}
+# Tables whose rows are keyed and may be re-submitted (e.g. replayed spool).
+_CONFLICT_KEYS = {"seen_tickers": ["ticker"]}
+_INSERT_CHUNK_ROWS = 500
+# Errors caused by the rows themselves; retrying the same rows can't succeed.
+_ROW_ERRORS = (IntegrityError, DataError)
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    raise TypeError(f"Cannot spool {type(value).__name__}")
+
+
+def _decode(obj: dict[str, Any]) -> Any:
+    if "$decimal" in obj:
+        return Decimal(obj["$decimal"])
+    if "$datetime" in obj:
+        return datetime.fromisoformat(obj["$datetime"])
+    return obj
+
+
+@dataclass
+class _Pending:
+    table: str
+    values: dict[str, Any]
+
+
+async def insert_batch(rows_by_table: dict[str, list[dict[str, Any]]]) -> None:
+    """Insert rows into telemetry tables with multi-row INSERTs in a single transaction."""
+    async with get_db_session() as session:
+        for table, rows in rows_by_table.items():
+            model = _TABLES[table]
+            conflict_keys = _CONFLICT_KEYS.get(table)
+            for start in range(0, len(rows), _INSERT_CHUNK_ROWS):
+                stmt = pg_insert(model).values(rows[start:start + _INSERT_CHUNK_ROWS])
+                if conflict_keys:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=conflict_keys)
+                await session.execute(stmt)
+        await session.commit()
+
+
+async def insert_rows(table: str, rows: list[dict[str, Any]]) -> None:
+    """Insert rows into one telemetry table in a single transaction."""
+    await insert_batch({table: rows})
+
+
+def _group_by_table(entries: list[_Pending]) -> dict[str, list[dict[str, Any]]]:
+    by_table: dict[str, list[dict[str, Any]]] = {}
+    for entry in entries:
+        by_table.setdefault(entry.table, []).append(entry.values)
+    return by_table
+
+
+class WriteBehindBuffer:
+    """Batches telemetry inserts behind a durable JSONL spool."""
+
+    def __init__(
+        self,
+        spool_path: Path,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 5.0,
+        max_spool_rows: int = 50_000,
+    ):
+        self.spool_path = spool_path
+        self.rejected_path = spool_path.with_name(f"{spool_path.stem}.rejected{spool_path.suffix}")
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_spool_rows = max(self.batch_size, max_spool_rows)
+        self._pending: list[_Pending] = []
+        self._flush_lock: asyncio.Lock | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+        self.flushed_rows = 0
+        self.failed_flushes = 0
+        self.rejected_rows = 0
+        self.dropped_rows = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def start(self) -> None:
+        """Replay any spooled rows and start the periodic flusher."""
+        if self.running:
+            return
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._pending = self._read_spool()
+        if self._pending:
+            logger.info("Replaying %d spooled telemetry rows from %s", len(self._pending), self.spool_path)
+            self._enforce_cap()
+        self._task = asyncio.create_task(self._run(), name="telemetry-write-behind")
+
+    async def close(self) -> None:
+        """Stop the flusher after a final flush (the spool keeps anything that fails)."""
+        task = self._task
+        if task is None:
+            return
+        # Let the flusher finish rather than cancelling it mid-INSERT, which
+        # could commit rows that are then replayed from the spool.
+        self._stopping = True
+        self._wakeup.set()
+        await task
+        self._task = None
+
+    async def submit(self, table: str, values: dict[str, Any]) -> None:
+        """Queue one row, or insert it immediately when the buffer isn't running."""
+        if not self.running:
+            await insert_rows(table, [values])
+            return
+        entry = _Pending(table, values)
+        self._append_spool(self.spool_path, [entry])
+        self._pending.append(entry)
+        self._enforce_cap()
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Write all pending rows; returns how many were flushed (0 on failure)."""
+        lock = self._flush_lock or asyncio.Lock()
+        async with lock:
+            batch = list(self._pending)
+            if not batch:
+                return 0
+            by_table = _group_by_table(batch)
+
+            try:
+                with logfire.span("telemetry flush", rows=len(batch), tables=sorted(by_table)):
+                    await insert_batch(by_table)
+            except _ROW_ERRORS as e:
+                logger.warning("Telemetry batch of %d rows rejected, retrying row by row: %s", len(batch), e)
+                done, delivered = await self._flush_rows(batch)
+            except Exception as e:
+                self.failed_flushes += 1
+                logger.warning("Telemetry flush of %d rows failed, keeping them spooled: %s", len(batch), e)
+                return 0
+            else:
+                done, delivered = batch, len(batch)
+
+            if not done:
+                return 0
+            # Rows submitted (or dropped by the cap) while the insert was in
+            # flight are tracked by identity, not position.
+            done_ids = {id(entry) for entry in done}
+            self._pending = [entry for entry in self._pending if id(entry) not in done_ids]
+            self._rewrite_spool(self._pending)
+            self.flushed_rows += delivered
+            return delivered
+
+    async def _flush_rows(self, batch: list[_Pending]) -> tuple[list[_Pending], int]:
+        """Insert ``batch`` one row per transaction, setting aside rows the database rejects.
+
+        Stops at the first failure that isn't the row's fault. Returns the
+        entries that were resolved (inserted or set aside) and how many were
+        inserted.
+        """
+        done: list[_Pending] = []
+        rejected: list[_Pending] = []
+        for entry in batch:
+            try:
+                await insert_batch({entry.table: [entry.values]})
+            except _ROW_ERRORS as e:
+                rejected.append(entry)
+                logfire.error("Telemetry row rejected", table=entry.table, error=str(e))
+            except Exception as e:
+                self.failed_flushes += 1
+                logger.warning("Telemetry row-by-row flush interrupted, keeping the rest spooled: %s", e)
+                break
+            done.append(entry)
+        if rejected:
+            self._append_spool(self.rejected_path, rejected)
+            self.rejected_rows += len(rejected)
+        return done, len(done) - len(rejected)
+
+    def _enforce_cap(self) -> None:
+        """Drop the oldest rows once the spool exceeds ``max_spool_rows``."""
+        excess = len(self._pending) - self.max_spool_rows
+        if excess <= 0:
+            return
+        # Trim below the cap so a sustained outage rewrites the spool rarely.
+        drop = excess + self.max_spool_rows // 10
+        self._pending = self._pending[drop:]
+        self._rewrite_spool(self._pending)
+        self.dropped_rows += drop
+        logfire.error("Telemetry spool full, dropped oldest rows", dropped=drop, kept=len(self._pending))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+            if self._stopping:
+                return
+
+    def _append_spool(self, path: Path, entries: list[_Pending]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps({"table": entry.table, "values": entry.values}, default=_encode) + "\n")
+            f.flush()
+
+    def _rewrite_spool(self, entries: list[_Pending]) -> None:
+        if not entries:
+            self.spool_path.unlink(missing_ok=True)
+            return
+        tmp_path = self.spool_path.with_suffix(self.spool_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps({"table": entry.table, "values": entry.values}, default=_encode) + "\n")
+        tmp_path.replace(self.spool_path)
+
+    def _read_spool(self) -> list[_Pending]:
+        if not self.spool_path.exists():
+            return []
+        entries: list[_Pending] = []
+        with open(self.spool_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line, object_hook=_decode)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-append.
+                    logger.warning("Skipping unreadable spool line %d in %s", line_number, self.spool_path)
+                    continue
+                if record.get("table") in _TABLES:
+                    entries.append(_Pending(record["table"], record["values"]))
+        return entries
+
+
+_buffer: WriteBehindBuffer | None = None
+
+
+def get_write_behind() -> WriteBehindBuffer:
+    """Return the process-wide telemetry buffer, configured from DatabaseConfig."""
+    global _buffer
+    if _buffer is None:
+        cfg = get_settings().database
+        _buffer = WriteBehindBuffer(
+            spool_path=cfg.write_behind_spool_path,
+            batch_size=cfg.write_behind_batch_size,
+            flush_interval_seconds=cfg.write_behind_flush_seconds,
+            max_spool_rows=cfg.write_behind_max_spool_rows,
+        )
+    return _buffer
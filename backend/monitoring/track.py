@@ -21,6 +21,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from coliseum.config import get_settings
 from coliseum.services.kalshi.client import KalshiClient
 from coliseum.services.kalshi.config import KalshiConfig
+from coliseum.services.kalshi.event_metadata import get_event_metadata_cache
 
 CSV_PATH = Path(__file__).parent / "markets.csv"
 
@@ -101,16 +102,9 @@ async def collect() -> None:
         # Same pre-filters as scout/main.py
         markets = [m for m in markets if m.volume >= s.min_volume]
 
-        # Fetch event metadata for all unique event tickers in this batch
+        # Event metadata is shared with Scout; only never-seen events hit the API
         unique_tickers = {m.event_ticker for m in markets}
-        event_data: dict[str, tuple[str, str]] = {}
-        for et in unique_tickers:
-            try:
-                event = await client.get_event(et)
-                event_data[et] = (event.get("title", ""), event.get("category", ""))
-            except Exception:
-                event_data[et] = ("", "")
-            await asyncio.sleep(0.1)
+        event_data = await get_event_metadata_cache().get_many(client, unique_tickers)
 
     existing = _load_existing_keys()
     new_rows: list[dict] = []
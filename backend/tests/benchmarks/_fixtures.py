@@ -0,0 +1,140 @@
+"""Recorded Kalshi market payloads for offline benchmarks.
+
+Rows come from ``monitoring/markets.csv`` (real markets the Scout has seen) and
+are re-shaped into the ``GET /markets`` wire format, then replicated with
+ticker suffixes to reach the requested universe size.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+MARKETS_CSV = Path(__file__).resolve().parents[2] / "monitoring" / "markets.csv"
+
+
+def _dollars(cents: int) -> str:
+    return f"{cents / 100:.4f}"
+
+
+def load_raw_markets(count: int) -> list[dict[str, Any]]:
+    """Return ``count`` raw market dicts in Kalshi API shape."""
+    with MARKETS_CSV.open(newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    base_close = datetime.now(timezone.utc) + timedelta(hours=1)
+    markets: list[dict[str, Any]] = []
+    i = 0
+    while len(markets) < count:
+        row = rows[i % len(rows)]
+        copy = i // len(rows)
+        price = int(row["entry_price"] or 50)
+        spread = 1 + (i % 4)
+        if row["side"] == "yes":
+            yes_ask, no_ask = price, 100 - price + spread
+        else:
+            yes_ask, no_ask = 100 - price + spread, price
+        ticker = row["ticker"] if copy == 0 else f"{row['ticker']}-R{copy}"
+        markets.append(
+            {
+                "ticker": ticker,
+                "event_ticker": row["event_ticker"],
+                "title": row["title"],
+                "yes_sub_title": row["subtitle"],
+                "yes_bid_dollars": _dollars(max(100 - no_ask, 0)),
+                "yes_ask_dollars": _dollars(min(yes_ask, 99)),
+                "no_bid_dollars": _dollars(max(100 - yes_ask, 0)),
+                "no_ask_dollars": _dollars(min(no_ask, 99)),
+                "volume_fp": f"{int(row['volume'] or 0):.2f}",
+                "volume_24h_fp": f"{int(row['volume'] or 0) // 3:.2f}",
+                "open_interest_fp": f"{int(row['open_interest'] or 0):.2f}",
+                "close_time": (base_close + timedelta(minutes=i % 2880)).isoformat().replace("+00:00", "Z"),
+                "status": "active",
+                "result": "",
+            }
+        )
+        i += 1
+    return markets
+
+
+def _page(items: list[Any], params: httpx.QueryParams, result_key: str) -> dict[str, Any]:
+    start = int(params.get("cursor") or 0)
+    limit = int(params.get("limit") or 100)
+    if start + limit < len(items):
+        cursor = str(start + limit)
+    else:
+        cursor = ""
+    return {result_key: items[start:start + limit], "cursor": cursor}
+
+
+def recorded_transport(
+    markets: list[dict[str, Any]],
+    latency_seconds: float = 0.05,
+) -> httpx.MockTransport:
+    """Serve ``markets`` through the Kalshi REST routes with a fixed per-request latency.
+
+    ``GET /markets`` honors ``limit``, ``cursor``, ``tickers`` and
+    ``min_close_ts``/``max_close_ts``; ``GET /events`` pages events (optionally
+    with nested markets); ``GET /events/{ticker}`` returns one event. Every
+    client fetch mode can therefore run against the same recording.
+    """
+    closes = [
+        int(datetime.fromisoformat(m["close_time"].replace("Z", "+00:00")).timestamp())
+        for m in markets
+    ]
+    events: dict[str, dict[str, Any]] = {}
+    event_members: dict[str, list[int]] = {}
+    with MARKETS_CSV.open(newline="") as f:
+        titles = {row["event_ticker"]: (row["event_title"], row["category"]) for row in csv.DictReader(f)}
+    for i, market in enumerate(markets):
+        event_ticker = market["event_ticker"]
+        if event_ticker not in events:
+            title, category = titles.get(event_ticker, ("", ""))
+            events[event_ticker] = {"event_ticker": event_ticker, "title": title, "category": category}
+            event_members[event_ticker] = []
+        event_members[event_ticker].append(i)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency_seconds)
+        params = request.url.params
+        path = request.url.path.rsplit("/trade-api/v2/", 1)[-1]
+
+        if path == "markets":
+            selected = list(range(len(markets)))
+            if "min_close_ts" in params:
+                lo = int(params["min_close_ts"])
+                hi = int(params["max_close_ts"])
+                selected = [i for i in selected if lo <= closes[i] < hi]
+            if "tickers" in params:
+                wanted = set(params["tickers"].split(","))
+                selected = [i for i in selected if markets[i]["ticker"] in wanted]
+            body = _page([markets[i] for i in selected], params, "markets")
+        elif path == "events":
+            nested = params.get("with_nested_markets") == "true"
+            min_close = int(params.get("min_close_ts") or 0)
+            payload = []
+            for event_ticker, event in events.items():
+                members = event_members[event_ticker]
+                if not any(closes[i] >= min_close for i in members):
+                    continue
+                if nested:
+                    payload.append({**event, "markets": [markets[i] for i in members]})
+                else:
+                    payload.append(event)
+            body = _page(payload, params, "events")
+        elif path.startswith("events/"):
+            event = events.get(path.split("/", 1)[1])
+            if event is None:
+                return httpx.Response(404)
+            body = {"event": event}
+        else:
+            return httpx.Response(404)
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+    return httpx.MockTransport(handler)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: contract-by-contract book walk vs. vectorized ``plan_entry``.
+
+Plans entries against synthetic ask ladders (random depth and level sizes
+around the 92-96¢ band) both ways and checks that they choose the same size.
+
+The walk costs O(contracts) and ``plan_entry`` O(levels) plus fixed NumPy
+call overhead, so the gap depends on how deep the levels are
+(``--max-level-size``).
+
+Usage: python tests/benchmarks/bench_entry_planner.py [--books 2000] [--levels 20] [--contracts 500] [--max-level-size 500]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import numpy as np
+
+from coliseum.services.kalshi.entry_planner import plan_entry
+
+MAX_SLIPPAGE = 0.02
+
+
+def synthetic_books(
+    count: int,
+    levels: int,
+    max_level_size: int,
+    seed: int = 11,
+) -> list[tuple[np.ndarray, np.ndarray, float]]:
+    rng = np.random.default_rng(seed)
+    books = []
+    for _ in range(count):
+        best = int(rng.integers(90, 97))
+        prices = np.arange(best, min(best + levels, 100))
+        sizes = rng.integers(1, max_level_size + 1, prices.size)
+        books.append((prices, sizes, float(best)))
+    return books
+
+
+def walk_book(prices: np.ndarray, sizes: np.ndarray, contracts: int, reference: float) -> int:
+    """The naive planner: take one contract at a time until the VWAP leaves the bound."""
+    bound = reference * (1 + MAX_SLIPPAGE)
+    taken, cost = 0, 0.0
+    for price, size in zip(prices.tolist(), sizes.tolist()):
+        for _ in range(size):
+            if taken == contracts or (cost + price) / (taken + 1) > bound + 1e-9:
+                return taken
+            taken += 1
+            cost += price
+    return taken
+
+
+def plan_vectorized(prices: np.ndarray, sizes: np.ndarray, contracts: int, reference: float) -> int:
+    plan = plan_entry(prices, sizes, contracts, reference, MAX_SLIPPAGE)
+    return plan.contracts if plan else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=2000)
+    parser.add_argument("--levels", type=int, default=20)
+    parser.add_argument("--contracts", type=int, default=500)
+    parser.add_argument("--max-level-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    books = synthetic_books(args.books, args.levels, args.max_level_size)
+    naive = [walk_book(p, s, args.contracts, ref) for p, s, ref in books]
+    vectorized = [plan_vectorized(p, s, args.contracts, ref) for p, s, ref in books]
+    assert naive == vectorized, "planners disagree"
+
+    for name, fn in (("walk", walk_book), ("vectorized", plan_vectorized)):
+        seconds = min(timeit.repeat(
+            lambda fn=fn: [fn(p, s, args.contracts, ref) for p, s, ref in books],
+            number=1,
+            repeat=args.repeat,
+        ))
+        print(f"{name:>10}: {seconds * 1e6 / len(books):8.1f} µs/book  ({seconds * 1e3:.1f} ms for {len(books)} books)")
+
+
+if __name__ == "__main__":
+    main()
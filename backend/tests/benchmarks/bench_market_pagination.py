@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark: list pagination vs. streamed prefetching pagination for the Scout scan.
+
+Compares ``get_markets_closing_in_range`` followed by filtering against
+``iter_markets_closing_in_range`` with filters applied as pages arrive, on a
+recorded page fixture with simulated network latency.
+
+Usage: python tests/benchmarks/bench_market_pagination.py [--markets 20000] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _fixtures import load_raw_markets, recorded_transport
+
+from coliseum.services.kalshi.client import KalshiClient
+from coliseum.services.kalshi.config import KalshiConfig
+from coliseum.services.kalshi.models import Market
+from coliseum.services.kalshi.rate_limit import KalshiRateLimiter
+
+MIN_VOLUME = 5000
+
+
+def _keep(market: Market) -> bool:
+    return market.volume >= MIN_VOLUME and 92 <= market.yes_ask <= 96
+
+
+def _client(raw_markets: list[dict], latency: float) -> KalshiClient:
+    return KalshiClient(
+        config=KalshiConfig(),
+        rate_limiter=KalshiRateLimiter(read_rate_per_second=1000, write_rate_per_second=1000),
+        transport=recorded_transport(raw_markets, latency_seconds=latency),
+    )
+
+
+async def run_list(raw_markets: list[dict], latency: float) -> int:
+    async with _client(raw_markets, latency) as client:
+        markets = await client.get_markets_closing_in_range(0, 48, limit=len(raw_markets))
+        return len([m for m in markets if _keep(m)])
+
+
+async def run_streamed(raw_markets: list[dict], latency: float) -> int:
+    kept = []
+    async with _client(raw_markets, latency) as client:
+        async for market in client.iter_markets_closing_in_range(0, 48, limit=len(raw_markets)):
+            if _keep(market):
+                kept.append(market)
+    return len(kept)
+
+
+def measure(label: str, coro_fn, raw_markets: list[dict], latency: float) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    kept = asyncio.run(coro_fn(raw_markets, latency))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} wall={elapsed:7.3f}s  peak={peak / 1e6:7.1f}MB  kept={kept}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--markets", type=int, default=20000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    raw_markets = load_raw_markets(args.markets)
+    print(f"{args.markets} markets, {args.latency * 1000:.0f}ms per page")
+    measure("list", run_list, raw_markets, args.latency)
+    measure("streamed", run_streamed, raw_markets, args.latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmark: validated Market.from_api vs. MarketRow fast-path decoding.
+
+Decodes a recorded 10k-market ``GET /markets`` page body end to end (JSON
+bytes to market objects). orjson is used for the last variant when installed.
+
+Usage: python tests/benchmarks/bench_market_parser.py [--markets 10000] [--repeat 10]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _fixtures import load_raw_markets
+
+from coliseum.services.kalshi.models import Market, MarketRow
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_validated(body: bytes) -> list[Market]:
+    return [Market.from_api(m) for m in json.loads(body)["markets"]]
+
+
+def parse_rows(body: bytes) -> list[MarketRow]:
+    return [MarketRow.from_api(m) for m in json.loads(body)["markets"]]
+
+
+def parse_rows_orjson(body: bytes) -> list[MarketRow]:
+    return [MarketRow.from_api(m) for m in orjson.loads(body)["markets"]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--markets", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    body = json.dumps({"markets": load_raw_markets(args.markets), "cursor": ""}).encode()
+    variants = [("Market (pydantic)", parse_validated), ("MarketRow", parse_rows)]
+    if orjson is not None:
+        variants.append(("MarketRow + orjson", parse_rows_orjson))
+    else:
+        print("orjson not installed; skipping orjson variant")
+
+    reference = [(m.ticker, m.yes_ask, m.no_ask, m.volume, m.close_time) for m in parse_validated(body)]
+    print(f"{args.markets} markets, {len(body) / 1e6:.1f}MB body, best of {args.repeat}")
+    for label, fn in variants:
+        rows = fn(body)
+        assert [(m.ticker, m.yes_ask, m.no_ask, m.volume, m.close_time) for m in rows] == reference
+        best = min(timeit.repeat(lambda: fn(body), number=1, repeat=args.repeat))
+        print(f"{label:<20} {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark: full portfolio state load vs. summary + incremental closed-key index.
+
+Simulates a 100k-row closed_positions table in process. The full path
+materializes every closed row (ORM object + domain model), as
+``load_state_from_db`` does, and rebuilds the (ticker, side) key set. The
+split path maps the singleton and open positions only, and refreshes the key
+index from the rows past its watermark. Network transfer of the closed rows,
+which the split path also avoids, is not included.
+
+Usage: python tests/benchmarks/bench_portfolio_loader.py [--closed 100000] [--open 20] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import sys
+import timeit
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from coliseum.domain.mappers import db_to_portfolio_state
+from coliseum.services.supabase.models import (
+    ClosedPosition as DBClosedPosition,
+    OpenPosition as DBOpenPosition,
+    PortfolioState as DBPortfolioState,
+)
+from coliseum.services.supabase.repositories import portfolio
+
+
+def _closed_row(i: int) -> dict:
+    return {
+        "id": i + 1,
+        "market_ticker": f"KXBENCH-{i // 2:06d}-T{i % 7}",
+        "side": "YES" if i % 2 else "NO",
+        "contracts": 8,
+        "entry_price": Decimal("0.9500"),
+        "exit_price": Decimal("1.0000"),
+        "pnl": Decimal("0.40"),
+        "opportunity_id": f"opp_{i:08x}",
+        "closed_at": datetime(2026, 4, 1, tzinfo=timezone.utc),
+        "entry_rationale": "Benchmark row",
+    }
+
+
+def _open_rows(count: int) -> list[DBOpenPosition]:
+    return [
+        DBOpenPosition(
+            id=f"pos_{i:08x}",
+            market_ticker=f"KXOPEN-{i}",
+            side="YES",
+            contracts=8,
+            average_entry=Decimal("0.9500"),
+            current_price=Decimal("0.9600"),
+            opportunity_id=f"opp_open_{i}",
+            close_time=None,
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--closed", type=int, default=100_000)
+    parser.add_argument("--open", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    closed_values = [_closed_row(i) for i in range(args.closed)]
+    open_rows = _open_rows(args.open)
+    singleton = DBPortfolioState(
+        id=1,
+        cash_balance=Decimal("250.00"),
+        positions_value=Decimal("150.00"),
+        total_value=Decimal("400.00"),
+    )
+
+    def full_load() -> set[tuple[str, str]]:
+        closed_rows = [DBClosedPosition(**values) for values in closed_values]
+        state = db_to_portfolio_state(singleton, open_rows, closed_rows)
+        return {(pos.market_ticker, pos.side) for pos in state.closed_positions}
+
+    async def fake_key_query(after_id: int = 0):
+        rows = [
+            SimpleNamespace(id=v["id"], market_ticker=v["market_ticker"], side=v["side"])
+            for v in closed_values[after_id:]
+        ]
+        keys = {(row.market_ticker, row.side) for row in rows}
+        return keys, max((row.id for row in rows), default=after_id)
+
+    portfolio.load_closed_position_keys_from_db = fake_key_query
+    loop = asyncio.new_event_loop()
+    index = portfolio.ClosedPositionIndex()
+    assert loop.run_until_complete(index.keys()) == full_load()
+
+    def cold_index() -> set[tuple[str, str]]:
+        return loop.run_until_complete(portfolio.ClosedPositionIndex().keys())
+
+    def split_load() -> set[tuple[str, str]]:
+        db_to_portfolio_state(singleton, open_rows, [])
+        return loop.run_until_complete(index.keys())
+
+    print(f"{args.closed} closed rows, {args.open} open positions, best of {args.repeat}")
+    for label, fn in [
+        ("full load_state_from_db", full_load),
+        ("key index (cold start)", cold_index),
+        ("summary + key index (warm)", split_load),
+    ]:
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        print(f"{label:<28} {best * 1000:9.2f} ms")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-market Pydantic filtering vs. columnar MarketFrame masks.
+
+Filters a universe the size of ``monitoring/markets.csv`` with the Scout
+baseline filters (seen tickers, volume, price band, spread) both ways and
+checks that they keep the same markets.
+
+Usage: python tests/benchmarks/bench_scout_filtering.py [--markets 6450] [--repeat 20]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+from _fixtures import load_raw_markets
+
+from coliseum.services.kalshi.frame import SIDE_NONE, MarketFrame
+from coliseum.services.kalshi.models import Market
+
+MIN_PRICE, MAX_PRICE, MAX_SPREAD, MIN_VOLUME = 92, 96, 3, 1000
+
+
+def _side_is_tradeable(bid: int, ask: int) -> bool:
+    if ask == 0 or bid <= 0:
+        return False
+    if not MIN_PRICE <= ask <= MAX_PRICE:
+        return False
+    return (ask - bid) <= MAX_SPREAD
+
+
+def filter_objects(raw_markets: list[dict], seen: set[str]) -> list[str]:
+    """The pre-frame Scout path: validate every market, then filter in Python."""
+    markets = [Market.from_api(m) for m in raw_markets]
+    markets = [m for m in markets if m.ticker not in seen]
+    markets = [m for m in markets if m.volume >= MIN_VOLUME]
+    return [
+        m.ticker
+        for m in markets
+        if _side_is_tradeable(m.yes_bid, m.yes_ask) or _side_is_tradeable(m.no_bid, m.no_ask)
+    ]
+
+
+def filter_frame(raw_markets: list[dict], seen: set[str]) -> list[str]:
+    frame = MarketFrame.from_raw(raw_markets)
+    sides = frame.entry_sides(MIN_PRICE, MAX_PRICE, MAX_SPREAD)
+    keep = frame.unseen_mask(seen) & (frame.volume >= MIN_VOLUME) & (sides != SIDE_NONE)
+    return [frame.row(i).ticker for i in np.flatnonzero(keep)]
+
+
+def _spread_prices(raw_markets: list[dict], keep_every: int = 20) -> list[dict]:
+    """Move most rows out of the Scout band: markets.csv only records in-band entries."""
+    rng = random.Random(7)
+    spread = []
+    for i, market in enumerate(raw_markets):
+        if i % keep_every:
+            yes_ask = rng.randint(2, 99)
+            market = {
+                **market,
+                "yes_ask_dollars": f"{yes_ask / 100:.4f}",
+                "yes_bid_dollars": f"{(yes_ask - 1) / 100:.4f}",
+                "no_ask_dollars": f"{(101 - yes_ask) / 100:.4f}",
+                "no_bid_dollars": f"{(100 - yes_ask) / 100:.4f}",
+            }
+        spread.append(market)
+    return spread
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--markets", type=int, default=6450)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    raw_markets = _spread_prices(load_raw_markets(args.markets))
+    seen = {m["ticker"] for m in raw_markets[::10]}
+
+    expected = filter_objects(raw_markets, seen)
+    assert filter_frame(raw_markets, seen) == expected, "frame path diverged from object path"
+
+    print(f"{args.markets} markets, {len(expected)} survivors, best of {args.repeat}")
+    for label, fn in (("objects", filter_objects), ("frame", filter_frame)):
+        best = min(timeit.repeat(lambda: fn(raw_markets, seen), number=1, repeat=args.repeat))
+        print(f"{label:<8} {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark: Scout prefetch via markets + per-event lookups vs. events with nested markets.
+
+Runs ``_prefetch_markets_for_scan`` in both ``ScoutConfig.prefetch_mode``
+settings against the same recorded fixture, with a cold event-metadata cache
+and no database, and reports wall time and request count.
+
+Usage: python tests/benchmarks/bench_scout_prefetch_modes.py [--markets 20000] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+from _fixtures import load_raw_markets, recorded_transport
+
+import coliseum.services.kalshi.event_metadata as event_metadata
+from coliseum.agents.scout.main import _prefetch_markets_for_scan
+from coliseum.config import Settings
+from coliseum.services.kalshi.client import KalshiClient
+from coliseum.services.kalshi.config import KalshiConfig
+from coliseum.services.kalshi.rate_limit import KalshiRateLimiter
+
+
+class CountingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, inner: httpx.AsyncBaseTransport):
+        self.inner = inner
+        self.requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        return await self.inner.handle_async_request(request)
+
+
+async def prefetch(raw_markets: list[dict], latency: float, mode: str) -> tuple[int, int]:
+    settings = Settings()
+    settings.scout.prefetch_mode = mode
+    settings.scout.market_fetch_limit = len(raw_markets)
+    event_metadata._cache = event_metadata.EventMetadataCache(
+        ttl_seconds=3600, max_entries=100_000, use_db=False
+    )
+
+    transport = CountingTransport(recorded_transport(raw_markets, latency_seconds=latency))
+    client = KalshiClient(
+        config=KalshiConfig(),
+        rate_limiter=KalshiRateLimiter(read_rate_per_second=20, write_rate_per_second=10),
+        transport=transport,
+    )
+    async with client:
+        markets = await _prefetch_markets_for_scan(client, settings)
+    return len(markets), transport.requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--markets", type=int, default=20000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    raw_markets = load_raw_markets(args.markets)
+    print(f"{args.markets} markets, {args.latency * 1000:.0f}ms per request, Basic-tier read rate")
+    for mode in ("markets", "events"):
+        started = time.perf_counter()
+        count, requests = asyncio.run(prefetch(raw_markets, args.latency, mode))
+        elapsed = time.perf_counter() - started
+        print(f"{mode:<8} wall={elapsed:7.3f}s  requests={requests:5d}  prefetched={count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Benchmark: single cursor chain vs. close-time sharded concurrent market scan.
+
+Runs several consecutive scan "cycles" so the adaptive shard planner can learn
+the page distribution from the first one.
+
+Usage: python tests/benchmarks/bench_sharded_scan.py [--markets 20000] [--latency 0.05] [--cycles 3]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _fixtures import load_raw_markets, recorded_transport
+
+from coliseum.services.kalshi.client import KalshiClient
+from coliseum.services.kalshi.config import KalshiConfig
+from coliseum.services.kalshi.rate_limit import KalshiRateLimiter
+
+
+async def scan(raw_markets: list[dict], latency: float, shards: int | None) -> int:
+    client = KalshiClient(
+        config=KalshiConfig(),
+        # Kalshi Basic-tier read rate, so shards contend for tokens as in production.
+        rate_limiter=KalshiRateLimiter(read_rate_per_second=20, write_rate_per_second=10),
+        transport=recorded_transport(raw_markets, latency_seconds=latency),
+    )
+    async with client:
+        count = 0
+        async for _ in client.iter_markets_closing_in_range(0, 48, limit=len(raw_markets), shards=shards):
+            count += 1
+        return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--markets", type=int, default=20000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--cycles", type=int, default=3)
+    args = parser.parse_args()
+
+    raw_markets = load_raw_markets(args.markets)
+    print(f"{args.markets} markets, {args.latency * 1000:.0f}ms per page")
+
+    for label, shards in (("serial", 1), ("adaptive", None)):
+        for cycle in range(1, args.cycles + 1):
+            started = time.perf_counter()
+            count = asyncio.run(scan(raw_markets, args.latency, shards))
+            elapsed = time.perf_counter() - started
+            print(f"{label:<9} cycle={cycle}  wall={elapsed:6.3f}s  markets={count}")
+
+
+if __name__ == "__main__":
+    main()
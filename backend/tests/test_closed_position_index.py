@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Tests for the incremental closed-position key index."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.services.supabase.repositories import portfolio
+
+
+def test_index_reads_only_rows_past_watermark(monkeypatch) -> None:
+    table = [(1, "KXA-1", "YES"), (2, "KXB-1", "NO")]
+    queried_after: list[int] = []
+
+    async def fake_load(after_id: int = 0):
+        queried_after.append(after_id)
+        rows = [row for row in table if row[0] > after_id]
+        return {(ticker, side) for _, ticker, side in rows}, max((r[0] for r in rows), default=after_id)
+
+    monkeypatch.setattr(portfolio, "load_closed_position_keys_from_db", fake_load)
+
+    async def run() -> None:
+        index = portfolio.ClosedPositionIndex()
+        assert await index.keys() == {("KXA-1", "YES"), ("KXB-1", "NO")}
+        table.append((3, "KXC-1", "YES"))
+        assert ("KXC-1", "YES") in await index.keys()
+        assert await index.keys() == {("KXA-1", "YES"), ("KXB-1", "NO"), ("KXC-1", "YES")}
+        index.add(("KXD-1", "NO"))
+        assert len(index) == 4
+
+    asyncio.run(run())
+    assert queried_after == [0, 2, 3]
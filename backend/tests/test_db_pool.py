@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Tests for idle pool reaping and round-trip counting in the Supabase engine module."""
+
+import asyncio
+import contextvars
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.services.supabase import db
+
+
+class _FakePool:
+    def status(self) -> str:
+        return "idle"
+
+
+class _FailingEngine:
+    pool = _FakePool()
+
+    def __init__(self) -> None:
+        self.disposals = 0
+
+    async def dispose(self) -> None:
+        self.disposals += 1
+        raise RuntimeError("boom")
+
+
+def test_reap_keeps_and_clears_disposal_task(monkeypatch, caplog) -> None:
+    engine = _FailingEngine()
+    monkeypatch.setattr(db, "engine", engine)
+
+    async def run() -> None:
+        tracker = db._PoolTracker()
+        tracker._reap()
+        task = tracker.disposal
+        assert task is not None
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert tracker.disposal is None
+
+    with caplog.at_level(logging.WARNING, logger=db.__name__):
+        asyncio.run(run())
+    assert engine.disposals == 1
+    assert "Failed to dispose idle DB pool" in caplog.text
+
+
+def _statement() -> None:
+    db._count_round_trip(None, None, "SELECT 1", None, None, False)
+
+
+def test_round_trips_count_only_the_scoped_tasks() -> None:
+    async def child() -> None:
+        _statement()
+
+    async def run() -> db.RoundTripCounter:
+        with db.count_round_trips() as counter:
+            _statement()
+            await asyncio.create_task(child())
+            # Work running in its own context (background orders, Guardian) is excluded.
+            await asyncio.create_task(child(), context=contextvars.Context())
+        _statement()
+        return counter
+
+    counter = asyncio.run(run())
+    assert counter.count == 2
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for the depth-aware entry planner."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from coliseum.services.kalshi.entry_planner import plan_entry, split_child_orders
+from coliseum.services.kalshi.orderbook import OrderBook
+
+
+def _walk(prices: np.ndarray, sizes: np.ndarray, contracts: int, bound: float) -> int:
+    """Reference: add contracts one at a time while the running VWAP stays in bound."""
+    ladder = np.repeat(prices, sizes).astype(float)[:contracts]
+    running = np.cumsum(ladder) / np.arange(1, ladder.size + 1)
+    within = np.flatnonzero(running <= bound + 1e-9)
+    return int(within[-1] + 1) if within.size else 0
+
+
+def test_asks_are_complement_of_opposite_bids() -> None:
+    book = OrderBook.from_levels("KXA-1", yes=[], no=[(3, 20), (5, 7), (4, 9)])
+    prices, sizes = book.asks("yes")
+    assert prices.tolist() == [95, 96, 97]
+    assert sizes.tolist() == [7, 9, 20]
+
+
+def test_plan_sizes_to_slippage_bound() -> None:
+    prices, sizes = np.array([95, 96, 98]), np.array([10, 10, 100])
+
+    shallow = plan_entry(prices, sizes, 5, reference_price_cents=95, max_slippage_pct=0.02)
+    assert (shallow.contracts, shallow.limit_price_cents, shallow.levels_used) == (5, 95, 1)
+
+    # 96.9¢ cap: all of 95 and 96, then 98 only while the average stays under.
+    deep = plan_entry(prices, sizes, 500, reference_price_cents=95, max_slippage_pct=0.02)
+    assert (deep.contracts, deep.limit_price_cents, deep.levels_used) == (45, 98, 3)
+    assert deep.avg_price_cents <= 95 * 1.02
+    assert round(deep.cost_usd, 2) == round((950 + 960 + 25 * 98) / 100, 2)
+
+
+def test_plan_rejects_when_best_ask_is_out_of_bound() -> None:
+    assert plan_entry(np.array([97]), np.array([50]), 10, 90, 0.05) is None
+    assert plan_entry(np.array([], dtype=np.int64), np.array([], dtype=np.int64), 10, 90, 0.05) is None
+
+
+def test_plan_matches_contract_by_contract_walk() -> None:
+    rng = np.random.default_rng(7)
+    for _ in range(500):
+        levels = int(rng.integers(1, 10))
+        prices = np.sort(rng.choice(np.arange(80, 100), levels, replace=False))
+        sizes = rng.integers(0, 40, levels)
+        reference, slippage, contracts = rng.uniform(85, 99), rng.uniform(0, 0.08), int(rng.integers(1, 200))
+
+        plan = plan_entry(prices, sizes, contracts, reference, slippage)
+        expected = _walk(prices, sizes, contracts, reference * (1 + slippage))
+        assert (plan.contracts if plan else 0) == expected
+
+
+def test_child_orders_split_evenly() -> None:
+    assert split_child_orders(25, 10) == (9, 8, 8)
+    assert split_child_orders(25, 0) == (25,)
+    assert split_child_orders(8, 10) == (8,)
+    assert split_child_orders(30, 12) == (10, 10, 10)
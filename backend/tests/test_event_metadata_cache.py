@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Tests for the in-memory layer of the event metadata cache."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from coliseum.services.kalshi.client import KalshiClient
+from coliseum.services.kalshi.event_metadata import EventMetadataCache
+from coliseum.services.kalshi.rate_limit import KalshiRateLimiter
+
+
+def _client(requests: list[str]) -> KalshiClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        event_ticker = request.url.path.rsplit("/", 1)[-1]
+        requests.append(event_ticker)
+        if event_ticker == "KXBROKEN":
+            return httpx.Response(404)
+        body = {"event": {"title": f"Title {event_ticker}", "category": "Economics"}}
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+    return KalshiClient(
+        rate_limiter=KalshiRateLimiter(read_rate_per_second=100, write_rate_per_second=100),
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_only_unseen_events_hit_the_api() -> None:
+    async def run() -> None:
+        requests: list[str] = []
+        cache = EventMetadataCache(ttl_seconds=3600, max_entries=100, use_db=False)
+        async with _client(requests) as client:
+            first = await cache.get_many(client, ["KXA", "KXB"])
+            second = await cache.get_many(client, ["KXA", "KXB", "KXC"])
+
+        assert first["KXA"] == ("Title KXA", "Economics")
+        assert sorted(requests) == ["KXA", "KXB", "KXC"]
+        assert second.keys() == {"KXA", "KXB", "KXC"}
+        assert cache.last_stats.memory_hits == 2
+        assert cache.last_stats.api_fetches == 1
+
+    asyncio.run(run())
+
+
+def test_failed_fetches_are_not_cached() -> None:
+    async def run() -> None:
+        requests: list[str] = []
+        cache = EventMetadataCache(ttl_seconds=3600, max_entries=100, use_db=False)
+        async with _client(requests) as client:
+            result = await cache.get_many(client, ["KXBROKEN"])
+            await cache.get_many(client, ["KXBROKEN"])
+
+        assert result == {"KXBROKEN": ("", "")}
+        assert requests == ["KXBROKEN", "KXBROKEN"]
+        assert cache.last_stats.api_failures == 1
+
+    asyncio.run(run())
+
+
+def test_lru_evicts_and_ttl_expires() -> None:
+    async def run() -> None:
+        requests: list[str] = []
+        cache = EventMetadataCache(ttl_seconds=3600, max_entries=2, use_db=False)
+        async with _client(requests) as client:
+            await cache.get_many(client, ["KXA", "KXB", "KXC"])
+            assert len(cache) == 2
+
+            cache.ttl_seconds = -1
+            await cache.get_many(client, ["KXC"])
+            assert cache.last_stats.memory_hits == 0
+
+    asyncio.run(run())
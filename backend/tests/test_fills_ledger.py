@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Tests for the incremental Kalshi fills ledger."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.services.kalshi import fills as fills_module
+from coliseum.services.kalshi.fills import FillsLedger, parse_fill
+
+
+def _fill(fill_id: str, ts: str, action: str, count: int, yes_price: str, side: str = "yes") -> dict:
+    return {
+        "fill_id": fill_id,
+        "order_id": f"ord_{fill_id}",
+        "ticker": "KXA-1",
+        "side": side,
+        "action": action,
+        "count_fp": str(count),
+        "yes_price_dollars": yes_price,
+        "created_time": ts,
+    }
+
+
+class _FakeClient:
+    """Stands in for KalshiClient.get_fills; returns newest first, ignoring min_ts."""
+
+    def __init__(self, fills: list[dict]):
+        self.fills = fills
+        self.calls: list[dict] = []
+
+    async def get_fills(self, limit: int = 100, min_ts: int | None = None) -> list[dict]:
+        self.calls.append({"limit": limit, "min_ts": min_ts})
+        return list(reversed(self.fills))[:limit]
+
+
+def test_parse_fill_normalizes_side_price() -> None:
+    fill = parse_fill(_fill("f1", "2026-10-17T12:00:00Z", "buy", 10, "0.9500", side="no"))
+    assert fill is not None
+    assert fill.side == "NO"
+    assert abs(fill.price - 0.05) < 1e-9
+    assert parse_fill({"ticker": "KXA-1", "side": "yes"}) is None
+
+
+def test_sync_is_incremental_and_aggregates_run() -> None:
+    fills = [
+        _fill("f1", "2026-10-17T12:00:00Z", "buy", 10, "0.9000"),
+        _fill("f2", "2026-10-17T12:05:00Z", "buy", 30, "0.9400"),
+    ]
+    client = _FakeClient(fills)
+
+    async def run() -> None:
+        ledger = FillsLedger(use_db=False)
+        assert await ledger.sync(client) == 2
+        assert abs(ledger.average_entries()[("KXA-1", "YES")] - 0.93) < 1e-9
+        assert ledger.average_exit("KXA-1", "YES") is None
+
+        # The fake re-returns everything; already-applied fills are ignored.
+        fills.append(_fill("f3", "2026-10-17T13:00:00Z", "sell", 40, "0.9900"))
+        assert await ledger.sync(client) == 1
+        assert await ledger.sync(client) == 0
+
+        assert abs(ledger.average_exit("KXA-1", "YES") - 0.99) < 1e-9
+        assert abs(ledger.average_entries()[("KXA-1", "YES")] - 0.93) < 1e-9
+
+    asyncio.run(run())
+    assert client.calls[0]["min_ts"] is None
+    # Second sync starts 60s before the newest fill seen (12:05Z).
+    assert client.calls[1]["min_ts"] == 1792238700 - 60
+
+
+def test_reentry_starts_a_new_holding() -> None:
+    fills = [
+        _fill("f1", "2026-10-17T12:00:00Z", "buy", 10, "0.8000"),
+        _fill("f2", "2026-10-17T12:30:00Z", "sell", 4, "0.9000"),
+        _fill("f3", "2026-10-17T13:00:00Z", "sell", 6, "0.9500"),
+    ]
+    client = _FakeClient(fills)
+
+    async def run() -> None:
+        ledger = FillsLedger(use_db=False)
+        await ledger.sync(client)
+        # The closed holding's prices stay readable for the Guardian.
+        assert abs(ledger.average_exit("KXA-1", "YES") - 0.93) < 1e-9
+        assert abs(ledger.average_entries()[("KXA-1", "YES")] - 0.80) < 1e-9
+
+        fills.append(_fill("f4", "2026-10-17T14:00:00Z", "buy", 5, "0.9400"))
+        await ledger.sync(client)
+        assert abs(ledger.average_entries()[("KXA-1", "YES")] - 0.94) < 1e-9
+        assert ledger.average_exit("KXA-1", "YES") is None
+
+        fills.append(_fill("f5", "2026-10-17T15:00:00Z", "sell", 5, "0.9900"))
+        await ledger.sync(client)
+        assert abs(ledger.average_exit("KXA-1", "YES") - 0.99) < 1e-9
+
+    asyncio.run(run())
+
+
+def test_cold_load_rebuilds_current_holding(monkeypatch) -> None:
+    raw = [
+        _fill("f1", "2026-10-17T12:00:00Z", "buy", 10, "0.8000"),
+        _fill("f2", "2026-10-17T13:00:00Z", "sell", 10, "0.9500"),
+        _fill("f3", "2026-10-17T14:00:00Z", "buy", 5, "0.9400"),
+    ]
+    stored = [parse_fill(f) for f in raw]
+
+    async def fake_load():
+        return stored
+
+    monkeypatch.setattr(fills_module, "load_fills_from_db", fake_load)
+    client = _FakeClient(raw)
+
+    async def run() -> None:
+        ledger = FillsLedger()
+        monkeypatch.setattr(ledger, "_persist", _no_persist)
+        # Everything Kalshi returns is already in the ledger.
+        assert await ledger.sync(client) == 0
+        assert abs(ledger.average_entries()[("KXA-1", "YES")] - 0.94) < 1e-9
+        assert ledger.average_exit("KXA-1", "YES") is None
+
+    asyncio.run(run())
+    assert client.calls[0]["min_ts"] == int(stored[-1].created_at.timestamp()) - 60
+
+
+async def _no_persist(new) -> None:
+    return None
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Tests for the adaptive Guardian loop scheduler."""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.agents.guardian.scheduler import GuardianScheduler
+from coliseum.config import GuardianConfig
+from coliseum.domain.portfolio import Position
+
+NOW = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+CONFIG = GuardianConfig(
+    floor_price=0.65,
+    window_threshold_price=0.72,
+    window_minutes=20,
+    poll_fast_seconds=5,
+    poll_normal_seconds=15,
+    poll_max_seconds=120,
+    fast_poll_price_margin=0.05,
+    fast_poll_lead_minutes=10,
+)
+
+
+def _pos(price: float, closes_in: timedelta | None = timedelta(hours=6), ticker: str = "KXA-1") -> Position:
+    close_time = None
+    if closes_in is not None:
+        close_time = NOW + closes_in
+    return Position(
+        id="pos_1",
+        market_ticker=ticker,
+        side="YES",
+        contracts=10,
+        average_entry=0.94,
+        current_price=price,
+        close_time=close_time,
+    )
+
+
+def test_fast_near_floor_or_close() -> None:
+    scheduler = GuardianScheduler(CONFIG)
+    assert scheduler.next_delay([_pos(0.69)], now=NOW) == 5
+    assert scheduler.next_delay([_pos(0.95, closes_in=timedelta(minutes=25))], now=NOW) == 5
+    assert scheduler.next_delay([_pos(0.96)], now=NOW) == 15
+
+
+def test_backs_off_while_book_is_flat() -> None:
+    scheduler = GuardianScheduler(CONFIG)
+    book = [_pos(0.95)]
+    delays = [scheduler.next_delay(book, now=NOW) for _ in range(5)]
+    assert delays == [15, 30, 60, 120, 120]
+
+    assert scheduler.next_delay([_pos(0.94)], now=NOW) == 15
+    assert scheduler.next_delay([], now=NOW) == 120
+
+
+def test_wake_cuts_the_wait_short() -> None:
+    scheduler = GuardianScheduler(CONFIG)
+
+    async def run() -> tuple[str, str]:
+        shutdown = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, scheduler.wake, "trade_fill")
+        woke = await asyncio.wait_for(scheduler.wait(60, shutdown), timeout=1)
+        timed_out = await scheduler.wait(0.01, shutdown)
+        return woke, timed_out
+
+    assert asyncio.run(run()) == ("trade_fill", "timer")
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Tests for the Kalshi WebSocket market stream against a local fake server."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from websockets.asyncio.server import serve
+
+from coliseum.services.kalshi.config import KalshiConfig
+from coliseum.services.kalshi.stream import KalshiMarketStream
+
+
+class FakeKalshiServer:
+    """Stand-in for the Kalshi WS endpoint: answers subscribes with book snapshots."""
+
+    def __init__(self, books: dict[str, dict[str, list[list[int]]]]):
+        self.books = books
+        self.subscribed: list[str] = []
+        self.commands: list[dict] = []
+        self.connections: list = []
+        self._next_sid = 1
+        self._sid_of: dict[str, int] = {}
+        self._seqs: dict[int, int] = {}
+
+    async def handler(self, ws) -> None:
+        self.connections.append(ws)
+        async for raw in ws:
+            command = json.loads(raw)
+            self.commands.append(command)
+            if command.get("cmd") != "subscribe" or "market_tickers" not in command["params"]:
+                continue
+            # Each subscribe opens a subscription with its own seq counter.
+            sid = self._next_sid
+            self._next_sid += 1
+            await ws.send(json.dumps({"id": command["id"], "type": "subscribed", "msg": {"sid": sid}}))
+            for ticker in command["params"]["market_tickers"]:
+                self.subscribed.append(ticker)
+                self._sid_of[ticker] = sid
+                book = self.books.get(ticker, {"yes": [], "no": []})
+                await self._emit(ws, "orderbook_snapshot", {"market_ticker": ticker, **book}, sid)
+
+    async def push_delta(self, ticker: str, side: str, price: int, delta: int, drop: bool = False) -> None:
+        """Send a delta; ``drop`` consumes its seq without delivering it."""
+        sid = self._sid_of[ticker]
+        msg = {"market_ticker": ticker, "side": side, "price": price, "delta": delta}
+        for ws in self.connections:
+            if drop:
+                self._seqs[sid] = self._seqs.get(sid, 0) + 1
+            else:
+                await self._emit(ws, "orderbook_delta", msg, sid)
+
+    async def _emit(self, ws, msg_type: str, msg: dict, sid: int = 0) -> None:
+        self._seqs[sid] = self._seqs.get(sid, 0) + 1
+        await ws.send(json.dumps({"type": msg_type, "sid": sid, "seq": self._seqs[sid], "msg": msg}))
+
+
+def _run_with_server(books, scenario) -> None:
+    async def run() -> None:
+        server = FakeKalshiServer(books)
+        async with serve(server.handler, "127.0.0.1", 0) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            config = KalshiConfig(ws_url=f"ws://127.0.0.1:{port}")
+            async with KalshiMarketStream(config=config) as stream:
+                await scenario(server, stream)
+
+    asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+
+def test_snapshot_builds_top_of_book() -> None:
+    books = {"KXETH-TEST": {"yes": [[90, 10], [94, 5]], "no": [[3, 20], [4, 7]]}}
+
+    async def scenario(server: FakeKalshiServer, stream: KalshiMarketStream) -> None:
+        await stream.subscribe(["KXETH-TEST"])
+        quote = await stream.latest("KXETH-TEST", timeout=5)
+        assert quote is not None
+        assert quote.yes_bid == 94
+        assert quote.no_bid == 4
+        # Asks are the complement of the opposite side's best bid.
+        assert quote.yes_ask == 96
+        assert quote.no_ask == 6
+
+    _run_with_server(books, scenario)
+
+
+def test_deltas_update_book_without_round_trip() -> None:
+    books = {"KXWTIW-TEST": {"yes": [[93, 10]], "no": [[5, 10]]}}
+
+    async def scenario(server: FakeKalshiServer, stream: KalshiMarketStream) -> None:
+        await stream.subscribe(["KXWTIW-TEST"])
+        first = await stream.latest("KXWTIW-TEST", timeout=5)
+        assert first is not None and first.yes_bid == 93
+
+        # A better YES level appears and is fully consumed; NO gains a better bid.
+        await server.push_delta("KXWTIW-TEST", "yes", 95, 3)
+        await server.push_delta("KXWTIW-TEST", "yes", 95, -3)
+        await server.push_delta("KXWTIW-TEST", "no", 6, 4)
+        for _ in range(50):
+            quote = await stream.latest("KXWTIW-TEST")
+            if quote is not None and quote.no_bid == 6:
+                break
+            await asyncio.sleep(0.02)
+        assert quote.yes_bid == 93
+        assert quote.yes_ask == 94
+        assert quote.no_ask == 7
+
+    _run_with_server(books, scenario)
+
+
+def test_unknown_ticker_returns_none() -> None:
+    async def scenario(server: FakeKalshiServer, stream: KalshiMarketStream) -> None:
+        assert await stream.latest("KXNOPE-TEST") is None
+        assert await stream.latest("KXNOPE-TEST", timeout=0.1) is None
+
+    _run_with_server({}, scenario)
+
+
+def test_subscribe_before_connect_is_replayed() -> None:
+    books = {"KXRT-TEST": {"yes": [[92, 1]], "no": [[7, 1]]}}
+
+    async def scenario(server: FakeKalshiServer, stream: KalshiMarketStream) -> None:
+        quote = await stream.latest("KXRT-TEST", timeout=5)
+        assert quote is not None
+        assert server.subscribed == ["KXRT-TEST"]
+
+    async def run() -> None:
+        server = FakeKalshiServer(books)
+        async with serve(server.handler, "127.0.0.1", 0) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            stream = KalshiMarketStream(config=KalshiConfig(ws_url=f"ws://127.0.0.1:{port}"))
+            await stream.subscribe(["KXRT-TEST"])
+            async with stream:
+                await scenario(server, stream)
+
+    asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+
+def test_fill_message_wakes_order_watcher() -> None:
+    async def scenario(server: FakeKalshiServer, stream: KalshiMarketStream) -> None:
+        event = stream.watch_order("ord_1")
+        other = stream.watch_order("ord_2")
+        for _ in range(50):
+            if server.connections:
+                break
+            await asyncio.sleep(0.02)
+        await server._emit(server.connections[0], "fill", {"order_id": "ord_1", "market_ticker": "KXA-1", "count": 3})
+        await asyncio.wait_for(event.wait(), timeout=5)
+        assert not other.is_set()
+        stream.unwatch_order("ord_1")
+        assert "ord_1" not in stream._order_watchers
+
+    _run_with_server({}, scenario)
+
+
+async def _wait_for(predicate, attempts: int = 100) -> None:
+    for _ in range(attempts):
+        if predicate():
+            return
+        await asyncio.sleep(0.02)
+    assert predicate()
+
+
+def test_seq_gap_drops_book_and_resubscribes() -> None:
+    books = {"KXGAP-TEST": {"yes": [[93, 10]], "no": [[5, 10]]}}
+
+    async def scenario(server: FakeKalshiServer, stream: KalshiMarketStream) -> None:
+        await stream.subscribe(["KXGAP-TEST"])
+        assert await stream.latest("KXGAP-TEST", timeout=5) is not None
+
+        await server.push_delta("KXGAP-TEST", "yes", 94, 5, drop=True)
+        await server.push_delta("KXGAP-TEST", "no", 6, 4)
+        # The book behind the gap is discarded and a fresh snapshot requested.
+        await _wait_for(lambda: server.subscribed.count("KXGAP-TEST") == 2)
+        assert {"cmd": "unsubscribe", "params": {"sids": [1]}} in [
+            {k: c[k] for k in ("cmd", "params")} for c in server.commands
+        ]
+        await _wait_for(lambda: stream.book("KXGAP-TEST") is not None)
+        # The snapshot reflects the server's book, never the lost delta.
+        assert stream.book("KXGAP-TEST").best_yes_bid == 93
+
+    _run_with_server(books, scenario)
+
+
+def test_subscriptions_are_capped_lru() -> None:
+    books = {f"KXLRU-{i}": {"yes": [[90, 1]], "no": [[5, 1]]} for i in range(4)}
+
+    async def scenario(server: FakeKalshiServer, stream: KalshiMarketStream) -> None:
+        stream.config.stream_max_tickers = 2
+        await stream.subscribe(["KXLRU-0"])
+        await stream.subscribe(["KXLRU-1"])
+        await _wait_for(lambda: stream.book("KXLRU-1") is not None)
+        await stream.subscribe(["KXLRU-0"])  # touch: KXLRU-1 is now the oldest
+        await stream.subscribe(["KXLRU-2"])
+
+        assert list(stream._tickers) == ["KXLRU-0", "KXLRU-2"]
+        assert stream.book("KXLRU-1") is None
+        # KXLRU-0 and KXLRU-1 share a subscription, so only the market is removed.
+        removed = {"sids": [1], "market_tickers": ["KXLRU-1"], "action": "delete_markets"}
+        await _wait_for(lambda: any(c["params"] == removed for c in server.commands))
+
+        # Removing its last market closes the subscription.
+        await stream.unsubscribe(["KXLRU-0"])
+        assert list(stream._tickers) == ["KXLRU-2"]
+        assert await stream.latest("KXLRU-0") is None
+        await _wait_for(lambda: any(
+            c["cmd"] == "unsubscribe" and c["params"] == {"sids": [1]} for c in server.commands
+        ))
+
+    _run_with_server(books, scenario)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Tests for the Kalshi token-bucket limiter and its priority lanes."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.services.kalshi.rate_limit import (
+    KalshiRateLimiter,
+    RequestPriority,
+    TokenBucket,
+)
+
+
+def test_burst_is_served_without_waiting() -> None:
+    async def run() -> None:
+        bucket = TokenBucket("read", rate_per_second=100, burst=5)
+        waits = [await bucket.acquire(RequestPriority.BULK) for _ in range(5)]
+        assert waits == [0.0] * 5
+        assert bucket.stats[RequestPriority.BULK].queued == 0
+
+    asyncio.run(run())
+
+
+def test_critical_requests_preempt_queued_bulk() -> None:
+    async def run() -> None:
+        bucket = TokenBucket("read", rate_per_second=50, burst=1)
+        await bucket.acquire(RequestPriority.BULK)  # drain the burst
+
+        order: list[str] = []
+
+        async def take(label: str, priority: RequestPriority) -> None:
+            await bucket.acquire(priority)
+            order.append(label)
+
+        bulk = [asyncio.create_task(take(f"bulk{i}", RequestPriority.BULK)) for i in range(5)]
+        await asyncio.sleep(0)
+        critical = asyncio.create_task(take("critical", RequestPriority.CRITICAL))
+        await asyncio.gather(*bulk, critical)
+
+        assert order[0] == "critical"
+        assert bucket.stats[RequestPriority.BULK].queued == 5
+        assert bucket.stats[RequestPriority.CRITICAL].max_wait_seconds > 0
+
+    asyncio.run(run())
+
+
+def test_reads_and_writes_use_separate_buckets() -> None:
+    async def run() -> None:
+        limiter = KalshiRateLimiter(read_rate_per_second=1, write_rate_per_second=1)
+        await limiter.acquire("GET", RequestPriority.BULK)
+        # An exhausted read bucket must not delay an order.
+        waited = await limiter.acquire("POST", RequestPriority.CRITICAL)
+        assert waited == 0.0
+        assert limiter.snapshot()["write"]["critical"].requests == 1
+
+    asyncio.run(run())
+
+
+def test_penalize_pauses_bucket() -> None:
+    async def run() -> None:
+        bucket = TokenBucket("read", rate_per_second=100, burst=10)
+        bucket.penalize(0.2)
+        started = time.monotonic()
+        await bucket.acquire(RequestPriority.NORMAL)
+        assert time.monotonic() - started >= 0.15
+
+    asyncio.run(run())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Tests for close-time shard planning and the sharded market scan merge."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from coliseum.services.kalshi.client import KalshiClient
+from coliseum.services.kalshi.rate_limit import KalshiRateLimiter
+from coliseum.services.kalshi.sharding import (
+    CloseTimeShardPlanner,
+    ShardObservation,
+    split_evenly,
+)
+
+
+def test_split_evenly_covers_window() -> None:
+    windows = split_evenly(0, 100, 4)
+    assert windows == [(0, 25), (25, 50), (50, 75), (75, 100)]
+
+
+def test_planner_starts_with_initial_shards() -> None:
+    planner = CloseTimeShardPlanner(initial_shards=3, max_shards=8)
+    assert len(planner.plan(0, 300)) == 3
+
+
+def test_planner_concentrates_shards_where_pages_were() -> None:
+    planner = CloseTimeShardPlanner(max_shards=8, target_pages_per_shard=2)
+    # Nearly every page closed in the first tenth of the window.
+    planner.record([ShardObservation(0, 100, 8), ShardObservation(100, 1000, 0)])
+
+    windows = planner.plan(0, 1000)
+    assert len(windows) == 4
+    assert windows[0][0] == 0 and windows[-1][1] == 1000
+    # Three boundaries land inside the dense region.
+    assert all(hi <= 100 for _, hi in windows[:3])
+
+
+def test_planner_collapses_small_scans_to_one_shard() -> None:
+    planner = CloseTimeShardPlanner(target_pages_per_shard=2)
+    planner.record([ShardObservation(0, 50, 1), ShardObservation(50, 100, 0)])
+    assert planner.plan(0, 100) == [(0, 100)]
+
+
+def test_sharded_scan_merges_and_dedupes() -> None:
+    markets = [{"ticker": f"KX-{i}"} for i in range(50)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Worst-case overlap: every shard returns the whole universe.
+        return httpx.Response(200, content=json.dumps({"markets": markets, "cursor": ""}).encode())
+
+    async def run() -> list[str]:
+        client = KalshiClient(
+            rate_limiter=KalshiRateLimiter(read_rate_per_second=100, write_rate_per_second=100),
+            transport=httpx.MockTransport(handler),
+        )
+        async with client:
+            return [m.ticker async for m in client.iter_markets_closing_in_range(0, 1, shards=4)]
+
+    tickers = asyncio.run(run())
+    assert sorted(tickers) == sorted(m["ticker"] for m in markets)
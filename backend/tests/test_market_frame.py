@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Tests for the columnar MarketFrame used by Scout prefiltering."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.services.kalshi.frame import NO_CLOSE_TS, SIDE_NO, SIDE_NONE, SIDE_YES, MarketFrame
+
+
+def _raw(ticker: str, yes_bid: str, yes_ask: str, no_bid: str, no_ask: str, **extra) -> dict:
+    return {
+        "ticker": ticker,
+        "event_ticker": ticker.rsplit("-", 1)[0],
+        "yes_bid_dollars": yes_bid,
+        "yes_ask_dollars": yes_ask,
+        "no_bid_dollars": no_bid,
+        "no_ask_dollars": no_ask,
+        "volume_fp": "5000.00",
+        "close_time": "2026-03-09T03:59:00Z",
+        **extra,
+    }
+
+
+def test_entry_sides_match_scout_rules() -> None:
+    frame = MarketFrame.from_raw([
+        _raw("KXA-1", "0.9300", "0.9400", "0.0500", "0.0700"),  # YES in band
+        _raw("KXB-1", "0.0400", "0.0600", "0.9300", "0.9500"),  # NO in band
+        _raw("KXC-1", "0.9000", "0.9400", "0.0500", "0.1000"),  # YES spread too wide
+        _raw("KXD-1", "0.0000", "0.9400", "0.0500", "0.1000"),  # no YES bid
+    ])
+    sides = frame.entry_sides(min_price_cents=92, max_price_cents=96, max_spread_cents=3)
+    assert sides.tolist() == [SIDE_YES, SIDE_NO, SIDE_NONE, SIDE_NONE]
+    assert frame.row(1).no_ask == 95
+
+
+def test_close_ts_and_masks() -> None:
+    frame = MarketFrame.from_raw([
+        _raw("KXA-1", "0.9300", "0.9400", "0.0500", "0.0700"),
+        _raw("KXB-1", "0.9300", "0.9400", "0.0500", "0.0700", close_time=None, volume_fp="10.00"),
+        _raw("KXC-1", "0.9300", "0.9400", "0.0500", "0.0700", close_time="2026-03-09T03:59:00.5+00:00"),
+    ])
+    assert frame.close_ts[0] == 1773028740
+    assert frame.close_ts[1] == NO_CLOSE_TS
+    assert frame.close_ts[2] == 1773028740
+    assert frame.close_window_mask(1773028000, 1773029000).tolist() == [True, False, True]
+    assert frame.unseen_mask({"KXA-1"}).tolist() == [False, True, True]
+    assert (frame.volume >= 1000).tolist() == [True, False, True]
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Tests for the MarketRow fast-path decoder."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.services.kalshi.models import Market, MarketRow
+
+RAW = {
+    "ticker": "KXWTIW-26APR10-T95",
+    "event_ticker": "KXWTIW-26APR10",
+    "title": "WTI above $95?",
+    "yes_sub_title": "Above $95",
+    "yes_bid_dollars": "0.9300",
+    "yes_ask_dollars": "0.9450",
+    "no_bid_dollars": "0.0550",
+    "no_ask_dollars": "0.0700",
+    "volume_fp": "12500.00",
+    "volume_24h_fp": "800.00",
+    "open_interest_fp": "3000.00",
+    "close_time": "2026-04-10T20:30:00Z",
+    "status": "active",
+    "result": "",
+}
+
+
+def test_row_matches_validated_market() -> None:
+    row = MarketRow.from_api(RAW)
+    market = Market.from_api(RAW)
+    for field in Market.model_fields:
+        assert getattr(row, field) == getattr(market, field), field
+    assert row.formatted_volume == market.formatted_volume == "12.5K"
+    assert row.to_market() == market
+
+
+def test_row_tolerates_missing_and_bad_fields() -> None:
+    row = MarketRow.from_api({"ticker": "KXX-1", "close_time": "not a time"})
+    assert row.close_time is None
+    assert row.yes_ask == 0 and row.volume == 0
+    assert row.formatted_close_time == "N/A"
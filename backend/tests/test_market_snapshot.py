@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Tests for batched market fetches and the per-loop market snapshot."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+import pytest
+
+from coliseum.services.kalshi.client import KalshiClient
+from coliseum.services.kalshi.exceptions import KalshiNotFoundError
+from coliseum.services.kalshi.rate_limit import KalshiRateLimiter
+from coliseum.services.kalshi.snapshot import MarketSnapshot
+
+
+def _client(requests: list[list[str]]) -> KalshiClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        tickers = request.url.params["tickers"].split(",")
+        requests.append(tickers)
+        markets = [
+            {"ticker": t, "event_ticker": "KXE", "status": "active", "yes_bid_dollars": "0.9500"}
+            for t in tickers
+            if not t.startswith("KXGONE")
+        ]
+        return httpx.Response(200, content=json.dumps({"markets": markets, "cursor": ""}).encode())
+
+    return KalshiClient(
+        rate_limiter=KalshiRateLimiter(read_rate_per_second=100, write_rate_per_second=100),
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_batch_chunks_tickers() -> None:
+    requests: list[list[str]] = []
+    tickers = [f"KXA-{i}" for i in range(250)]
+
+    async def run() -> None:
+        async with _client(requests) as client:
+            markets = await client.get_markets_batch(tickers + ["KXGONE-1"])
+        assert set(markets) == set(tickers)
+        assert markets["KXA-7"].yes_bid == 95
+
+    asyncio.run(run())
+    assert sorted(len(chunk) for chunk in requests) == [51, 100, 100]
+
+
+def test_snapshot_serves_repeats_from_memory() -> None:
+    requests: list[list[str]] = []
+
+    async def run() -> None:
+        async with _client(requests) as client:
+            snapshot = MarketSnapshot(client)
+            first = await snapshot.get_many(["KXA-1", "KXA-2"])
+            assert set(first) == {"KXA-1", "KXA-2"}
+            assert (await snapshot.get("KXA-1")).ticker == "KXA-1"
+            await snapshot.get_many(["KXA-2", "KXA-3"])
+            with pytest.raises(KalshiNotFoundError):
+                await snapshot.get("KXGONE-2")
+
+            snapshot.invalidate(["KXA-1"])
+            await snapshot.get("KXA-1")
+
+    asyncio.run(run())
+    assert requests == [["KXA-1", "KXA-2"], ["KXA-3"], ["KXGONE-2"], ["KXA-1"]]
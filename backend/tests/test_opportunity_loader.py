@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Tests for the single-query opportunity record loader and its cycle cache."""
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.dialects import postgresql
+
+from coliseum.services.supabase.models import Opportunity, OpportunityAnalysis
+from coliseum.services.supabase.repositories import opportunities
+
+
+def _rows(opportunity_id: str = "opp_1") -> tuple[Opportunity, OpportunityAnalysis]:
+    opp = Opportunity(
+        id=opportunity_id,
+        market_ticker="KXA-1",
+        event_ticker="KXA",
+        event_title="Event A",
+        market_title="Will A happen?",
+        subtitle=None,
+        yes_price=Decimal("0.9500"),
+        no_price=Decimal("0.0500"),
+        close_time=datetime(2026, 10, 18, 15, 0, tzinfo=timezone.utc),
+        discovered_at=datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc),
+        status="pending",
+        outcome_status="NEAR-CERTAIN",
+        risk_level="LOW",
+    )
+    analysis = OpportunityAnalysis(
+        opportunity_id=opportunity_id,
+        rationale="Already decided.",
+        resolution_source="Official feed",
+        evidence_bullets=["Reported final"],
+        remaining_risks=[],
+        scout_sources=[],
+        research_synthesis="Synthesis text",
+    )
+    return opp, analysis
+
+
+class _FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def one_or_none(self):
+        return self._row
+
+    def all(self):
+        return self._row
+
+
+def _fake_db(monkeypatch, row) -> list[str]:
+    executed: list[str] = []
+
+    class _Session:
+        async def execute(self, stmt, params=None):
+            executed.append(str(stmt))
+            return _FakeResult(row)
+
+    @asynccontextmanager
+    async def fake_session():
+        yield _Session()
+
+    monkeypatch.setattr(opportunities, "get_db_session", fake_session)
+    return executed
+
+
+def test_render_body_matches_rows() -> None:
+    body = opportunities.render_opportunity_body(*_rows())
+    assert body.startswith("# Will A happen?\n**Event**: Event A\n")
+    assert "**NEAR-CERTAIN**  ·  **LOW RISK**" in body
+    assert "- Reported final" in body
+    assert "| Yes Price | 95¢ ($0.95) |" in body
+    assert body.endswith("## Research Synthesis\n\nSynthesis text")
+
+
+def test_record_loads_in_one_query(monkeypatch) -> None:
+    executed = _fake_db(monkeypatch, _rows())
+
+    record = asyncio.run(opportunities.load_opportunity_record_from_db("opp_1"))
+    assert record is not None
+    assert record.signal.id == "opp_1"
+    assert record.signal.rationale == "Already decided."
+    assert "Synthesis text" in record.body
+    assert len(executed) == 1
+    assert "LEFT OUTER JOIN opportunity_analysis" in executed[0]
+
+
+def test_cycle_cache_reuses_until_write(monkeypatch) -> None:
+    executed = _fake_db(monkeypatch, _rows())
+
+    async def run() -> None:
+        with opportunities.opportunity_cycle_cache() as cache:
+            await opportunities.load_opportunity_from_db("opp_1")
+            await opportunities.get_opportunity_body_from_db("opp_1")
+            assert len(executed) == 1
+            assert cache.hits == 1
+
+            opportunities._evict_cached_opportunity("opp_1")
+            await opportunities.load_opportunity_from_db("opp_1")
+            assert len(executed) == 2
+
+        # Outside a cycle every load reads the DB.
+        await opportunities.load_opportunity_from_db("opp_1")
+        assert len(executed) == 3
+
+    asyncio.run(run())
+
+
+def test_cache_is_bounded() -> None:
+    cache = opportunities.OpportunityRecordCache(max_entries=2)
+    for opportunity_id in ("a", "b", "c"):
+        opp, analysis = _rows(opportunity_id)
+        cache.put(opportunities.OpportunityRecord(
+            signal=opportunities.db_to_opportunity(opp, analysis),
+            body="",
+        ))
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+
+
+def test_latest_by_tickers_uses_one_distinct_on_query(monkeypatch) -> None:
+    opp_a, analysis_a = _rows("opp_a")
+    opp_b, analysis_b = _rows("opp_b")
+    opp_b.market_ticker = "KXB-1"
+    executed = _fake_db(monkeypatch, [(opp_a, analysis_a), (opp_b, analysis_b)])
+
+    latest = asyncio.run(
+        opportunities.load_latest_opportunities_by_tickers(["KXA-1", "KXB-1", "KXA-1", "KXZ-9"])
+    )
+    assert {ticker: opp.id for ticker, opp in latest.items()} == {"KXA-1": "opp_a", "KXB-1": "opp_b"}
+    assert len(executed) == 1
+    assert asyncio.run(opportunities.load_latest_opportunities_by_tickers([])) == {}
+    assert len(executed) == 1
+
+    sql = str(opportunities._LATEST_RECORDS_BY_TICKERS.compile(dialect=postgresql.dialect()))
+    assert "SELECT DISTINCT ON (opportunities.market_ticker)" in sql
+    assert "ORDER BY opportunities.market_ticker, opportunities.discovered_at DESC" in sql
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""Tests for the background order manager and working-order resumption."""
+
+import asyncio
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.agents.trader import execution, order_manager
+from coliseum.agents.trader.execution import new_working_order
+from coliseum.agents.trader.portfolio_lock import get_portfolio_lock
+from coliseum.config import ExecutionConfig
+from coliseum.memory.decisions import DecisionEntry
+from coliseum.services.kalshi.models import Order
+
+SETTINGS = SimpleNamespace(
+    execution=ExecutionConfig(
+        reprice_interval_seconds=60,
+        status_poll_min_seconds=0.01,
+        status_poll_max_seconds=0.02,
+    )
+)
+
+
+class _FakeClient:
+    """Kalshi order endpoints over one in-memory order book."""
+
+    def __init__(self) -> None:
+        self.orders: dict[str, Order] = {}
+        self.placed: list[str] = []
+
+    def fill(self, order_id: str) -> None:
+        order = self.orders[order_id]
+        self.orders[order_id] = order.model_copy(update={
+            "status": "executed",
+            "fill_count": order.remaining_count,
+            "remaining_count": 0,
+            "maker_fill_cost": order.remaining_count * order.yes_price,
+        })
+
+    async def place_order(self, ticker, side, action, count, yes_price=None, no_price=None, client_order_id=None):
+        order_id = f"ord_{len(self.orders) + 1}"
+        self.orders[order_id] = Order(
+            order_id=order_id,
+            ticker=ticker,
+            yes_price=yes_price or 0,
+            remaining_count=count,
+            client_order_id=client_order_id,
+        )
+        self.placed.append(order_id)
+        return self.orders[order_id]
+
+    async def get_orders(self, ticker=None, status=None, limit=100):
+        return [o for o in self.orders.values() if ticker is None or o.ticker == ticker]
+
+    async def get_order_status(self, order_id: str) -> Order:
+        return self.orders[order_id]
+
+
+def _fake_db(monkeypatch, open_orders=(), decisions=None, alerts=None) -> tuple[dict, list]:
+    saved: dict = {}
+    recorded: list = []
+    if decisions is None:
+        decisions = []
+    if alerts is None:
+        alerts = []
+
+    async def fake_save(order) -> None:
+        saved[order.id] = order.model_copy()
+
+    async def fake_load():
+        return [o.model_copy() for o in open_orders]
+
+    async def fake_record(order, result, settings) -> None:
+        recorded.append((order.id, result.status, result.contracts_filled))
+
+    async def fake_for_opportunity(opportunity_id):
+        return [o.model_copy() for o in saved.values() if o.opportunity_id == opportunity_id]
+
+    async def fake_save_decision(entry) -> None:
+        decisions.append(entry)
+
+    async def fake_latest_decision(opportunity_id):
+        return None
+
+    async def fake_alert(entry, result, settings) -> None:
+        alerts.append((entry.ticker, result.status))
+
+    monkeypatch.setattr(order_manager, "save_working_order_to_db", fake_save)
+    monkeypatch.setattr(order_manager, "load_open_working_orders_from_db", fake_load)
+    monkeypatch.setattr(order_manager, "record_order_fill", fake_record)
+    monkeypatch.setattr(order_manager, "load_working_orders_for_opportunity_from_db", fake_for_opportunity)
+    monkeypatch.setattr(order_manager, "save_decision_to_db", fake_save_decision)
+    monkeypatch.setattr(order_manager, "load_latest_decision_from_db", fake_latest_decision)
+    monkeypatch.setattr(order_manager, "send_order_alert", fake_alert)
+    monkeypatch.setattr(execution, "get_market_stream", lambda: None)
+    return saved, recorded
+
+
+def _order(**kwargs):
+    return new_working_order(
+        opportunity_id="opp_1",
+        ticker="KXA-1",
+        side="yes",
+        contracts=10,
+        initial_price_cents=95,
+        config=SETTINGS,
+        **kwargs,
+    )
+
+
+def test_submit_returns_before_fill_and_books_result(monkeypatch) -> None:
+    saved, recorded = _fake_db(monkeypatch)
+    client = _FakeClient()
+    manager = order_manager.OrderManager(SETTINGS)
+
+    async def run() -> None:
+        await manager.start(client)
+        lock = get_portfolio_lock()
+        order = _order(reserved_cash=9.5)
+        lock.reserve(order.id, order.reserved_cash)
+        handle = await manager.submit(order)
+        assert not handle.done()
+
+        while not client.placed:
+            await asyncio.sleep(0.01)
+        assert saved[handle.id].order_id == "ord_1"
+        assert lock.reserved_cash == 9.5
+        # Once a synced balance already excludes the resting order, stop holding its cash.
+        lock.balance_synced(datetime.now(timezone.utc))
+        assert lock.reserved_cash == 0.0
+        client.fill("ord_1")
+
+        result = await asyncio.wait_for(handle.result(), timeout=2)
+        assert result.status == "filled" and result.contracts_filled == 10
+        await asyncio.sleep(0)
+        assert lock.reserved_cash == 0.0
+        assert len(manager) == 0
+        await manager.close()
+
+    asyncio.run(run())
+    assert recorded == [(next(iter(saved)), "filled", 10)]
+    assert next(iter(saved.values())).status == "filled"
+
+
+def test_shutdown_leaves_order_working_and_restart_resumes(monkeypatch) -> None:
+    saved, recorded = _fake_db(monkeypatch)
+    client = _FakeClient()
+
+    async def first_process() -> str:
+        manager = order_manager.OrderManager(SETTINGS)
+        await manager.start(client)
+        handle = await manager.submit(_order(reserved_cash=9.5))
+        while not client.placed:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        await manager.close()
+        return handle.id
+
+    order_id = asyncio.run(first_process())
+    assert saved[order_id].status == "working"
+    assert recorded == []
+
+    _fake_db(monkeypatch, open_orders=[saved[order_id]])
+
+    async def second_process() -> None:
+        manager = order_manager.OrderManager(SETTINGS)
+        await manager.start(client)
+        assert get_portfolio_lock().reserved_cash == 9.5
+        handle = manager.get(order_id)
+        client.fill("ord_1")
+        result = await asyncio.wait_for(handle.result(), timeout=2)
+        assert result.order_id == "ord_1"
+        await manager.close()
+
+    asyncio.run(second_process())
+    assert client.placed == ["ord_1"]  # resumed, not placed again
+
+
+def test_resume_adopts_order_placed_before_checkpoint(monkeypatch) -> None:
+    client = _FakeClient()
+    lost = _order()
+    asyncio.run(client.place_order("KXA-1", "yes", "buy", 10, yes_price=95, client_order_id=lost.client_order_id))
+    _fake_db(monkeypatch, open_orders=[lost])
+
+    async def run() -> None:
+        manager = order_manager.OrderManager(SETTINGS)
+        await manager.start(client)
+        client.fill("ord_1")
+        result = await asyncio.wait_for(manager.get(lost.id).result(), timeout=2)
+        assert result.status == "filled"
+        await manager.close()
+
+    asyncio.run(run())
+    assert client.placed == ["ord_1"]
+
+
+def test_decision_is_settled_after_last_child_order(monkeypatch) -> None:
+    decisions: list[DecisionEntry] = []
+    alerts: list = []
+    _fake_db(monkeypatch, decisions=decisions, alerts=alerts)
+    client = _FakeClient()
+    manager = order_manager.OrderManager(SETTINGS)
+    pending = DecisionEntry(
+        opportunity_id="opp_1",
+        ticker="KXA-1",
+        action="EXECUTE_BUY_YES",
+        confidence=0.9,
+        reasoning="Resolved",
+        execution_status="pending",
+    )
+
+    async def run() -> None:
+        await manager.start(client)
+        first = await manager.submit(_order(), decision=pending)
+        second = await manager.submit(_order(), decision=pending)
+        while len(client.placed) < 2:
+            await asyncio.sleep(0.01)
+
+        client.fill("ord_1")
+        await asyncio.wait_for(first.result(), timeout=2)
+        await asyncio.sleep(0.05)
+        assert decisions == []  # the second child is still working
+
+        client.fill("ord_2")
+        await asyncio.wait_for(second.result(), timeout=2)
+        while not decisions:
+            await asyncio.sleep(0.01)
+        await manager.close()
+
+    asyncio.run(run())
+    assert len(decisions) == 1
+    settled = decisions[0]
+    assert settled.execution_status == "filled"
+    assert settled.contracts == 20
+    assert settled.order_id == "ord_1"
+    assert settled.price == 0.95
+    assert settled.reasoning == "Resolved"
+    assert alerts == [("KXA-1", "filled")]
+
+
+def test_decision_is_settled_when_booking_fails(monkeypatch) -> None:
+    decisions: list[DecisionEntry] = []
+    alerts: list = []
+    _fake_db(monkeypatch, decisions=decisions, alerts=alerts)
+
+    async def failing_record(order, result, settings) -> None:
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(order_manager, "record_order_fill", failing_record)
+    client = _FakeClient()
+    manager = order_manager.OrderManager(SETTINGS)
+
+    async def run() -> None:
+        await manager.start(client)
+        handle = await manager.submit(_order(reserved_cash=9.5))
+        while not client.placed:
+            await asyncio.sleep(0.01)
+        client.fill("ord_1")
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(handle.result(), timeout=2)
+        while not decisions:
+            await asyncio.sleep(0.01)
+        assert manager._results == {} and manager._decisions == {}
+        await manager.close()
+
+    asyncio.run(run())
+    assert len(decisions) == 1
+    assert decisions[0].execution_status == "filled"
+    assert decisions[0].contracts == 10
+    assert alerts == [("KXA-1", "filled")]
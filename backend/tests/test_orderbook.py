@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Tests for the NumPy-backed order book."""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.services.kalshi.orderbook import BidLadder, OrderBook, parse_levels
+
+
+def test_asks_are_complement_of_opposite_bids() -> None:
+    book = OrderBook.from_levels("KXA-1", yes=[(90, 10), (92, 4)], no=[(3, 20), (5, 7)])
+
+    # Buying YES lifts NO bids: best NO bid 5 -> YES ask 95.
+    assert book.best_yes_bid == 92
+    assert book.best_yes_ask == 95
+    assert book.best_no_ask == 8
+    assert book.spread == 3
+    prices, sizes = book.asks("yes")
+    assert prices.tolist() == [95, 97]
+    assert sizes.tolist() == [7, 20]
+    assert [level.price for level in book.levels("no", "asks")] == [8, 10]
+
+
+def test_depth_queries() -> None:
+    book = OrderBook.from_levels("KXA-1", yes=[(90, 10), (92, 4), (91, 6)], no=[(3, 20), (5, 7)])
+
+    assert book.bid_depth("yes", 91) == 10
+    assert book.bid_depth("yes", 93) == 0
+    assert book.ask_depth("yes", 95) == 7
+    assert book.ask_depth("yes", 97) == 27
+    assert book.ask_depth("yes", 94) == 0
+    assert book.yes.size_at(91) == 6
+    assert book.yes.size_at(89) == 0
+
+
+def test_deltas_match_dict_reference() -> None:
+    rng = random.Random(7)
+    ladder = BidLadder(capacity=2)
+    reference: dict[int, int] = {}
+    for _ in range(2000):
+        price = rng.randint(1, 99)
+        delta = rng.randint(-30, 30)
+        ladder.apply_delta(price, delta)
+        remaining = reference.get(price, 0) + delta
+        if remaining > 0:
+            reference[price] = remaining
+        else:
+            reference.pop(price, None)
+
+        assert ladder.prices.tolist() == sorted(reference)
+        assert ladder.sizes.tolist() == [reference[p] for p in sorted(reference)]
+        assert ladder.best == max(reference, default=None)
+        assert ladder.depth_at_or_above(50) == sum(s for p, s in reference.items() if p >= 50)
+
+
+def test_parse_levels_accepts_dollar_strings() -> None:
+    levels = parse_levels([["0.9500", "12.00"], ["0.9600", "0"], [93, 4]])
+    assert levels == [(95, 12), (93, 4)]
+    assert OrderBook.from_levels("KXA-1", yes=levels, no=[]).best_yes_bid == 95
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Tests for concurrent opportunity processing in the pipeline cycle."""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum import pipeline
+from coliseum.agents.trader.portfolio_lock import PortfolioLock
+from coliseum.config import PipelineConfig, Settings
+from coliseum.domain.opportunity import OpportunitySignal
+
+
+def _opportunity(n: int) -> OpportunitySignal:
+    now = datetime.now(timezone.utc)
+    return OpportunitySignal(
+        id=f"opp_{n}",
+        event_ticker=f"KXTEST-{n}",
+        market_ticker=f"KXTEST-{n}-T1",
+        market_title="Test",
+        yes_price=0.95,
+        no_price=0.05,
+        close_time=now,
+        rationale="",
+        discovered_at=now,
+    )
+
+
+def test_opportunities_run_concurrently_up_to_worker_count(monkeypatch) -> None:
+    active = 0
+    peak = 0
+
+    async def fake_analyst(opportunity_id: str, settings: Settings):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        # Later opportunities finish first so output order must be restored.
+        await asyncio.sleep(0.05 / int(opportunity_id.split("_")[1]))
+        active -= 1
+        return SimpleNamespace(status="recommended")
+
+    async def fake_trader(opportunity_id: str, settings: Settings, shutdown_event=None):
+        return SimpleNamespace(
+            decision=SimpleNamespace(action="REJECT"),
+            execution_status="skipped",
+        )
+
+    monkeypatch.setattr(pipeline, "run_analyst", fake_analyst)
+    monkeypatch.setattr(pipeline, "run_trader", fake_trader)
+
+    settings = Settings(pipeline=PipelineConfig(opportunity_workers=2))
+    metrics = pipeline.CycleMetrics()
+    errors: list[str] = []
+    opportunities = [_opportunity(n) for n in range(1, 6)]
+
+    analyst_summaries, trader_summaries = asyncio.run(
+        pipeline._process_opportunities(
+            opportunities,
+            settings=settings,
+            shutdown_event=None,
+            metrics=metrics,
+            errors=errors,
+        )
+    )
+
+    assert peak == 2
+    assert errors == []
+    assert [line.split(":")[0] for line in analyst_summaries] == [o.market_ticker for o in opportunities]
+    assert len(trader_summaries) == 5
+    timings = metrics.opportunity_timings["KXTEST-5-T1"]
+    assert set(timings) == {"queue_wait", "analyst", "trader"}
+    assert timings["queue_wait"] > 0
+    assert metrics.stage_timings()["opportunities"] == metrics.opportunity_timings
+
+
+def test_shutdown_skips_queued_opportunities(monkeypatch) -> None:
+    shutdown = asyncio.Event()
+    started: list[str] = []
+
+    async def fake_analyst(opportunity_id: str, settings: Settings):
+        started.append(opportunity_id)
+        shutdown.set()
+        return SimpleNamespace(status="recommended")
+
+    monkeypatch.setattr(pipeline, "run_analyst", fake_analyst)
+
+    settings = Settings(pipeline=PipelineConfig(opportunity_workers=1))
+    analyst_summaries, trader_summaries = asyncio.run(
+        pipeline._process_opportunities(
+            [_opportunity(n) for n in range(1, 4)],
+            settings=settings,
+            shutdown_event=shutdown,
+            metrics=pipeline.CycleMetrics(),
+            errors=[],
+        )
+    )
+
+    assert started == ["opp_1"]
+    assert len(analyst_summaries) == 1
+    assert trader_summaries == []
+
+
+def test_portfolio_lock_reservations_reduce_available_cash() -> None:
+    async def run() -> None:
+        lock = PortfolioLock()
+        async with lock.hold("sizing"):
+            assert lock.available_cash(10.0) == 10.0
+            lock.reserve("wo_1", 7.6)
+        async with lock.hold("sizing"):
+            assert round(lock.available_cash(10.0), 2) == 2.4
+        lock.release("wo_1")
+        assert lock.available_cash(10.0) == 10.0
+
+    asyncio.run(run())
+
+
+def test_reservation_stops_counting_once_synced_balance_covers_it() -> None:
+    async def run() -> None:
+        lock = PortfolioLock()
+        placed_at = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+        lock.reserve("wo_1", 7.6)
+        lock.reserve("wo_2", 1.0)
+        lock.placed("wo_1", placed_at)
+
+        # A balance fetched before the order rested still includes its collateral.
+        lock.balance_synced(placed_at - timedelta(seconds=1))
+        assert round(lock.available_cash(10.0), 2) == 1.4
+
+        lock.balance_synced(placed_at + timedelta(seconds=1))
+        assert round(lock.available_cash(10.0), 2) == 9.0
+        lock.release("wo_1")
+        assert round(lock.available_cash(10.0), 2) == 9.0
+
+    asyncio.run(run())
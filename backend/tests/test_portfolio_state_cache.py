@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Tests for the process-local portfolio summary cache."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.domain.portfolio import PortfolioState, PortfolioStats, Position
+from coliseum.services.supabase.repositories import portfolio
+
+
+def _state(cash: float, *tickers: str) -> PortfolioState:
+    return PortfolioState(
+        portfolio=PortfolioStats(cash_balance=cash, positions_value=0.0, total_value=cash),
+        open_positions=[
+            Position(
+                id=f"pos_{t}",
+                market_ticker=t,
+                side="YES",
+                contracts=1,
+                average_entry=0.95,
+                current_price=0.95,
+            )
+            for t in tickers
+        ],
+    )
+
+
+def test_reads_are_served_from_memory_until_stale(monkeypatch) -> None:
+    db_reads: list[int] = []
+
+    async def fake_db_load() -> PortfolioState:
+        db_reads.append(1)
+        return _state(100.0, "KXA")
+
+    cache = portfolio.PortfolioStateCache(max_age_seconds=60)
+    monkeypatch.setattr(portfolio, "_portfolio_cache", cache)
+    monkeypatch.setattr(portfolio, "_load_portfolio_summary_from_db", fake_db_load)
+
+    async def run() -> None:
+        first = await portfolio.load_portfolio_summary()
+        first.open_positions.clear()  # callers get copies
+        second = await portfolio.load_portfolio_summary()
+        assert [p.market_ticker for p in second.open_positions] == ["KXA"]
+        assert len(db_reads) == 1
+        await portfolio.load_portfolio_summary(max_age_seconds=0)
+        assert len(db_reads) == 2
+
+    asyncio.run(run())
+    assert cache.hits == 1
+
+
+def test_write_through_and_trade_patch() -> None:
+    cache = portfolio.PortfolioStateCache(max_age_seconds=60)
+    cache.write_through(_state(100.0, "KXA"))
+
+    new_position = _state(0.0, "KXB").open_positions[0]
+    cache.apply_trade(
+        new_position,
+        PortfolioStats(cash_balance=99.05, positions_value=1.9, total_value=100.95),
+    )
+    cached = cache.get()
+    assert cached.portfolio.cash_balance == 99.05
+    assert [p.market_ticker for p in cached.open_positions] == ["KXA", "KXB"]
+
+
+def test_db_read_does_not_clobber_newer_write() -> None:
+    cache = portfolio.PortfolioStateCache(max_age_seconds=60)
+    version = cache.version
+    cache.write_through(_state(50.0))
+    cache.fill(_state(100.0), version)  # read started before the write
+    assert cache.get().portfolio.cash_balance == 50.0
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for the fingerprint-keyed agent response cache."""
+
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pydantic import BaseModel
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage, ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from coliseum.agents import response_cache
+from coliseum.config import LlmConfig, Settings
+
+
+class _Verdict(BaseModel):
+    verdict: str
+
+
+def _counting_agent(system_prompt: str = "Judge the market.") -> tuple[Agent[None, _Verdict], list[int]]:
+    calls: list[int] = []
+
+    def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        calls.append(1)
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {"verdict": "PROCEED"})])
+
+    return Agent(FunctionModel(respond), system_prompt=system_prompt, output_type=_Verdict), calls
+
+
+def _fake_store(monkeypatch) -> dict[str, dict]:
+    store: dict[str, dict] = {}
+
+    async def fake_load(key: str, now: datetime):
+        row = store.get(key)
+        if row is None or row["expires_at"] <= now:
+            return None
+        return row["output"]
+
+    async def fake_save(key, agent, model, output, created_at, expires_at):
+        store[key] = {"agent": agent, "output": output, "expires_at": expires_at}
+
+    monkeypatch.setattr(response_cache, "load_llm_response_from_db", fake_load)
+    monkeypatch.setattr(response_cache, "save_llm_response_to_db", fake_save)
+    return store
+
+
+def _settings(**ttls: int) -> Settings:
+    return Settings(llm=LlmConfig(response_cache_ttl_seconds=ttls))
+
+
+def test_identical_prompt_is_served_from_cache(monkeypatch) -> None:
+    store = _fake_store(monkeypatch)
+    agent, calls = _counting_agent()
+    settings = _settings(recommender=600)
+
+    async def run() -> None:
+        first = await response_cache.run_cached(agent, "opp_1", name="recommender", settings=settings)
+        second = await response_cache.run_cached(agent, "opp_1", name="recommender", settings=settings)
+        assert first == second == _Verdict(verdict="PROCEED")
+        assert len(calls) == 1
+
+        await response_cache.run_cached(agent, "opp_2", name="recommender", settings=settings)
+        assert len(calls) == 2
+
+    asyncio.run(run())
+    assert [row["agent"] for row in store.values()] == ["recommender", "recommender"]
+
+
+def test_fingerprint_covers_system_prompt_and_tools() -> None:
+    async def run() -> None:
+        base, _ = _counting_agent()
+        other_prompt, _ = _counting_agent("Judge the market strictly.")
+        with_tool, _ = _counting_agent()
+
+        @with_tool.tool_plain
+        def lookup(query: str) -> str:
+            """Look something up."""
+            return query
+
+        key = await response_cache.response_fingerprint(base, "opp_1")
+        assert key == await response_cache.response_fingerprint(_counting_agent()[0], "opp_1")
+        assert key != await response_cache.response_fingerprint(other_prompt, "opp_1")
+        assert key != await response_cache.response_fingerprint(with_tool, "opp_1")
+
+    asyncio.run(run())
+
+
+def test_uncached_agents_and_db_errors_fall_through(monkeypatch) -> None:
+    async def broken(*args, **kwargs):
+        raise ConnectionError("db down")
+
+    monkeypatch.setattr(response_cache, "load_llm_response_from_db", broken)
+    monkeypatch.setattr(response_cache, "save_llm_response_to_db", broken)
+    agent, calls = _counting_agent()
+
+    async def run() -> None:
+        await response_cache.run_cached(agent, "opp_1", name="scribe", settings=_settings(scribe=600))
+        await response_cache.run_cached(agent, "opp_1", name="scribe", settings=_settings(scribe=600))
+        await response_cache.run_cached(agent, "opp_1", name="trader", settings=_settings(scribe=600))
+
+    asyncio.run(run())
+    assert len(calls) == 3
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Tests for the seen-ticker index and its Bloom filter snapshot."""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.services.supabase.bloom import BloomFilter
+from coliseum.services.supabase.repositories import seen_tickers
+
+T0 = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def _fake_table(monkeypatch, table: dict[str, datetime]) -> list[datetime]:
+    queried_since: list[datetime] = []
+
+    async def fake_load(since: datetime):
+        queried_since.append(since)
+        return [(ticker, seen_at) for ticker, seen_at in table.items() if seen_at >= since]
+
+    monkeypatch.setattr(seen_tickers, "load_seen_tickers_since_from_db", fake_load)
+    return queried_since
+
+
+def test_bloom_filter_round_trips_snapshot(tmp_path) -> None:
+    bloom = BloomFilter.from_items([f"KX-{i}" for i in range(500)], capacity=1000)
+    path = tmp_path / "seen.bloom"
+    bloom.dump(path, {"watermark": "x"})
+
+    loaded, meta = BloomFilter.load(path)
+    assert meta == {"watermark": "x"}
+    assert all(f"KX-{i}" in loaded for i in range(500))
+    false_positives = sum(f"OTHER-{i}" in loaded for i in range(10_000))
+    assert false_positives < 50
+
+
+def test_index_loads_incrementally_and_expires(monkeypatch, tmp_path) -> None:
+    table = {"KXOLD-1": T0 - timedelta(days=20), "KXA-1": T0, "KXB-1": T0 + timedelta(hours=1)}
+    queried_since = _fake_table(monkeypatch, table)
+    index = seen_tickers.SeenTickerIndex(tmp_path / "seen.bloom", ttl=timedelta(days=14))
+
+    async def run() -> None:
+        await index.refresh(now=T0 + timedelta(hours=2))
+        assert "KXA-1" in index and "KXB-1" in index
+        assert "KXOLD-1" not in index
+
+        table["KXC-1"] = T0 + timedelta(hours=3)
+        await index.refresh(now=T0 + timedelta(hours=4))
+        assert "KXC-1" in index
+
+        # KXA-1 ages out of the window; nothing newer was written.
+        await index.refresh(now=T0 + timedelta(days=14, minutes=30))
+        assert "KXA-1" not in index
+        assert "KXC-1" in index
+
+    asyncio.run(run())
+    # Full window once, then only rows past the watermark (minus the overlap).
+    assert queried_since[0] == T0 + timedelta(hours=2) - timedelta(days=14)
+    assert queried_since[1] == T0 + timedelta(hours=1) - seen_tickers._WATERMARK_OVERLAP
+
+
+def test_cold_start_uses_snapshot(monkeypatch, tmp_path) -> None:
+    table = {"KXA-1": T0, "KXB-1": T0 + timedelta(hours=1)}
+    _fake_table(monkeypatch, table)
+    path = tmp_path / "seen.bloom"
+
+    asyncio.run(seen_tickers.SeenTickerIndex(path, ttl=timedelta(days=14)).refresh(now=T0 + timedelta(hours=2)))
+
+    table["KXC-1"] = T0 + timedelta(hours=5)
+    queried_since = _fake_table(monkeypatch, table)
+    cold = seen_tickers.SeenTickerIndex(path, ttl=timedelta(days=14))
+    asyncio.run(cold.refresh(now=T0 + timedelta(hours=6)))
+
+    assert queried_since == [T0 + timedelta(hours=1) - seen_tickers._WATERMARK_OVERLAP]
+    assert "KXA-1" in cold and "KXB-1" in cold and "KXC-1" in cold
+    assert "KXZ-9" not in cold
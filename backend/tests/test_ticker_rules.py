@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Tests for the compiled ticker rule engine."""
+
+import csv
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.agents.markets_context.seed_data import ALIASES, MARKET_TYPES
+from coliseum.agents.scout.filters import PRICE_GATED_EVENT_PREFIXES, SAFE_EVENT_PREFIXES
+from coliseum.agents.ticker_rules import TickerRuleEngine, TickerRuleSource
+
+MARKETS_CSV = Path(__file__).parent.parent / "monitoring" / "markets.csv"
+
+
+def _linear_category_key(event_ticker: str) -> str | None:
+    """The original substring scan the automaton replaces."""
+    event = event_ticker.upper()
+    for key in MARKET_TYPES:
+        if key in event:
+            return key
+    for alias, canonical in ALIASES.items():
+        if alias in event:
+            return canonical
+    if "MENTION" in event and "BERNIE" in event:
+        return "BERNIEMENTION"
+    if "OUT" in event and any(x in event for x in ("LEADER", "PRES")):
+        return "KHAMENEI"
+    if "MLB" in event and "GAME" in event:
+        return "MLBSTGAME"
+    if "HOCKEY" in event and "OLYMPIC" in event:
+        return "WOHOCKEY"
+    return None
+
+
+def _linear_passes(event_ticker: str, price: int) -> bool:
+    prefix = event_ticker.partition("-")[0]
+    if prefix in SAFE_EVENT_PREFIXES:
+        return True
+    gate = PRICE_GATED_EVENT_PREFIXES.get(prefix)
+    return gate is not None and price >= gate
+
+
+def _engine() -> TickerRuleEngine:
+    return TickerRuleEngine(SAFE_EVENT_PREFIXES, PRICE_GATED_EVENT_PREFIXES)
+
+
+def test_matches_linear_scan_on_recorded_tickers() -> None:
+    with MARKETS_CSV.open(newline="") as f:
+        tickers = sorted({row["event_ticker"] for row in csv.DictReader(f)})
+    tickers += ["KXBERNIEMENTION-X", "KXLEADEROUT-26", "KXMLBGAME-1", "KXOLYMPICHOCKEY-W"]
+
+    engine = _engine()
+    for ticker in tickers:
+        classified = engine.classify(ticker)
+        assert classified.category_key == _linear_category_key(ticker), ticker
+        for price in (93, 94, 95, 96):
+            assert classified.passes(price) == _linear_passes(ticker, price), (ticker, price)
+
+
+def test_classify_many_preserves_order() -> None:
+    engine = _engine()
+    results = engine.classify_many(["KXWTIW-26APR10", "KXNOPE-1", "KXWTIW-26APR10"])
+    assert [r.gate_price for r in results] == [94, None, 94]
+    assert results[0].category_key == "WTIW"
+    assert not results[1].passes(99)
+
+
+def test_rules_hot_reload_from_config(tmp_path: Path) -> None:
+    config = tmp_path / "config.yaml"
+    config.write_text("scout:\n  min_price: 92\n")
+    source = TickerRuleSource(config, check_interval_seconds=0)
+    assert source.get().classify("KXWTIW-1").gate_price == 94
+
+    config.write_text("scout_filters:\n  price_gated_event_prefixes: {KXWTIW: 96, KXNEW: 93}\n")
+    stat = config.stat()
+    os.utime(config, (stat.st_atime, stat.st_mtime + 5))
+    engine = source.get()
+    assert engine.classify("KXWTIW-1").gate_price == 96
+    assert engine.classify("KXNEW-1").passes(93)
+    # Keys not overridden keep their defaults.
+    assert engine.classify("KXTSAW-1").safe
+
+    config.write_text("scout_filters: [not, a, mapping\n")
+    os.utime(config, (stat.st_atime, stat.st_mtime + 10))
+    assert source.get() is engine
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Tests for the event-driven working-order executor."""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coliseum.agents.trader import execution
+from coliseum.config import ExecutionConfig
+from coliseum.services.kalshi.models import Order
+
+
+class _FakeClient:
+    """Order endpoint stand-in whose order fills once ``fill()`` is called."""
+
+    def __init__(self, contracts: int):
+        self.contracts = contracts
+        self.filled = 0
+        self.status_polls = 0
+        self.amended: list[int] = []
+        self.cancelled = False
+
+    def fill(self, count: int) -> None:
+        self.filled = count
+
+    def _order(self) -> Order:
+        remaining = self.contracts - self.filled
+        if self.cancelled:
+            status = "canceled"
+        elif remaining == 0:
+            status = "executed"
+        else:
+            status = "resting"
+        return Order(
+            order_id="ord_1",
+            status=status,
+            fill_count=self.filled,
+            remaining_count=remaining,
+            maker_fill_cost=self.filled * 95,
+        )
+
+    async def place_order(self, **kwargs) -> Order:
+        return self._order()
+
+    async def get_order_status(self, order_id: str) -> Order:
+        self.status_polls += 1
+        return self._order()
+
+    async def amend_order(self, order_id: str, price: int) -> Order:
+        self.amended.append(price)
+        return self._order()
+
+    async def cancel_order(self, order_id: str) -> Order:
+        self.cancelled = True
+        return self._order()
+
+
+class _FakeStream:
+    streams_fills = True
+
+    def __init__(self) -> None:
+        self.events: dict[str, asyncio.Event] = {}
+
+    def watch_order(self, order_id: str) -> asyncio.Event:
+        return self.events.setdefault(order_id, asyncio.Event())
+
+    def unwatch_order(self, order_id: str) -> None:
+        self.events.pop(order_id, None)
+
+
+def _settings(**overrides) -> SimpleNamespace:
+    values = {
+        "reprice_interval_seconds": 60,
+        "status_poll_min_seconds": 0.01,
+        "status_poll_max_seconds": 30.0,
+        "max_reprice_attempts": 3,
+    }
+    values.update(overrides)
+    return SimpleNamespace(execution=ExecutionConfig(**values))
+
+
+def _execute(client: _FakeClient, settings: SimpleNamespace):
+    return execution.execute_working_order(
+        client=client,
+        ticker="KXA-1",
+        side="yes",
+        contracts=client.contracts,
+        initial_price_cents=95,
+        config=settings,
+    )
+
+
+def test_fill_event_returns_without_waiting_for_reprice(monkeypatch) -> None:
+    stream = _FakeStream()
+    monkeypatch.setattr(execution, "get_market_stream", lambda: stream)
+    client = _FakeClient(contracts=10)
+
+    async def run():
+        task = asyncio.create_task(_execute(client, _settings()))
+        await asyncio.sleep(0.2)  # quiet order: polls back off toward the 30s max
+        client.fill(10)
+        stream.events["ord_1"].set()
+        return await asyncio.wait_for(task, timeout=1)
+
+    result = asyncio.run(run())
+    assert result.status == "filled"
+    assert result.contracts_filled == 10
+    assert result.fill_price == 0.95
+    assert client.amended == []
+    assert stream.events == {}  # unwatched on exit
+
+
+def test_reprices_on_schedule_then_cancels(monkeypatch) -> None:
+    monkeypatch.setattr(execution, "get_market_stream", lambda: None)
+    client = _FakeClient(contracts=10)
+    settings = _settings(reprice_interval_seconds=0.05, status_poll_max_seconds=0.02, max_reprice_attempts=2)
+
+    result = asyncio.run(asyncio.wait_for(_execute(client, settings), timeout=2))
+    assert client.amended == [97, 99]
+    assert client.cancelled
+    assert result.status == "cancelled"
+    # Status is checked several times per reprice window, not once.
+    assert client.status_polls > 3 * 2
+
+
+def test_partial_fill_kept_at_reprice_deadline(monkeypatch) -> None:
+    monkeypatch.setattr(execution, "get_market_stream", lambda: None)
+    client = _FakeClient(contracts=10)
+    client.fill(4)
+    settings = _settings(reprice_interval_seconds=0.05)
+
+    result = asyncio.run(asyncio.wait_for(_execute(client, settings), timeout=2))
+    assert result.status == "partial"
+    assert result.contracts_filled == 4
+    assert client.amended == []
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Tests for the telemetry write-behind buffer and its spool."""
+
+import asyncio
+import sys
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.exc import IntegrityError
+
+from coliseum.services.supabase import write_behind
+from coliseum.services.supabase.write_behind import WriteBehindBuffer
+
+SNAPSHOT = {
+    "total_value": Decimal("400.00"),
+    "cash_balance": Decimal("250.00"),
+    "positions_value": Decimal("150.00"),
+    "open_positions": 3,
+    "realized_pnl": Decimal("12.50"),
+    "snapshot_at": datetime(2026, 4, 1, 12, 0, tzinfo=timezone.utc),
+}
+
+
+def test_rows_are_batched_per_table(monkeypatch, tmp_path) -> None:
+    inserts: list[list[tuple[str, int]]] = []
+
+    async def fake_insert(rows_by_table):
+        inserts.append(sorted((table, len(rows)) for table, rows in rows_by_table.items()))
+
+    monkeypatch.setattr(write_behind, "insert_batch", fake_insert)
+
+    async def run() -> None:
+        buffer = WriteBehindBuffer(tmp_path / "spool.jsonl", batch_size=100, flush_interval_seconds=60)
+        await buffer.start()
+        for i in range(3):
+            await buffer.submit("seen_tickers", {"ticker": f"KX-{i}"})
+        await buffer.submit("portfolio_snapshots", SNAPSHOT)
+        assert inserts == []
+        assert buffer.spool_path.exists()
+        await buffer.close()
+
+    asyncio.run(run())
+    # One transaction covering both tables.
+    assert inserts == [[("portfolio_snapshots", 1), ("seen_tickers", 3)]]
+    assert not (tmp_path / "spool.jsonl").exists()
+
+
+def test_failed_flush_is_replayed_from_spool(monkeypatch, tmp_path) -> None:
+    delivered: list[dict] = []
+    database_up = False
+
+    async def flaky_insert(rows_by_table):
+        if not database_up:
+            raise ConnectionError("postgres unavailable")
+        for rows in rows_by_table.values():
+            delivered.extend(rows)
+
+    monkeypatch.setattr(write_behind, "insert_batch", flaky_insert)
+    spool = tmp_path / "spool.jsonl"
+
+    async def first_process() -> None:
+        buffer = WriteBehindBuffer(spool, flush_interval_seconds=60)
+        await buffer.start()
+        await buffer.submit("portfolio_snapshots", SNAPSHOT)
+        await buffer.close()
+        assert buffer.failed_flushes == 1
+
+    async def second_process() -> None:
+        buffer = WriteBehindBuffer(spool, flush_interval_seconds=60)
+        await buffer.start()
+        assert len(buffer) == 1
+        await buffer.close()
+
+    asyncio.run(first_process())
+    assert spool.exists()
+    database_up = True
+    asyncio.run(second_process())
+    assert delivered == [SNAPSHOT]
+    assert not spool.exists()
+
+
+def test_submit_inserts_directly_when_not_started(monkeypatch, tmp_path) -> None:
+    inserts: list[str] = []
+
+    async def fake_insert(table, rows):
+        inserts.append(table)
+
+    monkeypatch.setattr(write_behind, "insert_rows", fake_insert)
+    buffer = WriteBehindBuffer(tmp_path / "spool.jsonl")
+    asyncio.run(buffer.submit("decisions", {"ticker": "KX"}))
+    assert inserts == ["decisions"]
+    assert not buffer.spool_path.exists()
+
+
+def test_rejected_rows_are_set_aside(monkeypatch, tmp_path) -> None:
+    delivered: list[str] = []
+
+    async def strict_insert(rows_by_table):
+        rows = [row for table_rows in rows_by_table.values() for row in table_rows]
+        if any(row["ticker"] == "BAD" for row in rows):
+            raise IntegrityError("INSERT", {}, Exception("violates check constraint"))
+        delivered.extend(row["ticker"] for row in rows)
+
+    monkeypatch.setattr(write_behind, "insert_batch", strict_insert)
+
+    async def run() -> None:
+        buffer = WriteBehindBuffer(tmp_path / "spool.jsonl", flush_interval_seconds=60)
+        await buffer.start()
+        for ticker in ("KX-1", "BAD", "KX-2"):
+            await buffer.submit("decisions", {"ticker": ticker})
+        assert await buffer.flush() == 2
+        assert len(buffer) == 0
+        assert buffer.rejected_rows == 1
+
+        # The bad row no longer blocks later flushes.
+        await buffer.submit("decisions", {"ticker": "KX-3"})
+        assert await buffer.flush() == 1
+        await buffer.close()
+        assert "BAD" in buffer.rejected_path.read_text()
+
+    asyncio.run(run())
+    assert delivered == ["KX-1", "KX-2", "KX-3"]
+    assert not (tmp_path / "spool.jsonl").exists()
+
+
+def test_spool_is_capped(monkeypatch, tmp_path) -> None:
+    async def down(rows_by_table):
+        raise ConnectionError("postgres unavailable")
+
+    monkeypatch.setattr(write_behind, "insert_batch", down)
+    spool = tmp_path / "spool.jsonl"
+
+    async def run() -> None:
+        buffer = WriteBehindBuffer(spool, batch_size=1000, flush_interval_seconds=60, max_spool_rows=1000)
+        await buffer.start()
+        for i in range(1500):
+            await buffer.submit("seen_tickers", {"ticker": f"KX-{i}"})
+        assert len(buffer) <= 1000
+        assert buffer.dropped_rows == 1500 - len(buffer)
+        await buffer.close()
+
+    asyncio.run(run())
+    lines = spool.read_text().splitlines()
+    assert len(lines) <= 1000
+    assert '"KX-1499"' in lines[-1]